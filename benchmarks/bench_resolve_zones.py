@@ -0,0 +1,43 @@
+import random
+import sys
+import time
+from array import array
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.application_logic.zoning import resolve_zone, resolve_zones
+from src.application_logic.zoning_configuration import W, H
+
+N_POINTS = 100_000
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+def main(n: int = N_POINTS, seed: int = 7):
+    rng = random.Random(seed)
+    xs = array("i", (rng.randrange(-10, W + 10) for _ in range(n)))
+    ys = array("i", (rng.randrange(-10, H + 10) for _ in range(n)))
+
+    looped, t_loop = _timed(lambda: [resolve_zone(x, y) for x, y in zip(xs, ys)])
+    (_ids, kinds, labels), t_batch = _timed(resolve_zones, xs, ys)
+    assert looped == list(zip(kinds, labels))
+
+    print(f"resolve_zone loop      : {t_loop * 1000:8.1f} ms ({n} points)")
+    print(f"resolve_zones (array)  : {t_batch * 1000:8.1f} ms  {t_loop / max(t_batch, 1e-9):6.2f}x")
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("resolve_zones (numpy)  :  skipped (numpy not installed)")
+        return
+
+    nx, ny = np.asarray(xs), np.asarray(ys)
+    (np_ids, np_kinds, _), t_np = _timed(resolve_zones, nx, ny)
+    assert np_kinds == kinds and np_ids.tolist() == _ids.tolist()
+    print(f"resolve_zones (numpy)  : {t_np * 1000:8.1f} ms  {t_loop / max(t_np, 1e-9):6.2f}x")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else N_POINTS)
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from collections.abc import Mapping
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import json, os, time
@@ -11,6 +12,14 @@ def _safe_write_json(path: Path, payload: dict) -> None:
         json.dump(payload, f, ensure_ascii=False, indent=2)
     os.replace(tmp, path)
 
+def _plain(obj):
+    #Shots in CourtFrame.data_points are store-backed Mappings, not dicts - copy them out for asdict / json
+    if isinstance(obj, Mapping):
+        return {k: _plain(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_plain(v) for v in obj]
+    return obj
+
 def safe_read_game(path: Path) -> dict:
     verdict = detect_game_file(path)
     if not verdict.get("ok"):
@@ -51,7 +60,8 @@ def build_save_from_court(court) -> GameSave:
         "names": {k: v.get() for k, v in court.team_names.items()},
         "rosters": {k: list(v) for k, v in court.rosters.items()},
     }
-    shots = list(court.data_points)
+    to_dicts = getattr(court.data_points, "to_dicts", None)
+    shots = to_dicts() if to_dicts else [_plain(p) for p in court.data_points]
     
     idx_by_id = {id(p): i for i, p in enumerate(court.data_points)}
     def sig(p):
@@ -62,7 +72,7 @@ def build_save_from_court(court) -> GameSave:
     actions_out = []
     for a in list(court.actions):
         if a.get("type") != "shot":
-            actions_out.append(a)
+            actions_out.append(_plain(a))
             continue 
 
         pdata = a.get("data") or {}
@@ -75,14 +85,14 @@ def build_save_from_court(court) -> GameSave:
                     break
         actions_out.append({
             "type": "shot", 
-            "data": pdata,
+            "data": _plain(pdata),
             "data_index": data_index, 
             "marker_meta": a.get("marker_meta") or None, 
         })
     
     history = {
         "actions": actions_out,
-        "redo_stack": list(court.redo_stack),
+        "redo_stack": _plain(list(court.redo_stack)),
     }
     return GameSave(
         schema=1,
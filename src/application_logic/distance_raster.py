@@ -0,0 +1,83 @@
+import math, sys, threading
+from array import array
+from pathlib import Path
+from typing import Iterable
+from src import config
+from src.application_logic import mask_cache
+from src.application_logic import zoning_configuration as ZC
+from src.application_logic.geometry import CourtCalibration
+
+DISTANCE_MAGIC = b"DVDR"
+DISTANCE_FILENAME = "court_distance.f32"
+
+def _calibration_key(cal: CourtCalibration, width: int, height: int) -> bytes:
+    return mask_cache.content_key(sys.byteorder, f"{width}x{height}", repr(cal))
+
+class DistanceRaster:
+    """Per-pixel distance to the hoop (float32 feet) plus the separable dx/dy offsets (float64 feet)."""
+    def __init__(self, cal: CourtCalibration, width: int, height: int, cache_dir=None):
+        self.width, self.height = width, height
+        self.from_cache = False
+
+        #pixels_to_feet is separable: x_ft only depends on ix and y_ft only on iy
+        self.dx_ft = array("d", (x - cal.hoop_x_ft for x in cal.x_to_feet_many(range(width))))
+        self.dy_ft = array("d", (y - cal.hoop_y_ft for y in cal.y_to_feet_many(range(height))))
+
+        key = _calibration_key(cal, width, height)
+        cache_file = None
+        if cache_dir is not None:
+            cache_file = Path(cache_dir) / DISTANCE_FILENAME
+            cached = mask_cache.open_cached(cache_file, DISTANCE_MAGIC, key, item_size=4)
+            if cached is not None and cached[1:] == (width, height):
+                self.r_ft = cached[0].cast("f")
+                self.from_cache = True
+                return
+
+        r_ft = array("f")
+        hypot = math.hypot
+        for dy in self.dy_ft:
+            r_ft.extend([hypot(dx, dy) for dx in self.dx_ft])
+        self.r_ft = r_ft
+
+        if cache_file is not None:
+            mask_cache.write_cached(cache_file, DISTANCE_MAGIC, key, width, height, r_ft.tobytes(), item_size=4)
+
+    def distance_at(self, ix: int, iy: int) -> float | None:
+        if not (0 <= ix < self.width and 0 <= iy < self.height):
+            return None
+        return self.r_ft[iy * self.width + ix]
+
+    def offsets_at(self, ix: int, iy: int) -> tuple[float, float, float] | None:
+        if not (0 <= ix < self.width and 0 <= iy < self.height):
+            return None
+        return self.r_ft[iy * self.width + ix], self.dx_ft[ix], self.dy_ft[iy]
+
+    def distances_at(self, xs: Iterable[int], ys: Iterable[int]) -> array:
+        w, h, r_ft = self.width, self.height, self.r_ft
+        nan = math.nan
+
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(xs, np.ndarray):
+            xs = np.asarray(xs, dtype=np.intp)
+            ys = np.asarray(ys, dtype=np.intp)
+            inside = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+            out = np.full(xs.shape, np.nan, dtype=np.float32)
+            out[inside] = np.frombuffer(r_ft, dtype=np.float32)[ys[inside] * w + xs[inside]]
+            return out
+
+        return array("f", [
+            r_ft[y * w + x] if (0 <= x < w and 0 <= y < h) else nan
+            for x, y in zip(xs, ys)
+        ])
+
+_lock = threading.Lock()
+_raster: DistanceRaster | None = None
+
+def get_distance_raster() -> DistanceRaster:
+    global _raster
+    if _raster is None:
+        with _lock:
+            if _raster is None:
+                mask = ZC.get_mask()
+                _raster = DistanceRaster(ZC.get_calibration(), mask.width, mask.height, cache_dir=config.TMP_DIR)
+    return _raster
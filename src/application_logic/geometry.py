@@ -0,0 +1,117 @@
+import math, sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterable
+
+def _numpy_for(xs):
+    #NumPy is optional - only used when the caller already hands us ndarrays
+    np = sys.modules.get("numpy")
+    return np if (np is not None and isinstance(xs, np.ndarray)) else None
+
+@dataclass(frozen=True)
+class CourtCalibration:
+    left_px: float
+    right_px: float
+    baseline_y_px: float
+    far_edge_y_px: float
+    hoop_cx_px: float
+    hoop_cy_px: float
+    width_ft: float
+    length_ft: float
+    hoop_x_ft: float
+    hoop_y_ft: float
+    used_defaults: bool = False
+
+    span_x_px: float = field(init=False)
+    span_y_px: float = field(init=False)
+    ppf_x: float = field(init=False)
+    ppf_y: float = field(init=False)
+    x_sign: int = field(init=False)
+    y_sign: int = field(init=False)
+
+    def __post_init__(self):
+        span_x = abs(self.right_px - self.left_px)
+        span_y = abs(self.far_edge_y_px - self.baseline_y_px)
+        if span_x <= 0 or span_y <= 0:
+            raise ValueError(
+                "Court bbox spans must be positive"
+                "Check COURT_LEFT/RIGHT_PX and BASELINE/FAR_EDGE_Y_PX"
+            )
+        set_ = object.__setattr__
+        set_(self, "span_x_px", span_x)
+        set_(self, "span_y_px", span_y)
+        set_(self, "ppf_x", span_x / self.width_ft)
+        set_(self, "ppf_y", span_y / self.length_ft)
+        set_(self, "x_sign", 1 if self.right_px >= self.left_px else -1)
+        set_(self, "y_sign", 1 if self.far_edge_y_px > self.baseline_y_px else -1)
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float]:
+        return (
+            min(self.left_px, self.right_px), min(self.baseline_y_px, self.far_edge_y_px),
+            max(self.left_px, self.right_px), max(self.baseline_y_px, self.far_edge_y_px),
+        )
+
+    #Scalar
+    def is_in_bbox(self, ix: float, iy: float) -> bool:
+        x0, y0, x1, y1 = self.bbox
+        return x0 <= ix <= x1 and y0 <= iy <= y1
+
+    def pixels_to_feet(self, ix: float, iy: float) -> tuple[float, float]:
+        x_ft = self.x_sign * (ix - self.left_px) / self.ppf_x
+        y_ft = self.y_sign * (iy - self.baseline_y_px) / self.ppf_y
+        return x_ft, y_ft
+
+    def distance_from_hoop(self, ix: float, iy: float) -> tuple[float, float, float]:
+        x_ft, y_ft = self.pixels_to_feet(ix, iy)
+        dx_ft = x_ft - self.hoop_x_ft
+        dy_ft = y_ft - self.hoop_y_ft
+        r_ft = (dx_ft**2 + dy_ft**2) ** 0.5
+        return r_ft, dx_ft, dy_ft
+
+    #Batch - array in, array out (NumPy in, NumPy out)
+    def x_to_feet_many(self, xs: Iterable[float]):
+        kx, x0 = self.x_sign / self.ppf_x, self.left_px
+        np = _numpy_for(xs)
+        if np is not None:
+            return (np.asarray(xs, dtype=np.float64) - x0) * kx
+        return array("d", [(x - x0) * kx for x in xs])
+
+    def y_to_feet_many(self, ys: Iterable[float]):
+        ky, y0 = self.y_sign / self.ppf_y, self.baseline_y_px
+        np = _numpy_for(ys)
+        if np is not None:
+            return (np.asarray(ys, dtype=np.float64) - y0) * ky
+        return array("d", [(y - y0) * ky for y in ys])
+
+    def pixels_to_feet_many(self, xs: Iterable[float], ys: Iterable[float]):
+        return self.x_to_feet_many(xs), self.y_to_feet_many(ys)
+
+    def in_bbox_many(self, xs: Iterable[float], ys: Iterable[float]):
+        x0, y0, x1, y1 = self.bbox
+        np = _numpy_for(xs)
+        if np is not None:
+            xs, ys = np.asarray(xs), np.asarray(ys)
+            return (xs >= x0) & (xs <= x1) & (ys >= y0) & (ys <= y1)
+        return array("b", [x0 <= x <= x1 and y0 <= y <= y1 for x, y in zip(xs, ys)])
+
+    def distances_many(self, xs: Iterable[float], ys: Iterable[float]):
+        x_ft, y_ft = self.pixels_to_feet_many(xs, ys)
+        np = _numpy_for(x_ft)
+        if np is not None:
+            dx, dy = x_ft - self.hoop_x_ft, y_ft - self.hoop_y_ft
+            return np.hypot(dx, dy), dx, dy
+        hx, hy = self.hoop_x_ft, self.hoop_y_ft
+        dx = array("d", [x - hx for x in x_ft])
+        dy = array("d", [y - hy for y in y_ft])
+        return array("d", map(math.hypot, dx, dy)), dx, dy
+
+    def filter_in_bbox(self, xs: Iterable[float], ys: Iterable[float]):
+        np = _numpy_for(xs)
+        if np is not None:
+            xs, ys = np.asarray(xs), np.asarray(ys)
+            keep = self.in_bbox_many(xs, ys)
+            return xs[keep], ys[keep]
+        xs, ys = list(xs), list(ys)
+        keep = self.in_bbox_many(xs, ys)
+        return [x for x, ok in zip(xs, keep) if ok], [y for y, ok in zip(ys, keep) if ok]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+import math, sys
+from array import array
+from typing import Iterable
+from PIL import Image
+from src import config
+
+#Per-bin colors only depend on that bin's own counts (attempt alpha saturates at a fixed count instead of the
+#current max), so a new or undone shot repaints exactly one pixel of each cached layer.
+METRICS = {
+    "fg": "FG%",
+    "attempts": "Attempts",
+    "ppa": "Pts/Att",
+}
+COLD = (40, 110, 255)
+HOT = (235, 45, 35)
+ATTEMPTS_RGB = (255, 150, 0)
+MAX_ALPHA = 170
+
+def hot_cold(t: float) -> tuple[int, int, int]:
+    t = min(1.0, max(0.0, t))
+    return tuple(round(c + (h - c) * t) for c, h in zip(COLD, HOT))
+
+class ShotHeatmap:
+    """Square-bin counts of attempts, makes and points over image coordinates, with cached RGBA layers (one pixel per bin)."""
+    def __init__(self, width: int, height: int, cell_px: int | None = None):
+        self.cell_px = max(1, int(cell_px or config.HEATMAP_CELL_PX))
+        self.width, self.height = width, height
+        self.nx = math.ceil(width / self.cell_px)
+        self.ny = math.ceil(height / self.cell_px)
+        n = self.nx * self.ny
+        self.attempts = array("i", bytes(4 * n))
+        self.makes = array("i", bytes(4 * n))
+        self.points = array("d", bytes(8 * n))
+        self._layers: dict[str, Image.Image] = {}
+
+    def bin_index(self, x: float, y: float) -> int | None:
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return None
+        return int(y // self.cell_px) * self.nx + int(x // self.cell_px)
+
+    def bin_box(self, index: int) -> tuple[int, int, int, int]:
+        bx, by = index % self.nx, index // self.nx
+        c = self.cell_px
+        return bx * c, by * c, min(self.width, (bx + 1) * c), min(self.height, (by + 1) * c)
+
+    def _update(self, x: float, y: float, made: bool, points: float, sign: int) -> int | None:
+        i = self.bin_index(x, y)
+        if i is None:
+            return None
+        self.attempts[i] += sign
+        self.makes[i] += sign if made else 0
+        self.points[i] += sign * points
+        self._patch(i)
+        return i
+
+    def add(self, x: float, y: float, made: bool, points: float = 0) -> int | None:
+        return self._update(x, y, made, points, 1)
+
+    def remove(self, x: float, y: float, made: bool, points: float = 0) -> int | None:
+        return self._update(x, y, made, points, -1)
+
+    def add_many(self, xs: Iterable[float], ys: Iterable[float], made: Iterable[bool], points: Iterable[float]) -> None:
+        """Bulk load (e.g. a whole saved game); cached layers are rebuilt once afterwards instead of patched per shot."""
+        n = self.nx * self.ny
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(xs, np.ndarray):
+            xs, ys = np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+            made = np.asarray(made, dtype=bool)
+            points = np.asarray(points, dtype=np.float64)
+            keep = (xs >= 0) & (xs < self.width) & (ys >= 0) & (ys < self.height)
+            idx = (ys[keep] // self.cell_px).astype(np.intp) * self.nx + (xs[keep] // self.cell_px).astype(np.intp)
+            att = np.bincount(idx, minlength=n)
+            mk = np.bincount(idx, weights=made[keep], minlength=n)
+            pts = np.bincount(idx, weights=points[keep], minlength=n)
+            for i in np.flatnonzero(att).tolist():
+                self.attempts[i] += int(att[i])
+                self.makes[i] += int(mk[i])
+                self.points[i] += float(pts[i])
+        else:
+            for x, y, m, p in zip(xs, ys, made, points):
+                i = self.bin_index(x, y)
+                if i is None:
+                    continue
+                self.attempts[i] += 1
+                self.makes[i] += 1 if m else 0
+                self.points[i] += p
+        self._layers.clear()
+
+    def clear(self) -> None:
+        n = self.nx * self.ny
+        self.attempts = array("i", bytes(4 * n))
+        self.makes = array("i", bytes(4 * n))
+        self.points = array("d", bytes(8 * n))
+        self._layers.clear()
+
+    def stats(self, index: int) -> tuple[int, float | None, float | None]:
+        a = self.attempts[index]
+        if a <= 0:
+            return 0, None, None
+        return a, self.makes[index] / a, self.points[index] / a
+
+    def color(self, metric: str, index: int) -> tuple[int, int, int, int]:
+        a, fg, ppa = self.stats(index)
+        if a <= 0:
+            return 0, 0, 0, 0
+        alpha = round(MAX_ALPHA * min(1.0, a / config.HEATMAP_FULL_ATTEMPTS))
+        if metric == "attempts":
+            return (*ATTEMPTS_RGB, alpha)
+        if metric == "ppa":
+            return (*hot_cold(ppa / 1.5), alpha) #1.5 pts/att or better is fully hot
+        return (*hot_cold(fg), alpha)
+
+    def layer(self, metric: str) -> Image.Image:
+        """nx x ny RGBA image for metric - scale it with NEAREST to overlay the court."""
+        img = self._layers.get(metric)
+        if img is None:
+            img = Image.new("RGBA", (self.nx, self.ny), (0, 0, 0, 0))
+            img.putdata([self.color(metric, i) for i in range(self.nx * self.ny)])
+            self._layers[metric] = img
+        return img
+
+    def _patch(self, index: int) -> None:
+        xy = (index % self.nx, index // self.nx)
+        for metric, img in self._layers.items():
+            img.putpixel(xy, self.color(metric, index))
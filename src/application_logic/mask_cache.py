@@ -0,0 +1,54 @@
+from __future__ import annotations
+import hashlib, mmap, os, struct
+from pathlib import Path
+
+#Compiled raster artifacts: fixed header followed by a raw width x height payload
+#   magic(4) | version(u16) | item_size(u16) | width(u32) | height(u32) | key(32, sha256)
+_HEADER = struct.Struct("<4sHHII32s")
+HEADER_SIZE = _HEADER.size
+CACHE_VERSION = 1
+
+def content_key(*parts: bytes | str) -> bytes:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8") if isinstance(part, str) else part)
+        h.update(b"\x00")
+    return h.digest()
+
+def file_key(path: str | Path, *extra: bytes | str) -> bytes:
+    return content_key(Path(path).read_bytes(), *extra)
+
+def open_cached(path: Path, magic: bytes, key: bytes, item_size: int = 1) -> tuple[memoryview, int, int] | None:
+    try:
+        with Path(path).open("rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mm) < HEADER_SIZE:
+        mm.close()
+        return None
+    got_magic, version, got_item, width, height, got_key = _HEADER.unpack_from(mm, 0)
+    expected = HEADER_SIZE + width * height * item_size
+    if (got_magic, version, got_item, got_key) != (magic, CACHE_VERSION, item_size, key) or len(mm) != expected:
+        mm.close()
+        return None
+    return memoryview(mm)[HEADER_SIZE:], width, height
+
+def write_cached(path: Path, magic: bytes, key: bytes, width: int, height: int, payload: bytes, item_size: int = 1) -> bool:
+    path = Path(path)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp.open("wb") as f:
+            f.write(_HEADER.pack(magic, CACHE_VERSION, item_size, width, height, key))
+            f.write(payload)
+        os.replace(tmp, path)
+        return True
+    except OSError:
+        #Another process may hold the old artifact mapped (Windows) - keep working from memory
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        return False
@@ -1,21 +1,161 @@
-from PIL import Image 
+import sys
+from array import array
+from pathlib import Path
+from typing import Iterable
+from PIL import Image, ImageChops
 from src.application_logic.court_mask_color_ledger import ZONE_COLORS, LINE_COLORS, PLAY_COLORS, NO_CLICK_COLORS
+from src.application_logic import mask_cache
+
+UNKNOWN_ZONE_ID = 0
+OUT_OF_BOUNDS_ID = 255
+OUT_OF_BOUNDS = ("OUT_OF_BOUNDS", "Out of Bounds")
+
+def _zone_kind(rgb: tuple[int, int, int]) -> str:
+    if rgb in LINE_COLORS: return "LINE"
+    if rgb in NO_CLICK_COLORS: return "NO_CLICK"
+    return "ZONE"
+
+#Zone id 0 is reserved for unmapped colors, ledger colors follow in ledger order (must stay under 256)
+ZONE_IDS: dict[tuple[int, int, int], int] = {rgb: i for i, rgb in enumerate(ZONE_COLORS, start=1)}
+ZONE_TABLE: list[tuple[str, str]] = [("UNKNOWN", "Unmapped color")] + [
+    (_zone_kind(rgb), name) for rgb, name in ZONE_COLORS.items()
+]
+
+LUT_BITS = 5 #32 levels per channel -> 32K entry table
+
+def build_color_lut(max_distance: float, bits: int = LUT_BITS) -> bytes:
+    levels = 1 << bits
+    step = 256 // levels
+    limit = max_distance * max_distance
+    palette = list(ZONE_IDS.items())
+
+    lut = bytearray(levels ** 3)
+    if max_distance <= 0:
+        return bytes(lut)
+
+    centers = [i * step + (step - 1) / 2 for i in range(levels)]
+    i = 0
+    for cr in centers:
+        for cg in centers:
+            for cb in centers:
+                best_id, best_d = UNKNOWN_ZONE_ID, limit
+                for (pr, pg, pb), zone_id in palette:
+                    d = (cr - pr) ** 2 + (cg - pg) ** 2 + (cb - pb) ** 2
+                    if d <= best_d:
+                        best_id, best_d = zone_id, d
+                lut[i] = best_id
+                i += 1
+    return bytes(lut)
+
+def lut_index(r: int, g: int, b: int, bits: int = LUT_BITS) -> int:
+    shift = 8 - bits
+    return ((r >> shift) << (2 * bits)) | ((g >> shift) << bits) | (b >> shift)
+
+def compile_zone_grid(img: Image.Image, max_color_distance: float = 0.0) -> bytes:
+    rgb = img.convert("RGB")
+    r, g, b = rgb.split()
+    present = {color for _, color in rgb.getcolors(rgb.width * rgb.height)}
+
+    grid = Image.new("L", rgb.size, UNKNOWN_ZONE_ID)
+    for color, zone_id in ZONE_IDS.items():
+        if color not in present:
+            continue
+        cr, cg, cb = color
+        hit = ImageChops.multiply(
+            ImageChops.multiply(
+                r.point(lambda v, c=cr: 255 if v == c else 0),
+                g.point(lambda v, c=cg: 255 if v == c else 0),
+            ),
+            b.point(lambda v, c=cb: 255 if v == c else 0),
+        )
+        grid.paste(zone_id, mask=hit)
+
+    out = grid.tobytes()
+    if max_color_distance <= 0 or present <= ZONE_IDS.keys():
+        return out
+
+    #Off-ledger pixels (anti-aliased edges, re-exports) classify through one LUT index each
+    lut = build_color_lut(max_color_distance)
+    out = bytearray(out)
+    px = rgb.tobytes()
+    pos = out.find(UNKNOWN_ZONE_ID)
+    while pos != -1:
+        o = pos * 3
+        out[pos] = lut[lut_index(px[o], px[o + 1], px[o + 2])]
+        pos = out.find(UNKNOWN_ZONE_ID, pos + 1)
+    return bytes(out)
+
+ZONE_GRID_MAGIC = b"DVZM"
+ZONE_GRID_FILENAME = "court_mask.zones"
+
+def _zone_grid_key(path: Path, max_color_distance: float) -> bytes:
+    #Ids follow ledger order, so a ledger edit invalidates the artifact just like a new PNG
+    return mask_cache.file_key(
+        path, repr(list(ZONE_COLORS.items())), f"lut={LUT_BITS}:{float(max_color_distance)}"
+    )
 
 class MaskManager: 
-    def __init__(self, path: str): 
-        with Image.open(path) as im:
-            self.img = im.convert("RGBA").copy()
-        self.px = self.img.load()
+    def __init__(self, path: str, cache_dir: str | Path | None = None, max_color_distance: float = 0.0): 
+        self.path = Path(path)
+        self.from_cache = False
+
+        key = cache_file = None
+        if cache_dir is not None:
+            key = _zone_grid_key(self.path, max_color_distance)
+            cache_file = Path(cache_dir) / ZONE_GRID_FILENAME
+            cached = mask_cache.open_cached(cache_file, ZONE_GRID_MAGIC, key)
+            if cached is not None:
+                self.grid, self.width, self.height = cached
+                self.from_cache = True
+                return
+
+        with Image.open(self.path) as im:
+            self.width, self.height = im.size
+            self.grid = compile_zone_grid(im, max_color_distance)
+
+        if cache_file is not None:
+            mask_cache.write_cached(cache_file, ZONE_GRID_MAGIC, key, self.width, self.height, self.grid)
+
+    def zone_id_at(self, ix: int, iy: int) -> int | None:
+        if not (0 <= ix < self.width and 0 <= iy < self.height):
+            return None
+        return self.grid[iy * self.width + ix]
+
+    def zone_ids_at(self, xs: Iterable[int], ys: Iterable[int]) -> array:
+        w, h, grid = self.width, self.height, self.grid
+
+        #NumPy is optional - only take the vectorized path when the caller already hands us ndarrays
+        np = sys.modules.get("numpy")
+        if np is not None and isinstance(xs, np.ndarray):
+            xs = np.asarray(xs, dtype=np.intp)
+            ys = np.asarray(ys, dtype=np.intp)
+            inside = (xs >= 0) & (xs < w) & (ys >= 0) & (ys < h)
+            out = np.full(xs.shape, OUT_OF_BOUNDS_ID, dtype=np.uint8)
+            out[inside] = np.frombuffer(grid, dtype=np.uint8)[ys[inside] * w + xs[inside]]
+            return out
+
+        return array("B", [
+            grid[y * w + x] if (0 <= x < w and 0 <= y < h) else OUT_OF_BOUNDS_ID
+            for x, y in zip(xs, ys)
+        ])
 
     def get_zone_at(self, ix: int, iy: int) -> tuple[str, str]: 
-        w, h = self.img.width, self.img.height
-        if not (0 <= ix < w and 0 <= iy < h):
-            return ("OUT_OF_BOUNDS", "Out of Bounds")
-    
-        r, g, b, _ = self.px[ix, iy]
-        rgb = (r, g, b)
-
-        if rgb in LINE_COLORS: return ("LINE", ZONE_COLORS[rgb])
-        if rgb in NO_CLICK_COLORS: return ("NO_CLICK", ZONE_COLORS[rgb])
-        if rgb in ZONE_COLORS: return ("ZONE", ZONE_COLORS[rgb])
-        return ("UNKNOWN", f"Unmapped color {rgb}")
\ No newline at end of file
+        if not (0 <= ix < self.width and 0 <= iy < self.height):
+            return OUT_OF_BOUNDS
+        return ZONE_TABLE[self.grid[iy * self.width + ix]]
+
+    def zone_coverage(self) -> dict[int, int]:
+        hist = Image.frombuffer("L", (self.width, self.height), bytes(self.grid), "raw", "L", 0, 1).histogram()
+        return {zone_id: hist[zone_id] for zone_id in range(len(ZONE_TABLE))}
+
+    def coverage_report(self) -> list[tuple[str, str, int, float]]:
+        total = max(1, self.width * self.height)
+        return [
+            (ZONE_TABLE[zone_id][0], ZONE_TABLE[zone_id][1], count, 100.0 * count / total)
+            for zone_id, count in self.zone_coverage().items()
+        ]
+
+if __name__ == "__main__":
+    from src.application_logic.zoning_configuration import get_mask
+    for kind, name, count, pct in get_mask().coverage_report():
+        print(f"{name:<28} {kind:<9} {count:>8} px {pct:6.2f}%")
@@ -0,0 +1,177 @@
+from __future__ import annotations
+from typing import Any, Iterable
+
+DEFAULT_CELL_PX = 24
+
+class ShotGrid:
+    """Uniform-grid spatial index over shots keyed on image coordinates (shot["x"], shot["y"] by default)."""
+    def __init__(self, cell_px: int = DEFAULT_CELL_PX, xy_keys: tuple[str, str] = ("x", "y")):
+        self.cell_px = max(1, int(cell_px))
+        self.xy_keys = xy_keys
+        self._cells: dict[tuple[int, int], list[tuple[float, float, Any]]] = {}
+        self._where: dict[int, tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._where)
+
+    def __iter__(self):
+        for bucket in self._cells.values():
+            for _, _, shot in bucket:
+                yield shot
+
+    def __contains__(self, shot) -> bool:
+        return id(shot) in self._where
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return int(x // self.cell_px), int(y // self.cell_px)
+
+    def _xy(self, shot) -> tuple[float, float] | None:
+        x, y = shot.get(self.xy_keys[0]), shot.get(self.xy_keys[1])
+        if x is None or y is None:
+            return None
+        return x, y
+
+    def insert(self, shot) -> bool:
+        xy = self._xy(shot)
+        if xy is None or id(shot) in self._where:
+            return False
+        cell = self._cell(*xy)
+        self._cells.setdefault(cell, []).append((xy[0], xy[1], shot))
+        self._where[id(shot)] = cell
+        return True
+
+    def remove(self, shot) -> bool:
+        cell = self._where.pop(id(shot), None)
+        if cell is None:
+            return False
+        bucket = self._cells.get(cell, [])
+        for i in range(len(bucket) - 1, -1, -1):
+            if bucket[i][2] is shot:
+                bucket.pop(i)
+                break
+        if not bucket:
+            self._cells.pop(cell, None)
+        return True
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._where.clear()
+
+    def rebuild(self, shots: Iterable) -> None:
+        self.clear()
+        for shot in shots:
+            self.insert(shot)
+
+    def _candidates(self, x0: float, y0: float, x1: float, y1: float):
+        cx0, cy0 = self._cell(x0, y0)
+        cx1, cy1 = self._cell(x1, y1)
+        if (cx1 - cx0 + 1) * (cy1 - cy0 + 1) > len(self._cells):
+            for bucket in self._cells.values():
+                yield from bucket
+            return
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                yield from self._cells.get((cx, cy), ())
+
+    def within(self, x: float, y: float, radius: float) -> list:
+        r2 = radius * radius
+        return [
+            s for sx, sy, s in self._candidates(x - radius, y - radius, x + radius, y + radius)
+            if (sx - x) ** 2 + (sy - y) ** 2 <= r2
+        ]
+
+    def nearest(self, x: float, y: float, radius: float):
+        best, best_d = None, radius * radius
+        for sx, sy, s in self._candidates(x - radius, y - radius, x + radius, y + radius):
+            d = (sx - x) ** 2 + (sy - y) ** 2
+            if d <= best_d:
+                best, best_d = s, d
+        return best
+
+    def within_feet(self, x: float, y: float, feet: float, calibration) -> list:
+        rx, ry = feet * calibration.ppf_x, feet * calibration.ppf_y
+        return [
+            s for sx, sy, s in self._candidates(x - rx, y - ry, x + rx, y + ry)
+            if ((sx - x) / rx) ** 2 + ((sy - y) / ry) ** 2 <= 1.0
+        ]
+
+    def in_rect(self, x0: float, y0: float, x1: float, y1: float) -> list:
+        x0, x1 = min(x0, x1), max(x0, x1)
+        y0, y1 = min(y0, y1), max(y0, y1)
+        return [s for sx, sy, s in self._candidates(x0, y0, x1, y1) if x0 <= sx <= x1 and y0 <= sy <= y1]
+
+    def in_polygon(self, points: list[tuple[float, float]]) -> list:
+        if len(points) < 3:
+            return []
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        return [
+            s for sx, sy, s in self._candidates(min(xs), min(ys), max(xs), max(ys))
+            if _point_in_polygon(sx, sy, points)
+        ]
+
+class PlayerShotIndex:
+    """Shots grouped by (team, player), in recording order, so one player's shots are found without a full scan."""
+    def __init__(self, shots: Iterable = ()):
+        self._by_player: dict[tuple[str, str], dict[int, Any]] = {}
+        self._keys: dict[int, tuple[str, str]] = {}
+        self.rebuild(shots)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, shot) -> bool:
+        return id(shot) in self._keys
+
+    def rebuild(self, shots: Iterable) -> None:
+        self._by_player.clear()
+        self._keys.clear()
+        for s in shots or ():
+            self.add(s)
+
+    def add(self, shot) -> bool:
+        if id(shot) in self._keys:
+            return False
+        key = (shot.get("team"), shot.get("player"))
+        self._by_player.setdefault(key, {})[id(shot)] = shot
+        self._keys[id(shot)] = key
+        return True
+
+    def remove(self, shot) -> bool:
+        key = self._keys.pop(id(shot), None)
+        if key is None:
+            return False
+        bucket = self._by_player[key]
+        del bucket[id(shot)]
+        if not bucket:
+            del self._by_player[key]
+        return True
+
+    def shots(self, team: str, player: str) -> list:
+        return list(self._by_player.get((team, player), {}).values())
+
+    def count(self, team: str, player: str) -> int:
+        return len(self._by_player.get((team, player), ()))
+
+    def rename(self, team: str, old: str, new: str) -> list:
+        """Move every (team, old) shot to new, setting each shot's "player"; returns the moved shots."""
+        moved = self._by_player.pop((team, old), {})
+        if not moved:
+            return []
+        bucket = self._by_player.setdefault((team, new), {})
+        for k, shot in moved.items():
+            shot["player"] = new
+            bucket[k] = shot
+            self._keys[k] = (team, new)
+        return list(moved.values())
+
+def _point_in_polygon(x: float, y: float, points: list[tuple[float, float]]) -> bool:
+    inside = False
+    j = len(points) - 1
+    for i in range(len(points)):
+        xi, yi = points[i]
+        xj, yj = points[j]
+        if (yi > y) != (yj > y) and x < (xj - xi) * (y - yi) / (yj - yi) + xi:
+            inside = not inside
+        j = i
+    return inside
@@ -0,0 +1,197 @@
+from __future__ import annotations
+from typing import Iterable
+from src.application_logic.zone_registry import get_registry
+from src.application_logic.shot_store import ShotStore
+
+def shot_points(p: dict) -> int:
+    if not p.get("made"):
+        return 0
+    z = get_registry().zone_for(p)
+    if p.get("shot_type") == "Free Throw" or p.get("ft_reason") or (z is not None and z.is_free_throw):
+        return 1
+    if z is not None and z.points == 3:
+        return 3
+    try:
+        if float(p.get("r_ft", 0)) >= 22.0:
+            return 3
+    except Exception:
+        pass
+    return 2
+
+def _zone_key(p: dict):
+    z = get_registry().zone_for(p)
+    if z is not None:
+        return z.name, z
+    return p.get("zone") or None, None
+
+class ShotTally:
+    """Running counters for one team, one player or the whole game - every update is O(1)."""
+    __slots__ = ("att", "made", "points", "made_ft", "made_n", "miss_ft", "miss_n", "zones")
+
+    def __init__(self):
+        self.att = self.made = self.points = 0
+        self.made_ft = self.miss_ft = 0.0
+        self.made_n = self.miss_n = 0
+        self.zones: dict[str, list] = {} #zone name -> [made, attempts, Zone | None]
+
+    @property
+    def missed(self) -> int:
+        return self.att - self.made
+
+    @property
+    def fg(self) -> float | None:
+        return self.made / self.att if self.att else None
+
+    @property
+    def avg_made_ft(self) -> float | None:
+        return self.made_ft / self.made_n if self.made_n else None
+
+    @property
+    def avg_missed_ft(self) -> float | None:
+        return self.miss_ft / self.miss_n if self.miss_n else None
+
+    def update(self, made: bool, points: int, r_ft, zone_key: str | None, zone, sign: int) -> None:
+        self.att += sign
+        self.points += sign * points
+        if made:
+            self.made += sign
+        if isinstance(r_ft, (int, float)):
+            if made:
+                self.made_n += sign
+                self.made_ft = self.made_ft + sign * r_ft if self.made_n else 0.0 #Reset so float drift can't linger
+            else:
+                self.miss_n += sign
+                self.miss_ft = self.miss_ft + sign * r_ft if self.miss_n else 0.0
+        if zone_key:
+            d = self.zones.setdefault(zone_key, [0, 0, zone])
+            d[0] += sign if made else 0
+            d[1] += sign
+            if d[1] <= 0:
+                del self.zones[zone_key]
+
+    def add_many(self, made: bool, points: int, zone_key: str | None, zone, n: int, r_n: int, r_sum: float) -> None:
+        """Add n identical shots at once, r_n of them with a distance summing to r_sum (columnar rebuild)."""
+        self.att += n
+        self.points += n * points
+        if made:
+            self.made += n
+            self.made_n += r_n
+            self.made_ft += r_sum
+        else:
+            self.miss_n += r_n
+            self.miss_ft += r_sum
+        if zone_key:
+            d = self.zones.setdefault(zone_key, [0, 0, zone])
+            d[0] += n if made else 0
+            d[1] += n
+
+    def merge(self, other: ShotTally) -> None:
+        self.att += other.att
+        self.made += other.made
+        self.points += other.points
+        self.made_ft += other.made_ft
+        self.made_n += other.made_n
+        self.miss_ft += other.miss_ft
+        self.miss_n += other.miss_n
+        for key, (m, a, z) in other.zones.items():
+            d = self.zones.setdefault(key, [0, 0, z])
+            d[0] += m
+            d[1] += a
+
+    def zone_strength(self) -> tuple[str | None, str | None]:
+        """(dominant, weakest) zone names by makes, then FG%, then attempts."""
+        items = [(key, m, a) for key, (m, a, _) in self.zones.items() if a > 0]
+        if not items:
+            return None, None
+        dom = max(items, key=lambda t: (t[1], t[1] / t[2], t[2], t[0]))[0]
+        weak = min(items, key=lambda t: (t[1], t[1] / t[2], -t[2], t[0]))[0]
+        return dom, weak
+
+_EMPTY = ShotTally()
+
+class StatsAccumulator:
+    """Game stats by team, by (team, player) and by zone, kept current shot by shot instead of rescanned.
+
+    Callers must route every change to a tracked shot through add / remove / reassign / rename_player so the
+    counters always subtract exactly what they added.
+    """
+    def __init__(self, points: Iterable[dict] = ()):
+        self.rebuild(points)
+
+    def rebuild(self, points: Iterable[dict]) -> None:
+        self.teams: dict[str, ShotTally] = {}
+        self.players: dict[tuple[str, str], ShotTally] = {}
+        self.total = ShotTally()
+        if isinstance(points, ShotStore):
+            self._rebuild_columns(points)
+            return
+        for p in points or ():
+            self._apply(p, 1)
+
+    def _rebuild_columns(self, store: ShotStore) -> None:
+        #Group the columns by everything that decides points and zone, then score each group once
+        cols = [store.column(k) for k in ("team", "player", "made", "zone", "zone_id", "shot_type", "ft_reason", "r_ft")]
+        groups: dict[tuple, list] = {}
+        for team, player, made, zone, zone_id, shot_type, ft_reason, r_ft in zip(*cols):
+            if team is None:
+                continue
+            try:
+                far = float(r_ft) >= 22.0
+            except Exception:
+                far = False
+            key = (team, player, bool(made), zone, zone_id, shot_type, ft_reason, far)
+            g = groups.get(key)
+            if g is None:
+                g = groups[key] = [0, 0, 0.0]
+            g[0] += 1
+            if isinstance(r_ft, (int, float)):
+                g[1] += 1
+                g[2] += r_ft
+        for (team, player, made, zone, zone_id, shot_type, ft_reason, far), (n, r_n, r_sum) in groups.items():
+            p = {"made": made, "zone": zone, "zone_id": zone_id, "shot_type": shot_type, "ft_reason": ft_reason,
+                 "r_ft": 22.0 if far else 0.0}
+            args = (made, shot_points(p), *_zone_key(p), n, r_n, r_sum)
+            self.total.add_many(*args)
+            self.teams.setdefault(team, ShotTally()).add_many(*args)
+            self.players.setdefault((team, player), ShotTally()).add_many(*args)
+
+    def _apply(self, p: dict, sign: int) -> None:
+        team = p.get("team")
+        if team is None:
+            return
+        made = bool(p.get("made"))
+        args = (made, shot_points(p), p.get("r_ft"), *_zone_key(p), sign)
+        self.total.update(*args)
+        self.teams.setdefault(team, ShotTally()).update(*args)
+        key = (team, p.get("player"))
+        tally = self.players.setdefault(key, ShotTally())
+        tally.update(*args)
+        if tally.att <= 0:
+            del self.players[key]
+
+    def add(self, p: dict) -> None:
+        self._apply(p, 1)
+
+    def remove(self, p: dict) -> None:
+        self._apply(p, -1)
+
+    def reassign(self, p: dict, player: str) -> None:
+        """Move one shot to another player of the same team (sets p["player"])."""
+        self._apply(p, -1)
+        p["player"] = player
+        self._apply(p, 1)
+
+    def rename_player(self, team: str, old: str, new: str) -> None:
+        tally = self.players.pop((team, old), None)
+        if tally is None:
+            return
+        if (team, new) in self.players:
+            self.players[(team, new)].merge(tally)
+        else:
+            self.players[(team, new)] = tally
+
+    def team(self, team: str) -> ShotTally:
+        return self.teams.get(team, _EMPTY)
+
+    def player(self, team: str, name: str) -> ShotTally:
+        return self.players.get((team, name), _EMPTY)
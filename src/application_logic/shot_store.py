@@ -0,0 +1,455 @@
+from __future__ import annotations
+import math
+from array import array
+from collections.abc import MutableMapping
+from typing import Iterable
+
+#Struct-of-arrays storage for recorded shots. Known fields live in typed columns (categorical strings as small integer
+#codes); anything that doesn't fit its column's type - or isn't a known field - goes to a sparse per-row dict, so a
+#shot always reads back exactly as it was written.
+
+_INT_MISSING = -2 ** 31
+
+FIELDS: tuple[tuple[str, str], ...] = (
+    ("team", "cat"),
+    ("x", "int"),
+    ("y", "int"),
+    ("made", "bool"),
+    ("airball", "bool"),
+    ("quarter", "cat"),
+    ("player", "cat"),
+    ("zone", "cat"),
+    ("zone_id", "int"),
+    ("zone_key", "cat"),
+    ("r_ft", "float"),
+    ("dx_ft", "float"),
+    ("dy_ft", "float"),
+    ("and1", "bool"),
+    ("shot_type", "cat"),
+    ("made_context", "cat"),
+    ("miss_context", "cat"),
+    ("ft_reason", "cat"),
+    ("player_id", "cat"),
+)
+FIELD_KINDS = dict(FIELDS)
+
+_TYPECODES = {"cat": "I", "int": "i", "bool": "b", "float": "d"}
+_MISSING = {"cat": 0, "int": _INT_MISSING, "bool": -1, "float": math.nan}
+
+class CodeTable:
+    """Interns the values of one categorical field as small integer codes; code 0 means "absent"."""
+    def __init__(self):
+        self.values: list[str | None] = [None]
+        self.codes: dict[str, int] = {}
+
+    def code(self, value: str) -> int:
+        c = self.codes.get(value)
+        if c is None:
+            c = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return c
+
+    def value(self, code: int) -> str | None:
+        return self.values[code]
+
+    def intern(self, value: str) -> str:
+        """The one shared str object for value, so repeated labels cost a pointer per shot."""
+        return self.values[self.code(value)]
+
+#Shared by every store so codes mean the same thing across games (and season overlays)
+CODES: dict[str, CodeTable] = {key: CodeTable() for key, kind in FIELDS if kind == "cat"}
+
+def _encode(key: str, kind: str, value):
+    """Column value for value, or None if it has to be kept in the row's extras instead."""
+    if kind == "cat":
+        return CODES[key].code(value) if type(value) is str else None
+    if kind == "bool":
+        return int(value) if type(value) is bool else None
+    if kind == "int":
+        return value if type(value) is int and _INT_MISSING < value < 2 ** 31 else None
+    return value if type(value) is float and value == value else None
+
+_ABSENT = object() #"key not present" when reading a row
+
+def _decode(key: str, kind: str, raw):
+    if kind == "cat":
+        return CODES[key].values[raw] if raw else _ABSENT
+    if kind == "bool":
+        return _ABSENT if raw < 0 else bool(raw)
+    if kind == "int":
+        return _ABSENT if raw == _INT_MISSING else raw
+    return _ABSENT if raw != raw else raw
+
+class Shot(MutableMapping):
+    """Standalone shot record with one slot per known field (categorical strings interned) plus a dict for any
+    other keys. Built by record_shot, and what a ShotRow falls back to once it is popped from its store."""
+    __slots__ = (*FIELD_KINDS, "_extra")
+
+    def __init__(self, data: dict | None = None, /, **fields):
+        self._extra = None
+        for source in (data or {}, fields):
+            for key, value in source.items():
+                self[key] = value
+
+    def get(self, key: str, default=None):
+        if key in FIELD_KINDS:
+            return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra else default
+
+    def __getitem__(self, key: str):
+        v = self.get(key, _ABSENT)
+        if v is _ABSENT:
+            raise KeyError(key)
+        return v
+
+    def __setitem__(self, key: str, value) -> None:
+        kind = FIELD_KINDS.get(key)
+        if kind is None:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+        else:
+            setattr(self, key, CODES[key].intern(value) if kind == "cat" and type(value) is str else value)
+
+    def __delitem__(self, key: str) -> None:
+        if key in FIELD_KINDS:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _ABSENT) is not _ABSENT
+
+    def __iter__(self):
+        keys = [key for key in FIELD_KINDS if hasattr(self, key)]
+        if self._extra:
+            keys += list(self._extra)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"Shot({self.to_dict()!r})"
+
+    def to_dict(self) -> dict:
+        return {k: self[k] for k in self}
+
+class ShotRow(MutableMapping):
+    """Dict-like view of one shot in a ShotStore. Rows keep their identity while stored; a row popped from the store
+    keeps its values in a Shot record and can be appended again (undo / redo)."""
+    __slots__ = ("_store", "_i", "_data")
+
+    def __init__(self, store: ShotStore | None, i: int = -1, data: Shot | None = None):
+        self._store = store
+        self._i = i
+        self._data = data
+
+    def get(self, key: str, default=None):
+        if self._store is None:
+            return self._data.get(key, default)
+        v = self._store._get(self._i, key)
+        return default if v is _ABSENT else v
+
+    def __getitem__(self, key: str):
+        v = self.get(key, _ABSENT)
+        if v is _ABSENT:
+            raise KeyError(key)
+        return v
+
+    def __setitem__(self, key: str, value) -> None:
+        if self._store is None:
+            self._data[key] = value
+        else:
+            self._store._set(self._i, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        if self._store is None:
+            del self._data[key]
+        elif not self._store._del(self._i, key):
+            raise KeyError(key)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _ABSENT) is not _ABSENT
+
+    def __iter__(self):
+        if self._store is None:
+            return iter(self._data)
+        return iter(self._store._keys(self._i))
+
+    def __len__(self) -> int:
+        return len(self._data) if self._store is None else len(self._store._keys(self._i))
+
+    def __repr__(self) -> str:
+        return f"ShotRow({self.to_dict()!r})"
+
+    def to_dict(self) -> dict:
+        return {k: self[k] for k in self}
+
+class ShotStore:
+    """List-like container of shots (append / pop / clear / iteration) backed by typed columns.
+
+    Popping the last shot (every undo) just drops the column tails. Popping any other shot leaves a tombstone that is
+    compacted away once, on the next indexed or bulk read, instead of shifting every column and row per pop.
+    """
+    def __init__(self, shots: Iterable[dict] = ()):
+        self._cols: dict[str, array] = {key: array(_TYPECODES[kind]) for key, kind in FIELDS}
+        self._extra: list[dict | None] = []
+        self._rows: list[ShotRow | None] = []
+        self._alive = bytearray()
+        self._dead = 0
+        self.extend(shots)
+
+    def __len__(self) -> int:
+        return len(self._rows) - self._dead
+
+    def __iter__(self):
+        self._compact()
+        for i in range(len(self._rows)):
+            yield self._row(i)
+
+    def __getitem__(self, i: int) -> ShotRow:
+        self._compact()
+        n = len(self._rows)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("shot index out of range")
+        return self._row(i)
+
+    def _row(self, i: int) -> ShotRow:
+        row = self._rows[i]
+        if row is None:
+            row = self._rows[i] = ShotRow(self, i) #Plain dicts get their row view on first access
+        return row
+
+    def append(self, shot: dict) -> ShotRow:
+        """Store a shot and return its row. A detached ShotRow is re-attached (same object) rather than copied."""
+        self._compact()
+        return self._row(self._append(shot))
+
+    def extend(self, shots: Iterable[dict]) -> None:
+        self._compact()
+        for s in shots or ():
+            self._append(s)
+
+    def _append(self, shot: dict) -> int:
+        if isinstance(shot, ShotRow):
+            if shot._store is not None:
+                raise ValueError("Shot is already stored.")
+            data, row = shot._data, shot
+        else:
+            data, row = shot, None
+        i = len(self._rows)
+        extra = None
+        for key, kind in FIELDS:
+            enc = _encode(key, kind, data[key]) if key in data else _MISSING[kind]
+            if enc is None:
+                extra = extra or {}
+                extra[key] = data[key]
+                enc = _MISSING[kind]
+            self._cols[key].append(enc)
+        for key, value in data.items():
+            if key not in FIELD_KINDS:
+                extra = extra or {}
+                extra[key] = value
+        self._extra.append(extra)
+        if row is not None:
+            row._store, row._i, row._data = self, i, None
+        self._rows.append(row)
+        self._alive.append(1)
+        return i
+
+    def pop(self, i: int = -1) -> ShotRow:
+        row = self[i]
+        slot = row._i
+        data = Shot(row)
+        if slot == len(self._rows) - 1:
+            for col in self._cols.values():
+                col.pop()
+            self._extra.pop()
+            self._rows.pop()
+            self._alive.pop()
+        else:
+            self._alive[slot] = 0
+            self._extra[slot] = None
+            self._rows[slot] = None
+            self._dead += 1
+        row._store, row._i, row._data = None, -1, data
+        return row
+
+    def _compact(self) -> None:
+        if not self._dead:
+            return
+        keep = [i for i, alive in enumerate(self._alive) if alive]
+        for key, col in self._cols.items():
+            self._cols[key] = array(col.typecode, [col[i] for i in keep])
+        self._extra = [self._extra[i] for i in keep]
+        self._rows = [self._rows[i] for i in keep]
+        for j, row in enumerate(self._rows):
+            if row is not None:
+                row._i = j
+        self._alive = bytearray(b"\x01" * len(keep))
+        self._dead = 0
+
+    def clear(self) -> None:
+        for i, row in enumerate(self._rows):
+            if row is not None and self._alive[i]:
+                row._data = Shot(row)
+                row._store, row._i = None, -1
+        for col in self._cols.values():
+            del col[:]
+        self._extra.clear()
+        self._rows.clear()
+        self._alive = bytearray()
+        self._dead = 0
+
+    def _decoded(self, key: str) -> list:
+        kind = FIELD_KINDS[key]
+        return [_decode(key, kind, raw) for raw in self._cols[key]]
+
+    def to_dicts(self) -> list[dict]:
+        """Plain dicts of every shot, built column by column (saves and exports)."""
+        self._compact()
+        cols = [(key, self._decoded(key)) for key, _ in FIELDS]
+        out = []
+        for i, e in enumerate(self._extra):
+            d = {key: values[i] for key, values in cols if values[i] is not _ABSENT}
+            if e:
+                d.update(e)
+            out.append(d)
+        return out
+
+    def column(self, key: str) -> list:
+        """Decoded values of one field for every shot (None where absent), read straight from the column."""
+        self._compact()
+        if key not in FIELD_KINDS:
+            return [(e or {}).get(key) for e in self._extra]
+        out = self._decoded(key)
+        for i, e in enumerate(self._extra):
+            if out[i] is _ABSENT:
+                out[i] = e.get(key) if e else None
+        return out
+
+    def codes(self, key: str) -> array:
+        """Raw column (codes / ints / floats with absent markers) for vectorised aggregation - do not modify."""
+        self._compact()
+        return self._cols[key]
+
+    def _get(self, i: int, key: str):
+        kind = FIELD_KINDS.get(key)
+        if kind is not None:
+            v = _decode(key, kind, self._cols[key][i])
+            if v is not _ABSENT:
+                return v
+        e = self._extra[i]
+        return e.get(key, _ABSENT) if e else _ABSENT
+
+    def _set(self, i: int, key: str, value) -> None:
+        kind = FIELD_KINDS.get(key)
+        enc = _encode(key, kind, value) if kind is not None else None
+        if enc is not None:
+            self._cols[key][i] = enc
+            e = self._extra[i]
+            if e:
+                e.pop(key, None)
+            return
+        if kind is not None:
+            self._cols[key][i] = _MISSING[kind]
+        if self._extra[i] is None:
+            self._extra[i] = {}
+        self._extra[i][key] = value
+
+    def _del(self, i: int, key: str) -> bool:
+        kind = FIELD_KINDS.get(key)
+        if kind is not None and _decode(key, kind, self._cols[key][i]) is not _ABSENT:
+            self._cols[key][i] = _MISSING[kind]
+            return True
+        e = self._extra[i]
+        if e and key in e:
+            del e[key]
+            return True
+        return False
+
+    def _keys(self, i: int) -> list[str]:
+        keys = [key for key, kind in FIELDS if _decode(key, kind, self._cols[key][i]) is not _ABSENT]
+        e = self._extra[i]
+        if e:
+            keys += [k for k in e if k not in keys]
+        return keys
+
+def _sample_shots(n: int) -> list[dict]:
+    #Shaped like CourtFrame.record_shot output: 10 players a side, distinct floats per shot
+    import random, uuid
+    rng = random.Random(7)
+    pids = {(t, i): str(uuid.uuid4()) for t in ("home", "away") for i in range(10)}
+    zones = [("Key - 2", 4), ("Left Corner - 3", 12), ("Top of Key - 3", 21), ("Free Throw Line - 2", 7)]
+    out = []
+    for k in range(n):
+        team, pi = rng.choice(("home", "away")), rng.randrange(10)
+        zone, zid = rng.choice(zones)
+        made = rng.random() < 0.45
+        shot = {
+            "team": team, "x": rng.randrange(1366), "y": rng.randrange(768),
+            "made": made, "airball": False, "quarter": f"Q{1 + k * 4 // n}",
+            "player": f"Player {pi}", "zone": zone, "zone_id": zid, "zone_key": "zone",
+            "r_ft": rng.uniform(0, 30), "dx_ft": rng.uniform(-25, 25), "dy_ft": rng.uniform(0, 30),
+        }
+        shot["made_context" if made else "miss_context"] = rng.choice(("Assisted", "Iso") if made else ("Rebounded",))
+        shot["player_id"] = pids[(team, pi)]
+        out.append(shot)
+    return out
+
+def _store_with_rows(shots: list[dict]):
+    store = ShotStore(shots)
+    return store, list(store) #CourtFrame ends up holding a row view per shot too
+
+_LAYOUTS = {
+    "dict": lambda shots: shots,
+    "Shot": lambda shots: [Shot(s) for s in shots],
+    "ShotStore": _store_with_rows,
+}
+
+def _measure_layout(layout: str, n: int) -> int:
+    import gc, json, tracemalloc
+    text = json.dumps(_sample_shots(n))
+    tracemalloc.start()
+    shots = json.loads(text)
+    held = _LAYOUTS[layout](shots)
+    del shots
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del held
+    return size
+
+def measure_memory(n: int = 10_000) -> dict[str, int]:
+    """Bytes still held after decoding n saved shots and keeping them as dicts, as Shot records or in a ShotStore.
+
+    Each layout runs in a fresh interpreter so none inherits the CODES tables another one filled.
+    """
+    import subprocess, sys
+    from pathlib import Path
+    root = Path(__file__).resolve().parents[2]
+    out = {}
+    for layout in _LAYOUTS:
+        done = subprocess.run(
+            [sys.executable, "-m", "src.application_logic.shot_store", layout, str(n)],
+            cwd=root, capture_output=True, text=True, check=True,
+        )
+        out[layout] = int(done.stdout.split()[-1])
+    return out
+
+if __name__ == "__main__":
+    import sys
+    if len(sys.argv) == 3:
+        print(_measure_layout(sys.argv[1], int(sys.argv[2])))
+        sys.exit(0)
+    n = 10_000
+    for name, size in measure_memory(n).items():
+        print(f"{name:<10} {size / 1e6:7.2f} MB  {size / n:7.0f} B/shot")
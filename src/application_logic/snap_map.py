@@ -0,0 +1,87 @@
+import math, threading
+from pathlib import Path
+from PIL import Image, ImageChops, ImageFilter
+from src import config
+from src.application_logic import mask_cache
+from src.application_logic import zoning_configuration as ZC
+from src.application_logic.mask_manager import ZONE_TABLE, UNKNOWN_ZONE_ID
+
+SNAP_MAGIC = b"DVSN"
+SNAP_FILENAME = "court_snap.zones"
+MAX_SNAP_STEPS = 254 #Step distances are stored in one byte, 255 = not reached
+
+PLAY_ZONE_IDS = frozenset(zone_id for zone_id, (kind, _) in enumerate(ZONE_TABLE) if kind == "ZONE")
+
+def build_snap_map(grid: bytes, width: int, height: int, max_steps: int) -> tuple[bytes, bytes]:
+    """Nearest playable zone id per pixel, grown outward from the play zones by up to max_steps pixels.
+
+    Each step is one 3x3 max-filter pass, so distances are chessboard pixels and ties go to the higher zone id.
+    """
+    play = [zone_id if zone_id in PLAY_ZONE_IDS else UNKNOWN_ZONE_ID for zone_id in range(256)]
+    ids = Image.frombytes("L", (width, height), bytes(grid)).point(play)
+    steps = ids.point([255] + [0] * 255)
+
+    grow = ImageFilter.MaxFilter(3)
+    for step in range(1, min(max_steps, MAX_SNAP_STEPS) + 1):
+        grown = ids.filter(grow)
+        unset = ids.point([255] + [0] * 255)
+        reached = ImageChops.multiply(unset, grown.point([0] + [255] * 255))
+        if reached.getbbox() is None:
+            break
+        ids.paste(grown, mask=reached)
+        steps.paste(step, mask=reached)
+
+    return ids.tobytes(), steps.tobytes()
+
+class SnapMap:
+    def __init__(self, mask, max_steps: int, cache_dir=None):
+        self.width, self.height = mask.width, mask.height
+        self.max_steps = max_steps
+        self.from_cache = False
+        n = self.width * self.height
+
+        key = mask_cache.content_key(bytes(mask.grid), f"steps={max_steps}")
+        cache_file = None
+        if cache_dir is not None:
+            cache_file = Path(cache_dir) / SNAP_FILENAME
+            cached = mask_cache.open_cached(cache_file, SNAP_MAGIC, key, item_size=2)
+            if cached is not None and cached[1:] == (self.width, self.height):
+                payload = cached[0]
+                self.ids, self.steps = payload[:n], payload[n:]
+                self.from_cache = True
+                return
+
+        self.ids, self.steps = build_snap_map(mask.grid, self.width, self.height, max_steps)
+        if cache_file is not None:
+            mask_cache.write_cached(cache_file, SNAP_MAGIC, key, self.width, self.height, self.ids + self.steps, item_size=2)
+
+    def snap_at(self, ix: int, iy: int, max_steps: int | None = None) -> tuple[int, int] | None:
+        """(zone id, step distance) of the nearest play zone, or None if nothing is within max_steps."""
+        if not (0 <= ix < self.width and 0 <= iy < self.height):
+            return None
+        i = iy * self.width + ix
+        zone_id, step = self.ids[i], self.steps[i]
+        limit = self.max_steps if max_steps is None else max_steps
+        if zone_id == UNKNOWN_ZONE_ID or step > limit:
+            return None
+        return zone_id, step
+
+def snap_radius_px(radius_ft: float | None = None) -> int:
+    cal = ZC.get_calibration()
+    ft = config.SNAP_RADIUS_FT if radius_ft is None else radius_ft
+    return max(0, math.ceil(ft * max(cal.ppf_x, cal.ppf_y)))
+
+_lock = threading.Lock()
+_snap_map: SnapMap | None = None
+
+def get_snap_map() -> SnapMap:
+    global _snap_map
+    if _snap_map is None:
+        with _lock:
+            if _snap_map is None:
+                _snap_map = SnapMap(ZC.get_mask(), snap_radius_px(), cache_dir=config.TMP_DIR)
+    return _snap_map
+
+def snap_zone_id(ix: int, iy: int) -> int | None:
+    hit = get_snap_map().snap_at(ix, iy)
+    return hit[0] if hit else None
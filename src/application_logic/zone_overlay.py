@@ -0,0 +1,108 @@
+from __future__ import annotations
+import threading
+from collections import OrderedDict
+from PIL import Image
+from src.application_logic import zoning_configuration as ZC
+from src.application_logic.mask_manager import ZONE_TABLE
+from src.application_logic.heatmap import hot_cold
+
+ZONE_ALPHA = 150
+MAX_CACHED_SIZES = 3
+
+class ZoneMasks:
+    """One cropped "L" alpha mask per play zone, cut from the compiled zone grid, plus per-size copies."""
+    def __init__(self, mask):
+        self.width, self.height = mask.width, mask.height
+        self.grid = Image.frombuffer("L", (self.width, self.height), bytes(mask.grid), "raw", "L", 0, 1)
+        self.zone_ids = [zone_id for zone_id, (kind, _) in enumerate(ZONE_TABLE) if kind == "ZONE"]
+        self.masks = self._cut(self.grid)
+        self._scaled: OrderedDict[tuple[int, int], dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _cut(self, grid: Image.Image) -> dict[int, tuple[tuple[int, int, int, int], Image.Image]]:
+        masks = {}
+        for zone_id in self.zone_ids:
+            m = grid.point([255 if v == zone_id else 0 for v in range(256)])
+            bbox = m.getbbox()
+            if bbox:
+                masks[zone_id] = (bbox, m.crop(bbox))
+        return masks
+
+    def at_size(self, size: tuple[int, int]) -> dict[int, tuple[tuple[int, int, int, int], Image.Image]]:
+        if size == (self.width, self.height):
+            return self.masks
+        with self._lock:
+            scaled = self._scaled.get(size)
+            if scaled is not None:
+                self._scaled.move_to_end(size)
+                return scaled
+            #Cut from the scaled id grid (not by scaling each crop) so every pixel belongs to exactly one zone and
+            #repainting a zone never touches a neighbour
+            scaled = self._cut(self.grid.resize(size, Image.NEAREST))
+            self._scaled[size] = scaled
+            while len(self._scaled) > MAX_CACHED_SIZES:
+                self._scaled.popitem(last=False)
+            return scaled
+
+_masks_lock = threading.Lock()
+_masks: ZoneMasks | None = None
+
+def get_zone_masks() -> ZoneMasks:
+    global _masks
+    if _masks is None:
+        with _masks_lock:
+            if _masks is None:
+                _masks = ZoneMasks(ZC.get_mask())
+    return _masks
+
+class ZoneChoropleth:
+    """Per-zone FG% tint layers, cached per resolution and repainted one zone at a time as counts change."""
+    def __init__(self, masks: ZoneMasks):
+        self.masks = masks
+        self.counts: dict[int, tuple[int, int]] = {} #zone id -> (made, attempts)
+        self._layers: OrderedDict[tuple[int, int], Image.Image] = OrderedDict()
+
+    def color(self, zone_id: int) -> tuple[int, int, int, int]:
+        made, att = self.counts.get(zone_id, (0, 0))
+        if att <= 0:
+            return 0, 0, 0, 0
+        return (*hot_cold(made / att), ZONE_ALPHA)
+
+    def set_counts(self, counts: dict[int, tuple[int, int]]) -> list[int]:
+        changed = [z for z in set(counts) | set(self.counts) if counts.get(z, (0, 0)) != self.counts.get(z, (0, 0))]
+        self.counts = {z: c for z, c in counts.items() if c[1] > 0}
+        for zone_id in changed:
+            self._patch(zone_id)
+        return changed
+
+    def adjust(self, zone_id: int, made: bool, sign: int = 1) -> None:
+        m, a = self.counts.get(zone_id, (0, 0))
+        m, a = m + (sign if made else 0), a + sign
+        if a > 0:
+            self.counts[zone_id] = (m, a)
+        else:
+            self.counts.pop(zone_id, None)
+        self._patch(zone_id)
+
+    def layer(self, size: tuple[int, int]) -> Image.Image:
+        img = self._layers.get(size)
+        if img is not None:
+            self._layers.move_to_end(size)
+            return img
+        img = Image.new("RGBA", size, (0, 0, 0, 0))
+        scaled = self.masks.at_size(size)
+        for zone_id in self.counts:
+            if zone_id in scaled:
+                box, m = scaled[zone_id]
+                img.paste(self.color(zone_id), box, m)
+        self._layers[size] = img
+        while len(self._layers) > MAX_CACHED_SIZES:
+            self._layers.popitem(last=False)
+        return img
+
+    def _patch(self, zone_id: int) -> None:
+        color = self.color(zone_id)
+        for size, img in self._layers.items():
+            hit = self.masks.at_size(size).get(zone_id)
+            if hit is not None:
+                img.paste(color, hit[0], hit[1])
@@ -0,0 +1,139 @@
+import threading
+from dataclasses import dataclass
+from PIL import Image
+from src.application_logic.mask_manager import ZONE_IDS, ZONE_TABLE, UNKNOWN_ZONE_ID
+from src.application_logic import zoning_configuration as ZC
+
+_SHORT_REPLACEMENTS = {
+    "Left": "L",
+    "Right": "R",
+    "Outside": "Outside",
+    "Wing": "Wing",
+    "Corner": "Corner",
+    "Top of Key": "Top of Key",
+    "High Post": "High Post",
+    "Low Post": "Low Post",
+    "Free Throw": "FT Line",
+    "Above Break": "AB",
+}
+
+def short_label(label: str) -> str:
+    if not label:
+        return "-"
+    base, sep, suffix = label.partition(" - ")
+    for k, v in _SHORT_REPLACEMENTS.items():
+        base = base.replace(k, v)
+    return base + (f" - {suffix}" if sep else "")
+
+def _label_points(name: str) -> int:
+    _, sep, suffix = name.rpartition("-")
+    try:
+        return int(suffix.strip()) if sep else 2
+    except ValueError:
+        return 2
+
+@dataclass(frozen=True)
+class Zone:
+    id: int
+    name: str
+    rgb: tuple[int, int, int] | None
+    kind: str
+    points: int
+    short: str
+    side: str
+    area_sqft: float
+    centroid: tuple[float, float] | None
+    is_free_throw: bool = False
+    is_dunk: bool = False
+
+class ZoneRegistry:
+    def __init__(self, mask):
+        cal = ZC.get_calibration()
+        w, h = mask.width, mask.height
+        grid = bytes(mask.grid)
+        n = len(ZONE_TABLE)
+        keys = [bytes([zone_id]) for zone_id in range(n)]
+
+        #Row and column occupancy per zone id -> pixel area and centroid without touching pixels in Python
+        counts = [0] * n
+        sum_y = [0] * n
+        for y in range(h):
+            row = grid[y * w:(y + 1) * w]
+            for zone_id in range(n):
+                c = row.count(keys[zone_id])
+                if c:
+                    counts[zone_id] += c
+                    sum_y[zone_id] += c * y
+
+        columns = Image.frombytes("L", (w, h), grid).transpose(Image.Transpose.TRANSPOSE).tobytes()
+        sum_x = [0] * n
+        for x in range(w):
+            col = columns[x * h:(x + 1) * h]
+            for zone_id in range(n):
+                c = col.count(keys[zone_id])
+                if c:
+                    sum_x[zone_id] += c * x
+
+        sqft_per_px = 1.0 / (cal.ppf_x * cal.ppf_y)
+        rgb_by_id = {zone_id: rgb for rgb, zone_id in ZONE_IDS.items()}
+
+        self.zones: list[Zone] = []
+        for zone_id, (kind, name) in enumerate(ZONE_TABLE):
+            lowered = name.lower()
+            is_ft = "free throw line" in lowered
+            if zone_id == UNKNOWN_ZONE_ID:
+                points = 0
+            elif is_ft:
+                points = 1
+            else:
+                points = _label_points(name)
+            side = "left" if name.startswith("Left") else "right" if name.startswith("Right") else "center"
+            c = counts[zone_id]
+            self.zones.append(Zone(
+                id=zone_id,
+                name=name,
+                rgb=rgb_by_id.get(zone_id),
+                kind=kind.lower(),
+                points=points,
+                short=short_label(name),
+                side=side,
+                area_sqft=c * sqft_per_px,
+                centroid=(sum_x[zone_id] / c, sum_y[zone_id] / c) if c else None,
+                is_free_throw=is_ft,
+                is_dunk="dunk" in lowered,
+            ))
+
+        self.by_name: dict[str, Zone] = {z.name: z for z in self.zones if z.id != UNKNOWN_ZONE_ID}
+
+    def __getitem__(self, zone_id: int) -> Zone:
+        return self.zones[zone_id]
+
+    def __iter__(self):
+        return iter(self.zones)
+
+    def __len__(self) -> int:
+        return len(self.zones)
+
+    def get(self, zone_id: int | None) -> Zone | None:
+        if isinstance(zone_id, int) and 0 <= zone_id < len(self.zones):
+            return self.zones[zone_id]
+        return None
+
+    def zone_for(self, shot: dict) -> Zone | None:
+        name = shot.get("zone")
+        z = self.get(shot.get("zone_id"))
+        #Ids follow ledger order - trust the label if a save predates a ledger change
+        if z is not None and (not name or z.name == name):
+            return z
+        return self.by_name.get(name) if name else None
+
+_lock = threading.Lock()
+_registry: ZoneRegistry | None = None
+
+def get_registry() -> ZoneRegistry:
+    global _registry
+    if _registry is None:
+        with _lock:
+            if _registry is None:
+                _registry = ZoneRegistry(ZC.get_mask())
+    return _registry
@@ -1,8 +1,29 @@
-from src.application_logic.zoning_configuration import MASK
+from array import array
+from typing import Iterable
+from src.application_logic.zoning_configuration import get_mask
+from src.application_logic.mask_manager import ZONE_TABLE, OUT_OF_BOUNDS, OUT_OF_BOUNDS_ID
 from src.application_logic.court_mask_color_ledger import(
     ZONE_COLORS, LINE_COLORS, PLAY_COLORS, NO_CLICK_COLORS
 )
 
+_RESOLVED = [(kind.lower(), name) for kind, name in ZONE_TABLE]
+_KINDS = [kind for kind, _ in _RESOLVED] + ["unknown"] * (256 - len(_RESOLVED))
+_LABELS = [name for _, name in _RESOLVED] + ["Unmapped color"] * (256 - len(_RESOLVED))
+_KINDS[OUT_OF_BOUNDS_ID] = OUT_OF_BOUNDS[0].lower()
+_LABELS[OUT_OF_BOUNDS_ID] = OUT_OF_BOUNDS[1]
+
 def resolve_zone(ix: int, iy: int):
-    kind, name = MASK.get_zone_at(ix, iy)
-    return kind.lower(), name
\ No newline at end of file
+    mask = get_mask()
+    w = mask.width
+    if not (0 <= ix < w and 0 <= iy < mask.height):
+        return "out_of_bounds", "Out of Bounds"
+    return _RESOLVED[mask.grid[iy * w + ix]]
+
+def resolve_zone_id(ix: int, iy: int) -> int | None:
+    return get_mask().zone_id_at(ix, iy)
+
+def resolve_zones(xs: Iterable[int], ys: Iterable[int]) -> tuple[array, list[str], list[str]]:
+    """Batch form of resolve_zone: integer image coordinates in (list, array or NumPy), zone ids/kinds/labels out."""
+    ids = get_mask().zone_ids_at(xs, ys)
+    keys = ids.tolist()
+    return ids, list(map(_KINDS.__getitem__, keys)), list(map(_LABELS.__getitem__, keys))
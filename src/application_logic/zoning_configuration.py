@@ -1,79 +1,114 @@
+import threading
 from pathlib import Path
 from src.application_logic.mask_manager import MaskManager
-from src import config 
+from src.application_logic.geometry import CourtCalibration
+from src import config
 
 MASK_PATH = config.MASK_IMAGES_DIR / "court_mask.png"
-if not MASK_PATH.is_file():
-    raise FileNotFoundError(f"Court mask not found at {MASK_PATH}")
-MASK = MaskManager(str(MASK_PATH))
 
 COURT_WIDTH_FEET = 50.0 #High school court width
 COURT_LENGTH_FEET = 50.0 #42ft for high school half, plus 6ft of half of center ring, plus 2ft to marker
 
-HOOP_CENTER_X_FT = COURT_WIDTH_FEET / 2.0 
-HOOP_CENTER_Y_FT = 4.0 
+HOOP_CENTER_X_FT = COURT_WIDTH_FEET / 2.0
+HOOP_CENTER_Y_FT = 4.0
 
 COURT_LEFT_PX = 340 #Spreads between 336 to 340 - Choosing the inside edge
-COURT_RIGHT_PX = 1040 #Spreads between 1040 and 1044 - Choosing the inside edge 
-COURT_BASELINE_Y_PX = 60 #Spreads between 57 and 60 - Choosing the inside edge 
+COURT_RIGHT_PX = 1040 #Spreads between 1040 and 1044 - Choosing the inside edge
+COURT_BASELINE_Y_PX = 60 #Spreads between 57 and 60 - Choosing the inside edge
 COURT_FAR_EDGE_Y_PX = 765
 HOOP_CX_PX = 690
 HOOP_CY_PX = 139
 
-W, H = MASK.img.width, MASK.img.height
+#The mask and the calibration derived from these constants are built on first use (or by warm()), not at import.
+#Module attributes listed here resolve through __getattr__ until then.
+_MASK_NAMES = {"MASK", "W", "H"}
+_CALIBRATION_NAMES = {
+    "COURT_SPAN_X_PX": "span_x_px",
+    "COURT_SPAN_Y_PX": "span_y_px",
+    "PPF_X": "ppf_x",
+    "PPF_Y": "ppf_y",
+}
 
-def _use_defaults_if_missing():
-    global COURT_LEFT_PX, COURT_RIGHT_PX, COURT_BASELINE_Y_PX, COURT_FAR_EDGE_Y_PX, HOOP_CX_PX, HOOP_CY_PX
-    missing = any(v is None for v in(
-        COURT_LEFT_PX, COURT_RIGHT_PX, COURT_BASELINE_Y_PX, COURT_FAR_EDGE_Y_PX, HOOP_CX_PX, HOOP_CY_PX
-    ))
-    if not missing: 
-        return False
-    
-    if COURT_LEFT_PX is None: COURT_LEFT_PX = 0 
-    if COURT_RIGHT_PX is None: COURT_RIGHT_PX = W - 1
-    if COURT_BASELINE_Y_PX is None: COURT_BASELINE_Y_PX = 0 
-    if COURT_FAR_EDGE_Y_PX is None: COURT_FAR_EDGE_Y_PX = H - 1 
-    if HOOP_CX_PX is None: HOOP_CX_PX = W // 2
-    if HOOP_CY_PX is None: HOOP_CY_PX = int(H * 0.18)
-    print(
-        "[DunkVision] Court bbox is not calibrated yet - using WHOLE-IMAGE defaults"
-    )
-    return True 
+_init_lock = threading.RLock()
+_mask: MaskManager | None = None
+_calibration: CourtCalibration | None = None
 
-_boot_used_defaults = _use_defaults_if_missing()
+def get_mask() -> MaskManager:
+    global _mask, W, H
+    if _mask is not None:
+        return _mask
+    with _init_lock:
+        if _mask is None:
+            if not MASK_PATH.is_file():
+                raise FileNotFoundError(f"Court mask not found at {MASK_PATH}")
+            mask = MaskManager(
+                str(MASK_PATH), cache_dir=config.TMP_DIR,
+                max_color_distance=config.MASK_COLOR_TOLERANCE,
+            )
+            W, H = mask.width, mask.height
+            _mask = mask
+    return _mask
 
-COURT_SPAN_X_PX = abs(COURT_RIGHT_PX - COURT_LEFT_PX)
-COURT_SPAN_Y_PX = abs(COURT_FAR_EDGE_Y_PX - COURT_BASELINE_Y_PX)
+def _build_calibration() -> CourtCalibration:
+    px = {
+        "left_px": COURT_LEFT_PX, "right_px": COURT_RIGHT_PX,
+        "baseline_y_px": COURT_BASELINE_Y_PX, "far_edge_y_px": COURT_FAR_EDGE_Y_PX,
+        "hoop_cx_px": HOOP_CX_PX, "hoop_cy_px": HOOP_CY_PX,
+    }
+    missing = any(v is None for v in px.values())
+    if missing:
+        mask = get_mask()
+        W, H = mask.width, mask.height
+        defaults = {
+            "left_px": 0, "right_px": W - 1,
+            "baseline_y_px": 0, "far_edge_y_px": H - 1,
+            "hoop_cx_px": W // 2, "hoop_cy_px": int(H * 0.18),
+        }
+        px = {k: defaults[k] if v is None else v for k, v in px.items()}
+        print(
+            "[DunkVision] Court bbox is not calibrated yet - using WHOLE-IMAGE defaults"
+        )
 
-if COURT_SPAN_X_PX <= 0 or COURT_SPAN_Y_PX <= 0: 
-    raise ValueError(
-        "Court bbox spans must be positive"
-        "Check COURT_LEFT/RIGHT_PX and BASELINE/FAR_EDGE_Y_PX"
+    return CourtCalibration(
+        **px,
+        width_ft=COURT_WIDTH_FEET, length_ft=COURT_LENGTH_FEET,
+        hoop_x_ft=HOOP_CENTER_X_FT, hoop_y_ft=HOOP_CENTER_Y_FT,
+        used_defaults=missing,
     )
 
-PPF_X = COURT_SPAN_X_PX / COURT_WIDTH_FEET
-PPF_Y = COURT_SPAN_Y_PX / COURT_LENGTH_FEET
+def get_calibration() -> CourtCalibration:
+    global _calibration
+    if _calibration is not None:
+        return _calibration
+    with _init_lock:
+        if _calibration is None:
+            _calibration = _build_calibration()
+    return _calibration
+
+def warm() -> None:
+    """Load the mask and calibrate now, e.g. from a background thread while the start screen is up."""
+    get_mask()
+    get_calibration()
 
-_Y_POSITIVE_IF_IF_INCREASES = 1 if (COURT_FAR_EDGE_Y_PX > COURT_BASELINE_Y_PX) else - 1
+def __getattr__(name: str):
+    if name in _MASK_NAMES:
+        mask = get_mask()
+        return mask if name == "MASK" else globals()[name]
+    if name in _CALIBRATION_NAMES:
+        return getattr(get_calibration(), _CALIBRATION_NAMES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 def is_in_court_bbox(ix: int, iy: int) -> bool:
-    x_ok = (min(COURT_LEFT_PX, COURT_RIGHT_PX) <= ix <= max(COURT_LEFT_PX, COURT_RIGHT_PX))
-    y_ok = (min(COURT_BASELINE_Y_PX, COURT_FAR_EDGE_Y_PX) <= iy <= max(COURT_BASELINE_Y_PX, COURT_FAR_EDGE_Y_PX))
-    return x_ok and y_ok
+    return get_calibration().is_in_bbox(ix, iy)
 
 def pixels_to_feet(ix: int, iy: int):
-    x_ft = (ix - COURT_LEFT_PX) / PPF_X if COURT_RIGHT_PX >= COURT_LEFT_PX else (COURT_LEFT_PX - ix) / PPF_X
-
-    if _Y_POSITIVE_IF_IF_INCREASES > 0: 
-        y_ft = (iy - COURT_BASELINE_Y_PX) / PPF_Y
-    else: 
-        y_ft = (COURT_BASELINE_Y_PX - iy) / PPF_Y
-    return x_ft, y_ft
+    return get_calibration().pixels_to_feet(ix, iy)
 
 def shot_distance_from_hoop(ix: int, iy: int):
-    x_ft, y_ft = pixels_to_feet(ix, iy)
-    dx_ft = x_ft - HOOP_CENTER_X_FT
-    dy_ft = y_ft - HOOP_CENTER_Y_FT
-    r_ft = (dx_ft**2 + dy_ft**2) ** 0.5
-    return r_ft, dx_ft, dy_ft 
\ No newline at end of file
+    #Pixel clicks read the precomputed raster; off-grid or fractional points use the calibration math
+    if type(ix) is int and type(iy) is int:
+        from src.application_logic.distance_raster import get_distance_raster
+        hit = get_distance_raster().offsets_at(ix, iy)
+        if hit is not None:
+            return hit
+    return get_calibration().distance_from_hoop(ix, iy)
@@ -0,0 +1,85 @@
+from __future__ import annotations
+import threading
+from pathlib import Path
+from PIL import Image
+
+#One decoded copy per (file, size) for the whole process. Images handed out are shared - copy before drawing on them.
+#ImageTk is only imported when a PhotoImage is first requested, so headless callers never pull in Tk.
+
+_lock = threading.RLock()
+_images: dict[tuple[str, tuple[int, int] | None], Image.Image] = {}
+_photos: dict[tuple[str, tuple[int, int] | None], list] = {} #key -> [PhotoImage, refcount]
+
+def _key(path: str | Path, size: tuple[int, int] | None) -> tuple[str, tuple[int, int] | None]:
+    return str(Path(path).resolve()), (tuple(size) if size else None)
+
+def get_image(path: str | Path, size: tuple[int, int] | None = None) -> Image.Image | None:
+    key = _key(path, size)
+    img = _images.get(key)
+    if img is not None:
+        return img
+    with _lock:
+        img = _images.get(key)
+        if img is not None:
+            return img
+        if size is None:
+            p = Path(path)
+            if not p.is_file():
+                print(f"[Assets] Missing file: {p}")
+                return None
+            try:
+                with Image.open(p) as im:
+                    img = im.convert("RGBA").copy()
+            except Exception as e:
+                print(f"[Assets] Failed to load {p}: {e}")
+                return None
+        else:
+            full = get_image(path)
+            if full is None:
+                return None
+            img = full.resize(tuple(size), Image.LANCZOS)
+        _images[key] = img
+        return img
+
+def acquire_photo(path: str | Path, size: tuple[int, int] | None = None):
+    """PhotoImage for an asset, shared and reference counted. Pair every call with release_photo (Tk thread only)."""
+    key = _key(path, size)
+    entry = _photos.get(key)
+    if entry is None:
+        img = get_image(path, size)
+        if img is None:
+            return None
+        from PIL import ImageTk
+        entry = _photos[key] = [ImageTk.PhotoImage(img), 0]
+    entry[1] += 1
+    return entry[0]
+
+def release_photo(path: str | Path, size: tuple[int, int] | None = None) -> None:
+    key = _key(path, size)
+    entry = _photos.get(key)
+    if entry is None:
+        return
+    entry[1] -= 1
+    if entry[1] <= 0:
+        del _photos[key]
+
+def bind_photo(widget, path: str | Path, size: tuple[int, int] | None = None):
+    """acquire_photo tied to a widget's lifetime - released when the widget is destroyed."""
+    photo = acquire_photo(path, size)
+    if photo is None:
+        return None
+
+    def _on_destroy(event):
+        if event.widget is widget:
+            release_photo(path, size)
+
+    widget.bind("<Destroy>", _on_destroy, add="+")
+    return photo
+
+def photo_refcount(path: str | Path, size: tuple[int, int] | None = None) -> int:
+    entry = _photos.get(_key(path, size))
+    return entry[1] if entry else 0
+
+def clear() -> None:
+    with _lock:
+        _images.clear()
@@ -0,0 +1,153 @@
+from __future__ import annotations
+import argparse, hashlib, json, os, sys, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import replace
+from pathlib import Path
+from src import config
+from src import shot_chart
+from src.shot_chart import ChartOptions, save_shot_chart
+from session_data.game_io import safe_read_game
+from project import slugify
+
+#Render shot charts for a folder of saved games, one worker process per game:
+#   python -m src.batch_render [folder] [--out DIR] [--workers N] [--theme light|dark] [--width PX] [--force]
+
+GAME_SUFFIX = ".dvg.json"
+STAMP_FILE = ".render_stamps.json" #chart name -> fingerprint of the options and assets it was rendered with
+QUARTERS = ("Q1", "Q2", "Q3", "Q4")
+
+def find_games(folder: str | Path, recursive: bool = False) -> list[Path]:
+    folder = Path(folder)
+    pattern = f"**/*{GAME_SUFFIX}" if recursive else f"*{GAME_SUFFIX}"
+    return sorted(p for p in folder.glob(pattern) if p.is_file())
+
+def game_stem(path: Path) -> str:
+    name = path.name
+    return name[:-len(GAME_SUFFIX)] if name.lower().endswith(GAME_SUFFIX) else path.stem
+
+def _dedupe(names: list[str]) -> list[str]:
+    #Different players/quarters can slugify alike ("O'Neil" / "ONeil") - later ones get -2, -3, ...
+    seen: set[str] = set()
+    out = []
+    for name in names:
+        stem, ext = os.path.splitext(name)
+        n, unique = 1, name
+        while unique in seen:
+            n += 1
+            unique = f"{stem}-{n}{ext}"
+        seen.add(unique)
+        out.append(unique)
+    return out
+
+def chart_jobs(game: dict, base: ChartOptions) -> list[tuple[str, ChartOptions]]:
+    """(output file name, options) for the whole game, each quarter played and each player with shots."""
+    shots = game.get("shots", []) or []
+    jobs = [("game.png", base)]
+
+    played = {p.get("quarter") for p in shots if p.get("quarter")}
+    ordered = [q for q in QUARTERS if q in played] + sorted(played - set(QUARTERS))
+    jobs += [(f"quarter_{slugify(q)}.png", replace(base, quarters=(q,))) for q in ordered]
+
+    players = sorted({(p.get("team"), p.get("player")) for p in shots if p.get("team") in ("home", "away") and p.get("player")})
+    jobs += [
+        (f"player_{team}_{slugify(name)}.png", replace(base, teams=(team,), players=(name,)))
+        for team, name in players
+    ]
+    return list(zip(_dedupe([name for name, _ in jobs]), [options for _, options in jobs]))
+
+def game_out_dir(path: Path, root: Path, out_root: Path) -> Path:
+    """Charts folder for one save, mirroring its folder under the input root so same-named saves stay apart."""
+    try:
+        rel = path.parent.relative_to(root)
+    except ValueError:
+        rel = Path()
+    return out_root / rel / game_stem(path)
+
+def chart_fingerprint(game: dict, options: ChartOptions) -> str:
+    """Changes whenever the same game would render differently: options, resolved theme, court image or marker look."""
+    theme = options.theme or (game.get("ui", {}) or {}).get("mode") or "dark"
+    court = config.SCREEN_IMAGES_DIR / shot_chart.COURT_IMAGES.get(theme, shot_chart.COURT_IMAGES["dark"])
+    try:
+        st = court.stat()
+        court_sig = (st.st_size, st.st_mtime_ns)
+    except OSError:
+        court_sig = None
+    parts = (repr(options), theme, str(court), court_sig, shot_chart.MADE_FILL, shot_chart.MISS_FILL)
+    return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:16]
+
+def _read_stamps(out_dir: Path) -> dict:
+    try:
+        return json.loads((out_dir / STAMP_FILE).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+def render_game_charts(path: str | Path, out_root: str | Path, base: ChartOptions, force: bool = False,
+                       root: str | Path | None = None) -> tuple[str, int, int]:
+    """Render every chart for one saved game. Returns (game name, written, skipped). Runs inside a worker."""
+    path, out_root = Path(path), Path(out_root)
+    root = Path(root) if root is not None else path.parent
+    out_dir = game_out_dir(path, root, out_root)
+    src_mtime = path.stat().st_mtime
+
+    game = safe_read_game(path)
+    stamps = _read_stamps(out_dir)
+    written = skipped = 0
+    for name, options in chart_jobs(game, base):
+        dest = out_dir / name
+        fingerprint = chart_fingerprint(game, options)
+        if (not force and dest.is_file() and dest.stat().st_mtime >= src_mtime
+                and stamps.get(name) == fingerprint):
+            skipped += 1
+            continue
+        save_shot_chart(game, dest, options)
+        stamps[name] = fingerprint
+        written += 1
+    if written:
+        tmp = out_dir / (STAMP_FILE + ".tmp")
+        tmp.write_text(json.dumps(stamps, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, out_dir / STAMP_FILE)
+    return str(out_dir.relative_to(out_root)), written, skipped
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Render DunkVision shot charts for a folder of saved games.")
+    ap.add_argument("folder", nargs="?", default=str(config.SAVES_DIR))
+    ap.add_argument("--out", default=str(config.EXPORTS_DIR / "charts"))
+    ap.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    ap.add_argument("--theme", choices=("light", "dark"), default=None, help="Override the theme saved with each game")
+    ap.add_argument("--width", type=int, default=None)
+    ap.add_argument("--height", type=int, default=None)
+    ap.add_argument("--recursive", action="store_true")
+    ap.add_argument("--force", action="store_true", help="Re-render charts even if they are up to date")
+    args = ap.parse_args(argv)
+
+    games = find_games(args.folder, args.recursive)
+    if not games:
+        print(f"No {GAME_SUFFIX} files in {args.folder}")
+        return 0
+
+    base = ChartOptions(width=args.width, height=args.height, theme=args.theme)
+    workers = max(1, min(args.workers or os.cpu_count() or 1, len(games)))
+    started = time.perf_counter()
+    written = skipped = failed = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render_game_charts, g, args.out, base, args.force, args.folder): g for g in games}
+        for fut in as_completed(futures):
+            try:
+                name, w, s = fut.result()
+            except Exception as e:
+                failed += 1
+                print(f"[batch_render] {futures[fut].name}: {e}")
+                continue
+            written += w
+            skipped += s
+            print(f"{name:<40} {w:>4} written {s:>4} up to date")
+
+    print(
+        f"{len(games)} games, {written} charts written, {skipped} up to date, {failed} failed "
+        f"in {time.perf_counter() - started:.1f}s ({workers} workers) -> {args.out}"
+    )
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
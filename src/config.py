@@ -32,6 +32,21 @@ TMP_DIR = SESSION_DATA_DIR / "tmp"
 SAVES_DIR = USER_HOME_BASE / "saves"
 EXPORTS_DIR = USER_HOME_BASE / "exports"
 
+#Court Mask Settings
+MASK_COLOR_TOLERANCE = 24.0 #Max RGB distance for an off-ledger mask pixel (anti-aliasing) to snap to a ledger color, 0 = exact only
+SNAP_RADIUS_FT = 1.5 #Clicks on a line or no-click area within this many feet of a playable zone snap to it, 0 = never snap
+
+#Court Canvas Settings
+RESIZE_CACHE_MB = 96 #Memory cap for fitted court/start images (PIL copy + PhotoImage) kept for reuse across resizes and theme flips
+IMAGE_PYRAMID_WIDTHS = (640, 854, 1024, 1152, 1280) #Downscaled screen image widths baked under TMP_DIR/image_pyramid (upscales gain nothing)
+RESIZE_DEBOUNCE_MS = 150 #Quiet time after the last <Configure> before the LANCZOS pass replaces the fast preview
+SHOW_RENDER_TIMING = True #Status bar reports preview/final render milliseconds once each resize or zoom settles
+ZOOM_MAX = 6.0 #Court canvas zoom limit relative to fit-to-window (Ctrl+MouseWheel, middle-drag to pan)
+ZOOM_STEP = 1.25
+RASTER_MARKER_THRESHOLD = 300 #Shot count at which markers switch from canvas items to a single composited overlay image
+HEATMAP_CELL_PX = 24 #Heatmap bin size in court image pixels
+HEATMAP_FULL_ATTEMPTS = 8 #Attempts at which a heatmap bin reaches full opacity
+
 #Check Directories Exist (Safe No-Op)
 for directory in (
     USER_HOME_BASE, 
@@ -0,0 +1,94 @@
+from __future__ import annotations
+import threading
+from pathlib import Path
+from PIL import Image
+from src import config
+from src.application_logic import mask_cache
+
+#Pre-scaled RGBA copies of the screen images, stored raw (mask_cache format) so a level loads by mmap with no PNG decode.
+#Build with `python -m src.image_pyramid`, or let the app build missing levels in the background on first run.
+
+PYRAMID_MAGIC = b"DVPY"
+PYRAMID_DIR = config.TMP_DIR / "image_pyramid"
+SCREEN_IMAGE_FILES = ("dv_start_screen.png", "court_light_mode.png", "court_dark_mode.png")
+
+_lock = threading.Lock()
+_levels: dict[str, list[Image.Image]] = {}
+
+def _level_path(src: Path, width: int, height: int, out_dir: Path) -> Path:
+    return out_dir / f"{src.stem}_{width}x{height}.rgba"
+
+def _level_key(src: Path, width: int, height: int) -> bytes:
+    st = src.stat()
+    return mask_cache.content_key(str(src.resolve()), str(st.st_size), str(st.st_mtime_ns), f"{width}x{height}")
+
+def level_sizes(src_size: tuple[int, int], widths=None) -> list[tuple[int, int]]:
+    sw, sh = src_size
+    widths = config.IMAGE_PYRAMID_WIDTHS if widths is None else widths
+    return [(w, max(1, round(sh * w / sw))) for w in sorted(set(widths)) if w < sw]
+
+def build_pyramid(src: str | Path, out_dir: str | Path = PYRAMID_DIR, widths=None) -> list[Path]:
+    """Write any missing or stale levels for one image and return every level path."""
+    src, out_dir = Path(src), Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    written = []
+    full = None
+    with Image.open(src) as im:
+        sizes = level_sizes(im.size, widths)
+        for w, h in sizes:
+            path = _level_path(src, w, h, out_dir)
+            key = _level_key(src, w, h)
+            if mask_cache.open_cached(path, PYRAMID_MAGIC, key, item_size=4) is None:
+                if full is None:
+                    full = im.convert("RGBA")
+                level = full.resize((w, h), Image.LANCZOS)
+                mask_cache.write_cached(path, PYRAMID_MAGIC, key, w, h, level.tobytes(), item_size=4)
+            written.append(path)
+    with _lock:
+        _levels.pop(str(src.resolve()), None)
+    return written
+
+def load_levels(src: str | Path, out_dir: str | Path = PYRAMID_DIR, widths=None) -> list[Image.Image]:
+    """Levels already on disk for src, smallest first. Missing or stale levels are skipped."""
+    src, out_dir = Path(src), Path(out_dir)
+    cache_key = str(src.resolve())
+    levels = _levels.get(cache_key)
+    if levels is not None:
+        return levels
+    try:
+        with Image.open(src) as im:
+            sizes = level_sizes(im.size, widths)
+    except OSError:
+        return []
+
+    levels = []
+    for w, h in sizes:
+        cached = mask_cache.open_cached(_level_path(src, w, h, out_dir), PYRAMID_MAGIC, _level_key(src, w, h), item_size=4)
+        if cached is not None:
+            levels.append(Image.frombuffer("RGBA", (w, h), cached[0], "raw", "RGBA", 0, 1))
+    #Only remember a complete set - a partial one is re-scanned after the next build
+    if len(levels) == len(sizes):
+        with _lock:
+            _levels[cache_key] = levels
+    return levels
+
+def pick_level(src: Image.Image, levels: list[Image.Image], target_width: int, target_height: int, mode: str = "contain") -> Image.Image:
+    """Smallest of src/levels that still covers the fitted size, so only a small final resample is left."""
+    fit = max if mode == "cover" else min
+    need_w = src.width * fit(target_width / src.width, target_height / src.height)
+    candidates = sorted([src, *levels], key=lambda im: im.width)
+    for im in candidates:
+        if im.width >= need_w:
+            return im
+    return candidates[-1]
+
+def build_screen_pyramids(out_dir: str | Path = PYRAMID_DIR) -> None:
+    for name in SCREEN_IMAGE_FILES:
+        src = config.SCREEN_IMAGES_DIR / name
+        if src.is_file():
+            build_pyramid(src, out_dir)
+
+if __name__ == "__main__":
+    build_screen_pyramids()
+    for p in sorted(PYRAMID_DIR.glob("*.rgba")):
+        print(f"{p.name:<36} {p.stat().st_size / 1e6:6.1f} MB")
@@ -0,0 +1,94 @@
+from __future__ import annotations
+import io
+from dataclasses import dataclass
+from pathlib import Path
+from PIL import Image, ImageDraw
+from src import config, asset_registry
+
+#Pure Pillow shot-chart rendering shared by the GUI export and batch jobs - must never import tkinter.
+
+MARKER_RADIUS = 4
+MADE_FILL = "#3F704D"
+MISS_FILL = "#960018"
+
+COURT_IMAGES = {
+    "light": "court_light_mode.png",
+    "dark": "court_dark_mode.png",
+}
+
+@dataclass(frozen=True)
+class ChartOptions:
+    width: int | None = None #Fit inside width x height (aspect kept); None = native court size
+    height: int | None = None
+    theme: str | None = None #"light" / "dark", None = the game's saved theme
+    teams: tuple[str, ...] | None = None
+    quarters: tuple[str, ...] | None = None
+    players: tuple[str, ...] | None = None
+    made: bool | None = None #True = makes only, False = misses only
+    marker_radius: int = MARKER_RADIUS
+
+def paint_marker(draw: ImageDraw.ImageDraw, cx: float, cy: float, *, made: bool, team: str, r: int = MARKER_RADIUS) -> None:
+    fill = MADE_FILL if made else MISS_FILL
+    if team == "home":
+        draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=fill)
+    else:
+        draw.rectangle((cx - r, cy - r, cx + r, cy + r), fill=fill)
+
+def filter_shots(shots: list[dict], options: ChartOptions) -> list[dict]:
+    out = []
+    for p in shots or []:
+        if p.get("x") is None or p.get("y") is None or p.get("team") not in ("home", "away"):
+            continue
+        if options.teams is not None and p.get("team") not in options.teams:
+            continue
+        if options.quarters is not None and p.get("quarter") not in options.quarters:
+            continue
+        if options.players is not None and p.get("player") not in options.players:
+            continue
+        if options.made is not None and bool(p.get("made")) != options.made:
+            continue
+        out.append(p)
+    return out
+
+def court_image(theme: str) -> Image.Image:
+    img = asset_registry.get_image(config.SCREEN_IMAGES_DIR / COURT_IMAGES.get(theme, COURT_IMAGES["dark"]))
+    if img is None:
+        raise FileNotFoundError(f"Court image for theme {theme!r} not found")
+    return img
+
+def render_shot_chart(game: dict, options: ChartOptions | None = None) -> Image.Image:
+    options = options or ChartOptions()
+    theme = options.theme or (game.get("ui", {}) or {}).get("mode") or "dark"
+    src = court_image(theme)
+    src_w, src_h = src.size
+
+    if options.width or options.height:
+        scale = min(
+            s for s in (
+                options.width / src_w if options.width else None,
+                options.height / src_h if options.height else None,
+            ) if s is not None
+        )
+        draw_w, draw_h = max(1, int(src_w * scale)), max(1, int(src_h * scale))
+        base = src.resize((draw_w, draw_h), Image.LANCZOS)
+    else:
+        draw_w, draw_h = src_w, src_h
+        base = src.copy()
+
+    draw = ImageDraw.Draw(base)
+    for p in filter_shots(game.get("shots", []), options):
+        cx = (p["x"] + 0.5) / max(1, src_w) * draw_w
+        cy = (p["y"] + 0.5) / max(1, src_h) * draw_h
+        paint_marker(draw, cx, cy, made=bool(p.get("made")), team=p["team"], r=options.marker_radius)
+    return base
+
+def render_png(game: dict, options: ChartOptions | None = None) -> bytes:
+    buf = io.BytesIO()
+    render_shot_chart(game, options).save(buf, format="PNG")
+    return buf.getvalue()
+
+def save_shot_chart(game: dict, path: str | Path, options: ChartOptions | None = None) -> Path:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    render_shot_chart(game, options).save(path, format="PNG")
+    return path
@@ -1,7 +1,10 @@
+import time
 import tkinter as tk 
+from collections import OrderedDict
 from tkinter import ttk, filedialog
 from PIL import Image, ImageTk, ImageColor
-from src.config import SCREEN_IMAGES_DIR
+from src.config import SCREEN_IMAGES_DIR, RESIZE_CACHE_MB, RESIZE_DEBOUNCE_MS, ZOOM_MAX, ZOOM_STEP
+from src import asset_registry, image_pyramid
 from pathlib import Path
 from tkinter import filedialog, messagebox
 from session_data.game_io import safe_read_game
@@ -9,17 +12,79 @@ from session_data.game_io import safe_read_game
 NATIVE_WIDTH = 1366
 NATIVE_HEIGHT = 768
 
+class ResizeCache:
+    """Bounded LRU of fitted images and their PhotoImages, keyed by (key, canvas width, canvas height, mode)."""
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, tuple[Image.Image, ImageTk.PhotoImage | None, int]] = OrderedDict()
+        self._sources: dict[str, Image.Image] = {} #key -> image its fitted sizes were made from
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, k: tuple):
+        entry = self._entries.get(k)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(k)
+        self.hits += 1
+        return entry[0], entry[1]
+
+    def put(self, k: tuple, img: Image.Image, photo: ImageTk.PhotoImage | None) -> None:
+        #The PIL copy and the Tk photo both hold a full RGBA buffer
+        cost = img.width * img.height * 4 * (2 if photo is not None else 1)
+        old = self._entries.pop(k, None)
+        if old is not None:
+            self.size_bytes -= old[2]
+        if cost > self.max_bytes:
+            return
+        self._entries[k] = (img, photo, cost)
+        self.size_bytes += cost
+        while self.size_bytes > self.max_bytes:
+            _, (_, _, freed) = self._entries.popitem(last=False)
+            self.size_bytes -= freed
+
+    def track(self, key: str, img: Image.Image) -> None:
+        """Drop the fitted sizes of key only when the image behind it changed, not when another frame loads it again."""
+        if self._sources.get(key) is not img:
+            self._sources[key] = img
+            self.discard(key)
+
+    def discard(self, key: str) -> None:
+        for k in [k for k in self._entries if k[0] == key]:
+            self.size_bytes -= self._entries.pop(k)[2]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.size_bytes = 0
+
 class ScreenImage(ttk.Frame):
+    #Shared by every ScreenImage so a new CourtFrame reuses sizes an earlier one already fitted
+    resized = ResizeCache(RESIZE_CACHE_MB * 1024 * 1024)
+
     def __init__(self, parent):
         super().__init__(parent)
         self.canvas = tk.Canvas(self, highlightthickness=0, bg="#230F1A")
         self.canvas.pack(fill="both", expand=True)
 
         self.images: dict[str, Image.Image] = {}
+        self.sources: dict[str, Path] = {}
         self._photo: ImageTk.PhotoImage | None = None
         self._current_key: str | None = None
         self._last_size: tuple[int, int] = (0, 0)
         self._image_id: int | None = None
+        self._final_job: str | None = None
+        self._view_sig = None #(draw_info, canvas size) last announced through <<ViewChanged>>
+        #Milliseconds spent in the last preview/final render, for profiling resize smoothness
+        self.render_timing: dict[str, float] = {"preview_ms": 0.0, "final_ms": 0.0}
+        #Zoom is relative to the fitted size, view_center is the image point (0-1) kept at the canvas center
+        self.zoom = 1.0
+        self.view_center = (0.5, 0.5)
+        self._pan_anchor: tuple[int, int] | None = None
 
         self.load_image("start", "dv_start_screen.png")
         self.load_image("court_light", "court_light_mode.png")
@@ -31,14 +96,11 @@ class ScreenImage(ttk.Frame):
 
     def load_image(self, key: str, filename: str) -> None:
         path = SCREEN_IMAGES_DIR / filename
-        try:
-            if path.exists():
-                with Image.open(path) as im:
-                    self.images[key] = im.convert("RGBA").copy()
-            else:
-                print(f"[ScreenImage] Missing file: {path}")
-        except Exception as e:
-            print(f"[ScreenImage] Failed to load {path}: {e}")
+        img = asset_registry.get_image(path)
+        if img is not None:
+            self.images[key] = img
+            self.sources[key] = path
+            self.resized.track(key, img)
 
     def show(self, key: str) -> None:
         self._current_key = key
@@ -49,9 +111,92 @@ class ScreenImage(ttk.Frame):
         if size != self._last_size:
             self._last_size = size
             if self._current_key:
-                self._render()
+                self._render_progressive()
+
+    def _render_progressive(self) -> None:
+        #Cheap preview while the drag is still producing events, full quality once it settles
+        self._render(preview=True)
+        if self._final_job is not None:
+            self.after_cancel(self._final_job)
+        self._final_job = self.after(RESIZE_DEBOUNCE_MS, self._render_final)
+
+    def enable_zoom(self) -> None:
+        c = self.canvas
+        c.bind("<Control-MouseWheel>", lambda e: self._on_zoom_wheel(e, 1 if e.delta > 0 else -1))
+        c.bind("<Control-Button-4>", lambda e: self._on_zoom_wheel(e, 1))
+        c.bind("<Control-Button-5>", lambda e: self._on_zoom_wheel(e, -1))
+        c.bind("<ButtonPress-2>", self._on_pan_start)
+        c.bind("<B2-Motion>", self._on_pan_drag)
+        c.bind("<ButtonRelease-2>", self._on_pan_end)
+        c.bind("<Double-Button-2>", lambda e: (self.reset_view(), "break")[1])
+
+    def _on_zoom_wheel(self, event, direction: int):
+        self.zoom_at(event.x, event.y, ZOOM_STEP if direction > 0 else 1 / ZOOM_STEP)
+        return "break"
+
+    def _on_pan_start(self, event):
+        self._pan_anchor = (event.x, event.y)
+        return "break"
+
+    def _on_pan_drag(self, event):
+        if self._pan_anchor is not None:
+            ax, ay = self._pan_anchor
+            self._pan_anchor = (event.x, event.y)
+            self.pan_by(event.x - ax, event.y - ay)
+        return "break"
+
+    def _on_pan_end(self, event):
+        self._pan_anchor = None
+        if self._final_job is None:
+            self._render()
+        return "break"
+
+    def zoom_at(self, cx: float, cy: float, factor: float) -> None:
+        """Zoom by factor while keeping the image point under canvas (cx, cy) where it is."""
+        if not self._draw_info or self._draw_info[6] != "contain":
+            return
+        new_zoom = min(ZOOM_MAX, max(1.0, self.zoom * factor))
+        if new_zoom == self.zoom:
+            return
+        draw_x, draw_y, draw_w, draw_h = self._draw_info[:4]
+        ux, uy = (cx - draw_x) / draw_w, (cy - draw_y) / draw_h
+        cw, ch = max(self.canvas.winfo_width(), 1), max(self.canvas.winfo_height(), 1)
+
+        k = new_zoom / self.zoom
+        self.zoom = new_zoom
+        new_w, new_h = draw_w * k, draw_h * k
+        #Solve for the view center that puts (ux, uy) back under the cursor
+        self.view_center = (ux + (cw / 2 - cx) / new_w, uy + (ch / 2 - cy) / new_h)
+        self._render_progressive()
+
+    def pan_by(self, dx: float, dy: float) -> None:
+        if not self._draw_info or self.zoom <= 1.0:
+            return
+        draw_w, draw_h = self._draw_info[2:4]
+        vx, vy = self.view_center
+        self.view_center = (vx - dx / draw_w, vy - dy / draw_h)
+        self._render(preview=True)
+
+    def reset_view(self) -> None:
+        self.zoom = 1.0
+        self.view_center = (0.5, 0.5)
+        if self._current_key:
+            self._render()
+
+    def viewport(self) -> tuple[int, int, int, int] | None:
+        """Canvas rectangle (x0, y0, x1, y1) where the image is actually visible."""
+        if not self._draw_info:
+            return None
+        draw_x, draw_y, draw_w, draw_h = self._draw_info[:4]
+        cw, ch = max(self.canvas.winfo_width(), 1), max(self.canvas.winfo_height(), 1)
+        return max(0, draw_x), max(0, draw_y), min(cw, draw_x + draw_w), min(ch, draw_y + draw_h)
+
+    def _render_final(self) -> None:
+        self._final_job = None
+        self._render()
+        self.canvas.event_generate("<<RenderTimed>>", when="tail")
 
-    def _fit_image(self, src, target_width, target_height, mode="contain"):
+    def _fit_image(self, src, target_width, target_height, mode="contain", resample=Image.LANCZOS):
         iw, ih = src.size
         if mode == "cover":
             target_ar = target_width / target_height
@@ -65,26 +210,49 @@ class ScreenImage(ttk.Frame):
                 top = (ih - new_height) // 2
                 box = (0, top, iw, top + new_height)
             src = src.crop(box)
-            return src.resize((target_width, target_height), Image.LANCZOS)
+            return src.resize((target_width, target_height), resample)
         scale = min(target_width / iw, target_height / ih)
         d_width, d_height = max(1, int(iw*scale)), max(1, int(ih*scale))
-        return src.resize((d_width, d_height), Image.LANCZOS)
+        return src.resize((d_width, d_height), resample)
 
-    def _render(self) -> None:
+    def _render(self, preview: bool = False) -> None:
         if not self._current_key:
             return
+        started = time.perf_counter()
         src = self.images.get(self._current_key)
         if src is None:
             self.canvas.delete("all")
             self._photo = None
             self._image_id = None
+            self._view_sig = None
             return
 
         cw = max(self.canvas.winfo_width(),1)
         ch = max(self.canvas.winfo_height(),1)
 
         mode = "cover" if self._current_key == "start" else "contain"
-        img = self._fit_image(src, cw, ch, mode=mode)
+        if mode == "contain" and self.zoom > 1.0:
+            self._render_zoomed(src, cw, ch, preview)
+            self.render_timing["preview_ms" if preview else "final_ms"] = (time.perf_counter() - started) * 1000.0
+            return
+
+        cache_key = (self._current_key, cw, ch, mode)
+        cached = self.resized.get(cache_key)
+        if cached is not None:
+            img, photo = cached
+        else:
+            #Start from the nearest pre-scaled level so the resample only covers the last step
+            path = self.sources.get(self._current_key)
+            levels = image_pyramid.load_levels(path) if path is not None else []
+            base = image_pyramid.pick_level(src, levels, cw, ch, mode)
+            if preview:
+                #Preview frames are throwaway - keep them out of the cache
+                img = self._fit_image(base, cw, ch, mode=mode, resample=Image.BILINEAR)
+                photo = ImageTk.PhotoImage(img)
+            else:
+                img = self._fit_image(base, cw, ch, mode=mode)
+                photo = ImageTk.PhotoImage(img)
+                self.resized.put(cache_key, img, photo)
 
         iw, ih = img.size
         x = (cw - iw) // 2
@@ -97,12 +265,47 @@ class ScreenImage(ttk.Frame):
             mode
         )
 
-        self._photo = ImageTk.PhotoImage(img)
+        self._place(photo, x, y)
+        self.render_timing["preview_ms" if preview else "final_ms"] = (time.perf_counter() - started) * 1000.0
+
+    def _place(self, photo, x: int, y: int) -> None:
+        self._photo = photo
         if self._image_id is None:
             self._image_id = self.canvas.create_image(x, y, anchor="nw", image=self._photo)
         else:
             self.canvas.coords(self._image_id, x, y)
             self.canvas.itemconfigure(self._image_id, image=self._photo)
+        #The LANCZOS pass after a preview lands in the same place - only announce real moves
+        sig = (self._draw_info, self.canvas.winfo_width(), self.canvas.winfo_height())
+        if sig != self._view_sig:
+            self._view_sig = sig
+            self.canvas.event_generate("<<ViewChanged>>", when="tail")
+
+    def _render_zoomed(self, src, cw: int, ch: int, preview: bool) -> None:
+        #draw_info keeps describing the whole (virtual) zoomed image so canvas_to_image/image_to_canvas stay exact;
+        #only the part that falls inside the canvas is resampled
+        scale = min(cw / src.width, ch / src.height) * self.zoom
+        full_w, full_h = max(1, int(src.width * scale)), max(1, int(src.height * scale))
+
+        vx, vy = self.view_center
+        x = round(cw / 2 - vx * full_w)
+        y = round(ch / 2 - vy * full_h)
+        x = min(0, max(cw - full_w, x)) if full_w > cw else (cw - full_w) // 2
+        y = min(0, max(ch - full_h, y)) if full_h > ch else (ch - full_h) // 2
+        self.view_center = ((cw / 2 - x) / full_w, (ch / 2 - y) / full_h)
+        self._draw_info = (x, y, full_w, full_h, src.width, src.height, "contain")
+
+        vx0, vy0, vx1, vy1 = self.viewport()
+        path = self.sources.get(self._current_key)
+        levels = image_pyramid.load_levels(path) if path is not None else []
+        base = image_pyramid.pick_level(src, levels, full_w, full_h)
+        kx, ky = base.width / full_w, base.height / full_h
+        box = ((vx0 - x) * kx, (vy0 - y) * ky, (vx1 - x) * kx, (vy1 - y) * ky)
+        img = base.resize(
+            (max(1, vx1 - vx0), max(1, vy1 - vy0)),
+            Image.BILINEAR if preview else Image.LANCZOS, box=box,
+        )
+        self._place(ImageTk.PhotoImage(img), vx0, vy0)
 
    
     def get_current_image(self):
@@ -1,21 +1,30 @@
 import json 
 import csv
 import tkinter as tk
-import os 
 import uuid
 from datetime import datetime, date
 from tkinter import ttk, filedialog, messagebox
-from PIL import Image, ImageTk, ImageDraw
+from PIL import Image, ImageTk
 from pathlib import Path
 
 from src.user_interface.court_canvas import ScreenImage
+from src.user_interface.marker_layer import MarkerLayer, MARKER_RADIUS
+from src.shot_chart import ChartOptions, render_shot_chart
 from src.user_interface.player_dialogs import confirm, info, resolve, confirm_action, shots_assigned
 from src.user_interface.modals import (add_player_dialog as add_player_modal, rename_team_dialog, manage_teams_modal, manage_players_dialog,
                                        shot_result_dialog, dunk_or_layup_dialog, choose_one_dialog, free_throw_reason_dialog)
-from src.application_logic.zoning import resolve_zone
+from src.application_logic.zoning import resolve_zone_id
 from src.application_logic.zoning_configuration import shot_distance_from_hoop 
+from src.application_logic.distance_raster import get_distance_raster
+from src.application_logic.zone_registry import get_registry, short_label
+from src.application_logic.shot_index import ShotGrid, PlayerShotIndex
+from src.application_logic.shot_store import Shot, ShotStore
+from src.application_logic.shot_stats import StatsAccumulator, ShotTally, shot_points
+from src.application_logic.snap_map import snap_zone_id
+from src.application_logic.heatmap import ShotHeatmap, METRICS as HEATMAP_METRICS
+from src.application_logic.zone_overlay import ZoneChoropleth, get_zone_masks
 from session_data import team_store as TS
-from src import config
+from src import config, asset_registry
 from session_data.game_io import write_game, safe_read_game
 from project import slugify, next_save_path
 
@@ -41,39 +50,33 @@ MODE = {
     }}
 
 SCHEMA_VERSION = "dv_shots_v1"
+OVERLAY_LABELS = {**HEATMAP_METRICS, "zones": "Zone FG%"}
 MAKE_TOKENS = {"make", "and1_make"}
 
 def short_zone(label: str) -> str:
     if not label: 
         return "-"
-    base, sep, suffix = label.partition(" - ")
-    repl = {
-        "Left": "L",
-        "Right": "R",
-        "Outside": "Outside",
-        "Wing": "Wing",
-        "Corner": "Corner",
-        "Top of Key": "Top of Key",
-        "High Post": "High Post",
-        "Low Post": "Low Post",
-        "Free Throw": "FT Line",
-        "Above Break": "AB",
-    }
-    for k, v in repl.items():
-        base = base.replace(k, v)
-    return base + (f" - {suffix}" if sep else "")
+    z = get_registry().by_name.get(label)
+    return z.short if z is not None else short_label(label)
 
-def _points_from_zone(result: str, zone_name: str) -> int:
-    """Infer points using only result + zone label (e.g., 'Right Slot - 3', 'Free Throw Line - 1')."""
+def _points_from_zone(result: str, zone) -> int:
+    """Infer points using only result + registry zone (e.g., 'Right Slot - 3' -> 3, 'Free Throw Line' -> 1)."""
     if str(result).strip().lower() not in MAKE_TOKENS:
         return 0
-    z = str(zone_name or "").strip().lower()
-    if "free throw line" in z:
-        return 1
-    if z.endswith("- 3"):
-        return 3
+    if zone is not None and zone.points in (1, 3):
+        return zone.points
     return 2
 
+def _set_if_changed(var: tk.Variable, value) -> bool:
+    #A Tk variable .set() fires its traces and redraws every bound widget even when the value is unchanged
+    try:
+        if var.get() == value:
+            return False
+    except tk.TclError:
+        pass
+    var.set(value)
+    return True
+
 def _truthy(x) -> bool:
     if isinstance(x, bool):
         return x
@@ -92,7 +95,11 @@ class CourtFrame(ttk.Frame):
         self.quarter=tk.StringVar(value="Q1")
         self.actions=[]
         self.redo_stack=[]
-        self.data_points=[]
+        self.data_points = ShotStore()
+        self.shot_index = ShotGrid()
+        self.player_shots = PlayerShotIndex()
+        self.stats = StatsAccumulator()
+        self._stats_job: str | None = None
         self.team_order=["home","away"]
 
         self._last_save_dir: Path | None = None
@@ -134,6 +141,7 @@ class CourtFrame(ttk.Frame):
         self.topbar=TopBar(
             self, 
             on_toggle_mode=self.toggle_mode,
+            on_cycle_overlay=self.cycle_overlay,
             on_home_button=self.home_button,
             on_undo_action=self.undo_action,
             on_redo_action=self.redo_action,
@@ -159,9 +167,28 @@ class CourtFrame(ttk.Frame):
 
         c = self.center_canvas.canvas
         self._shot_markers: list[dict] = []
+        self._marker_seq = 0
+        #Past RASTER_MARKER_THRESHOLD shots the markers are painted into one overlay image instead of canvas items
+        self._marker_layer = MarkerLayer()
+        self._raster_markers = False
+        self._marker_layer_item: int | None = None
+        self._marker_layer_photo: ImageTk.PhotoImage | None = None
+
+        #Court overlay cycled from the TopBar: None (off), a heatmap metric or the zone FG% choropleth
+        self.overlay_modes: list[str | None] = [None, *OVERLAY_LABELS]
+        self.overlay_mode: str | None = None
+        self.heatmap: ShotHeatmap | None = None
+        self.choropleth: ZoneChoropleth | None = None
+        self._overlay_item: int | None = None
+        self._overlay_photo: ImageTk.PhotoImage | None = None
         
         c.bind("<Button-1>", self._on_canvas_click, add="+")     
-        c.bind("<Configure>", lambda e: self.after_idle(self._reposition_markers), add="+")
+        c.bind("<Button-3>", self._on_canvas_right_click, add="+")
+        #ScreenImage announces every resize, zoom and pan that moves the court, so markers follow <<ViewChanged>> only
+        c.bind("<<ViewChanged>>", lambda e: self._reposition_markers(), add="+")
+        if config.SHOW_RENDER_TIMING:
+            c.bind("<<RenderTimed>>", lambda e: self._show_render_timing(), add="+")
+        self.center_canvas.enable_zoom()
 
         self.databar = DataBar(self, controller=self)
         self.databar.grid(row=1, column=2, sticky="ns")
@@ -172,19 +199,37 @@ class CourtFrame(ttk.Frame):
         self.after_idle(self.update_mode)
         self.refresh_stats()   
 
+    def _show_render_timing(self):
+        t = self.center_canvas.render_timing
+        self.set_status(f"Court render: preview {t['preview_ms']:.0f} ms, final {t['final_ms']:.0f} ms")
+
     def _reposition_markers(self):
         if getattr(self.center_canvas, "_draw_info", None) is None: 
             self.after_idle(self._reposition_markers)
             return
         
         c = self.center_canvas.canvas
-        r = 4
-        for m in self._shot_markers:
-            pos = self.center_canvas.image_to_canvas(m["ix"], m["iy"])
-            if not pos: 
-                continue 
-            cx, cy = pos 
-            c.coords(m["id"], cx - r, cy - r, cx + r, cy + r)
+        if self.overlay_mode is not None:
+            self._show_overlay()
+        if self._raster_markers:
+            self._show_marker_layer()
+        else:
+            #Markers outside the zoomed viewport are culled - their items are dropped and recreated on the way back in
+            r = MARKER_RADIUS
+            for m in self._shot_markers:
+                pos = self.center_canvas.image_to_canvas(m["ix"], m["iy"])
+                if not pos:
+                    continue
+                if not self._in_viewport(*pos):
+                    if m.get("item") is not None:
+                        c.delete(m["item"])
+                        m["item"] = None
+                    continue
+                if m.get("item") is None:
+                    self._create_marker_item(m)
+                    continue
+                cx, cy = pos 
+                c.coords(m["item"], cx - r, cy - r, cx + r, cy + r)
 
         c.tag_raise("shot_marker")
 
@@ -226,10 +271,63 @@ class CourtFrame(ttk.Frame):
             "shot": "Shot",                                                              
             "add_player": "Add Player",                                                  
             "remove_player": "Remove Player",                                            
+            "delete_shot": "Delete Shot",
         }                                                                                
         base = mapping.get(kind, kind.title())                                           
         return f"{prefix} {base}"
 
+    def _remove_shot(self, point) -> Shot | None:
+        """Take a stored shot (matched by identity, then by value) out of the store and every index over it."""
+        for i in range(len(self.data_points) - 1, -1, -1):
+            if self.data_points[i] is point or self.data_points[i] == point:
+                removed = self.data_points.pop(i)
+                self.shot_index.remove(removed)
+                self.player_shots.remove(removed)
+                self.stats.remove(removed)
+                self._overlay_update(removed, -1)
+                return removed
+        return None
+
+    def _restore_shot(self, action: dict) -> None:
+        point = action["data"] = self.data_points.append(action.get("data"))
+        self.shot_index.insert(point)
+        self.player_shots.add(point)
+        self.stats.add(point)
+        self._overlay_update(point, 1)
+
+        mm = action.get("marker_meta") or {}
+        ix, iy = mm.get("ix"), mm.get("iy")
+        made = mm.get("made")
+        team = mm.get("team")
+        if None not in (ix, iy) and team is not None and made is not None:
+            marker = self._draw_marker(ix, iy, made=made, team=team)
+            if marker:
+                action["marker_id"] = marker["id"]
+
+    def _marker_for(self, shot) -> dict | None:
+        key = (shot.get("x"), shot.get("y"), shot.get("team"), bool(shot.get("made")))
+        return next((m for m in reversed(self._shot_markers)
+                     if (m.get("ix"), m.get("iy"), m.get("team"), bool(m.get("made"))) == key), None)
+
+    def delete_shot(self, shot) -> None:
+        """Remove one recorded shot and its marker as an undoable action."""
+        if not confirm_action("confirm_action", self, action="Delete Shot"):
+            return
+        m = self._marker_for(shot)
+        removed = self._remove_shot(shot)
+        if removed is None:
+            return
+        if m is not None:
+            self._delete_marker(m)
+        self.actions.append({
+            "type": "delete_shot", "data": removed,
+            "marker_meta": {"ix": removed.get("x"), "iy": removed.get("y"),
+                            "made": bool(removed.get("made")), "team": removed.get("team", "home")},
+        })
+        self.redo_stack.clear()
+        self.refresh_stats()
+        self.set_status("Deleted shot.")
+
     def undo_action(self):
         if not self.actions:
             self.set_status("Nothing to Undo.")
@@ -245,23 +343,24 @@ class CourtFrame(ttk.Frame):
 
         if action.get("type") == "shot":
             point = action.get("data")
-            for i in range(len(self.data_points) - 1, -1, -1):
-                if self.data_points[i] is point or self.data_points[i] == point:
-                    self.data_points.pop(i)
-                    break
-
             mid = action.get("marker_id")
-            if mid:
-                try:
-                    self.center_canvas.canvas.delete(mid)
-                except Exception:
-                    pass
-                self._shot_markers = [m for m in self._shot_markers if m.get("id") != mid]
+            m = next((m for m in self._shot_markers if m.get("id") == mid), None) if mid else None
+            removed = self._remove_shot(point)
+            if removed is not None:
+                action["data"] = removed
+                m = m or self._marker_for(removed) #Shot was deleted and restored since - its marker is new
+            if m is not None:
+                self._delete_marker(m)
 
             self.refresh_stats()
             self.set_status("Undid: shot")
             self.center_canvas.canvas.tag_raise("shot_marker")
 
+        elif action.get("type") == "delete_shot":
+            self._restore_shot(action)
+            self.refresh_stats()
+            self.set_status("Undid: Delete Shot")
+
         elif action.get("type") == "add_player":                                       
             team = action["team"]; name = action["name"]; idx = action.get("index")    
             roster = self.rosters.get(team, [])                                        
@@ -288,7 +387,7 @@ class CourtFrame(ttk.Frame):
             for p in action.get("shot_refs", []):
                 try:
                     if p.get("team") == team:
-                        p["player"] = name
+                        self.set_shot_player(p, name)
                 except Exception:
                     pass
 
@@ -320,22 +419,22 @@ class CourtFrame(ttk.Frame):
         self.actions.append(action)
 
         if action.get("type") == "shot":
-            point = action.get("data")
-            self.data_points.append(point)
-
-            mm = action.get("marker_meta") or {}
-            ix, iy = mm.get("ix"), mm.get("iy")
-            made = mm.get("made")
-            team = mm.get("team")
-            if None not in (ix, iy) and team is not None and made is not None:
-                marker = self._draw_marker(ix, iy, made=made, team=team)
-                if marker:
-                    action["marker_id"] = marker["id"]
-
+            self._restore_shot(action)
             self.refresh_stats()
             self.set_status("Redid: shot")
             self.center_canvas.canvas.tag_raise("shot_marker")
 
+        elif action.get("type") == "delete_shot":
+            point = action.get("data")
+            m = self._marker_for(point)
+            removed = self._remove_shot(point)
+            if removed is not None:
+                action["data"] = removed
+            if m is not None:
+                self._delete_marker(m)
+            self.refresh_stats()
+            self.set_status("Redid: Delete Shot")
+
         elif action.get("type") == "add_player":                                       
             team = action["team"]; name = action["name"]; idx = action.get("index")    
             roster = self.rosters.get(team, [])
@@ -363,7 +462,7 @@ class CourtFrame(ttk.Frame):
             for p in action.get("shot_refs", []):
                 try:
                     if p.get("team") == team: 
-                        p["player"] = "Unassigned"
+                        self.set_shot_player(p, "Unassigned")
                 except Exception: 
                     pass
 
@@ -456,6 +555,7 @@ class CourtFrame(ttk.Frame):
                 timestamp_fallback=True,
                 max_n=9999,
             )
+        self.flush_stats() #Scores are saved from the Tk variables
         try:
             write_game(dest, self)
             self._last_save_dir = dest.parent
@@ -523,18 +623,14 @@ class CourtFrame(ttk.Frame):
         for k in ("home", "away"):
             self.rosters[k] = list(rosters.get(k, self.rosters[k]))
 
-        self.data_points = list(data.get("shots", []) or [])
+        self.data_points = ShotStore(data.get("shots", []) or [])
+        self._reindex_shots()
 
         h = data.get("history", {}) or {}
         self.actions = list(h.get("actions", []))
         self.redo_stack = list(h.get("redo_stack", []))
         
-        for m in getattr(self, "_shot_markers", []):
-            try: 
-                self.center_canvas.canvas.delete(m["id"])
-            except Exception: 
-                pass
-        self._shot_markers = []
+        self._clear_markers()
 
         self.update_mode()
         self.after_idle(self._redraw_all_markers)
@@ -619,55 +715,35 @@ class CourtFrame(ttk.Frame):
                     used.add(i)
                     break
 
-    def apply_loaded_state(self, state: dict):
-        try:
-            self.game_date = state.get("game_date")
-            self.game_location = state.get("game_location")
-            self.mode = state.get("mode", "dark")
-            self.quarter.set(state.get("quarter", "Q1"))
-            self.actions = state.get("actions", [])
-            self.redo_stack = state.get("redo_stack", [])
-            self.data_points = state.get("data_points", [])
-            self.team_order = state.get("team_order", ["home", "away"])
-            for k, name in state.get("team_names", {}).items():
-                if k in self.team_names:
-                    self.team_names[k].set(name)
-            self.rosters = state.get("rosters", {"home": list(DEFAULT_ROSTER), "away": list(DEFAULT_ROSTER)})
-
-            self._shot_markers.clear()
-            self.center_canvas.show(MODE[self.mode]["image"])
-            for p in self.data_points:
-                ix, iy = p.get("x"), p.get("y")
-                made, team = p.get("made"), p.get("team")
-                if ix is not None and iy is not None and team:
-                    self._draw_marker(ix, iy, made=made, team=team)
-
-            self.refresh_stats()
-            self.set_status("Session restored.")
-        except Exception as e:
-            self.set_status(f"Failed to restore: {e}")
-
-
     def reset_game(self):
         if not confirm("confirm_reset", self):
             return    
         self.actions.clear()
         self.redo_stack.clear()
         self.data_points.clear()
+        self._reindex_shots()
         self.center_canvas.show(MODE[self.mode]["image"])
         self.refresh_stats()
         self.set_status("Reset.")
+        self._clear_markers()
 
-        for m in getattr(self, "_shot_markers", []):
-            try: 
-                self.center_canvas.canvas.delete(m["id"])
-            except Exception:
-                pass
-        self._shot_markers.clear()
 
+    def _export_shots(self) -> list[dict]:
+        """Plain copies of every shot, read column-wise from the store; missing player ids are assigned first."""
+        store = getattr(self, "data_points", None)
+        if not store:
+            return []
+        if not isinstance(store, ShotStore):
+            return list(store)
+        for i, (team, name, pid) in enumerate(zip(store.column("team"), store.column("player"), store.column("player_id"))):
+            if name and not pid:
+                store[i]["player_id"] = self._player_ids.setdefault((team, name), str(uuid.uuid4()))
+        return store.to_dicts()
 
     def _normalize_shot_for_export(self, s: dict, *, export_timestamp: str, game_id: str) -> dict:
         zone_name = s.get("zone") or s.get("zone_name") or "" 
+        registry = get_registry()
+        zone = registry.zone_for(s) or registry.by_name.get(zone_name)
        
         shot_result = (s.get("result") or s.get("shot_result") or "").strip().lower()
         if not shot_result: 
@@ -678,7 +754,7 @@ class CourtFrame(ttk.Frame):
 
         shot_points = s.get("shot_points")
         if shot_points in (None, ""):
-            shot_points = _points_from_zone(shot_result, zone_name)
+            shot_points = _points_from_zone(shot_result, zone)
         try:
             shot_points = int(shot_points)
         except Exception:
@@ -730,7 +806,7 @@ class CourtFrame(ttk.Frame):
 
         ft_bool = s.get("free_throw_bool")
         if ft_bool is None:
-            ft_bool = "free throw line" in str(zone_name).strip().lower()
+            ft_bool = zone is not None and zone.is_free_throw
         else:
             ft_bool = _truthy(ft_bool)
 
@@ -751,20 +827,18 @@ class CourtFrame(ttk.Frame):
             shot_type = "Free Throw"
         elif raw_shot_type:
             shot_type = raw_shot_type
+        elif zone is not None and zone.is_dunk:
+            shot_type = "Dunk"
         else:
-            zlow = str(zone_name).strip().lower()
-            if "dunk" in zlow:
-                shot_type = "Dunk"
-            elif "layup" in zlow:
-                shot_type = "Layup"
-            else:
-                shot_type = "Field Goal"
+            shot_type = "Field Goal"
 
         shot_type = (s.get("shot_type") or shot_type or "Field Goal")
 
         distance_ft = s.get("distance_ft")
         if distance_ft in (None, ""):
             distance_ft = s.get("r_ft", "")
+        if distance_ft in (None, "") and isinstance(s.get("x"), int) and isinstance(s.get("y"), int):
+            distance_ft = get_distance_raster().distance_at(s["x"], s["y"]) #Older saves without r_ft
         try:
             distance_ft = float(distance_ft) if distance_ft not in (None, "") else None
         except Exception:
@@ -869,41 +943,22 @@ class CourtFrame(ttk.Frame):
                 max_n=9999,
             )
 
-        self.update_idletasks()
-        self.center_canvas.update()
-
+        #Same renderer as batch jobs - only the output size comes from the canvas (fit-to-window, whatever the zoom)
+        di = self.center_canvas.get_draw_info()
+        options = ChartOptions(theme=self.mode)
+        if di:
+            zoom = getattr(self.center_canvas, "zoom", 1.0)
+            options = ChartOptions(
+                width=max(1, round(di[2] / zoom)), height=max(1, round(di[3] / zoom)), theme=self.mode,
+            )
         try:
-            src = self.center_canvas.get_current_image()
-            di  = self.center_canvas.get_draw_info()
-
-        except Exception:
-            src, di = None, None
-
-        if src is None or not di:
+            base = render_shot_chart({"shots": self.data_points}, options)
+        except FileNotFoundError:
             messagebox.showerror("Export Failed",
                                 "Couldn't locate the base court image to render.")
             self.set_status("Export failed.")
             return
 
-        draw_x, draw_y, draw_w, draw_h, src_w, src_h, _mode = di
-        base = src.resize((draw_w, draw_h), Image.LANCZOS).convert("RGBA")
-        draw = ImageDraw.Draw(base)
-
-        r = 4
-        
-        for m in getattr(self, "_shot_markers", []):
-            ix = m.get("ix"); iy = m.get("iy")
-            if ix is None or iy is None:
-                continue
-            cx = ( (ix + 0.5) / max(1, src_w) ) * draw_w
-            cy = ( (iy + 0.5) / max(1, src_h) ) * draw_h
-
-            fill = "#3F704D" if m.get("made") else "#960018"
-            if m.get("team") == "home":
-                draw.ellipse((cx - r, cy - r, cx + r, cy + r), fill=fill)
-            else:
-                draw.rectangle((cx - r, cy - r, cx + r, cy + r), fill=fill)
-
         try:
             base.save(dest, format="PNG")
             # remember where/how the user saved
@@ -943,7 +998,8 @@ class CourtFrame(ttk.Frame):
                 width=3, start=1, create_dir=True, timestamp_fallback=True, max_n=9999
             )    
 
-        shots = list(getattr(self, "data_points", []) or [])
+        self.flush_stats()
+        shots = self._export_shots()
 
         export_timestamp = datetime.now().isoformat(timespec="seconds")
         game_date        = getattr(self, "game_date", "") or getattr(self, "session_date", "")
@@ -1037,7 +1093,7 @@ class CourtFrame(ttk.Frame):
                 width=3, start=1, create_dir=True, timestamp_fallback=True, max_n=9999
             )  
 
-        shots = list(getattr(self, "data_points", []) or [])
+        shots = self._export_shots()
 
         export_timestamp = datetime.now().isoformat(timespec="seconds")
         game_date        = getattr(self, "game_date", "") or getattr(self, "session_date", "")
@@ -1213,28 +1269,148 @@ class CourtFrame(ttk.Frame):
 
         self.set_status(f"Team Renamed: {current} → {new_name}")
 
+    def _reindex_shots(self):
+        self.shot_index.rebuild(self.data_points)
+        self.player_shots.rebuild(self.data_points)
+        self.stats.rebuild(self.data_points)
+        self.heatmap = None
+        self.choropleth = None
+        if self.overlay_mode is not None:
+            self.after_idle(self._show_overlay)
+
+    def cycle_overlay(self):
+        i = self.overlay_modes.index(self.overlay_mode)
+        self.overlay_mode = self.overlay_modes[(i + 1) % len(self.overlay_modes)]
+        self._show_overlay()
+        label = OVERLAY_LABELS.get(self.overlay_mode, "Off")
+        self.set_status(f"Overlay: {label}")
+
+    def _ensure_heatmap(self) -> ShotHeatmap | None:
+        if self.heatmap is None:
+            src = self.center_canvas.get_current_image()
+            if src is None:
+                return None
+            hm = ShotHeatmap(src.width, src.height)
+            store = self.data_points
+            xs, ys, made = store.column("x"), store.column("y"), store.column("made")
+            keep = [i for i in range(len(store)) if xs[i] is not None and ys[i] is not None]
+            hm.add_many(
+                [xs[i] for i in keep], [ys[i] for i in keep],
+                [bool(made[i]) for i in keep], [shot_points(store[i]) for i in keep],
+            )
+            self.heatmap = hm
+        return self.heatmap
+
+    def _ensure_choropleth(self) -> ZoneChoropleth:
+        if self.choropleth is None:
+            chor = ZoneChoropleth(get_zone_masks())
+            chor.set_counts({
+                z.id: (made, att) for made, att, z in self.stats.total.zones.values() if z is not None
+            })
+            self.choropleth = chor
+        return self.choropleth
+
+    def _overlay_update(self, point: dict, sign: int):
+        #Only the bin / zone under the shot changes - cached layers are patched, not rebuilt
+        made = bool(point.get("made"))
+        if self.heatmap is not None and point.get("x") is not None and point.get("y") is not None:
+            if sign > 0:
+                self.heatmap.add(point["x"], point["y"], made, shot_points(point))
+            else:
+                self.heatmap.remove(point["x"], point["y"], made, shot_points(point))
+        if self.choropleth is not None:
+            zone = get_registry().zone_for(point)
+            if zone is not None:
+                self.choropleth.adjust(zone.id, made, sign)
+        if self.overlay_mode is not None:
+            self._show_overlay()
+
+    def _show_overlay(self):
+        c = self.center_canvas.canvas
+        info = getattr(self.center_canvas, "_draw_info", None)
+        if self.overlay_mode is None or info is None:
+            if self._overlay_item is not None:
+                c.itemconfigure(self._overlay_item, state="hidden")
+            return
+
+        overlay = self._overlay_image(self.overlay_mode)
+        if overlay is None:
+            return
+        small, px_per_cell = overlay
+        x, y, draw_w, draw_h, src_w, src_h, _ = info
+        vx0, vy0, vx1, vy1 = self.center_canvas.viewport()
+        #Crop the visible part straight out of the small overlay while scaling it up
+        sx, sy = src_w / draw_w / px_per_cell, src_h / draw_h / px_per_cell
+        box = ((vx0 - x) * sx, (vy0 - y) * sy, (vx1 - x) * sx, (vy1 - y) * sy)
+        img = small.resize((max(1, vx1 - vx0), max(1, vy1 - vy0)), Image.NEAREST, box=box)
+
+        self._overlay_photo = ImageTk.PhotoImage(img)
+        if self._overlay_item is None:
+            self._overlay_item = c.create_image(vx0, vy0, anchor="nw", image=self._overlay_photo, tags=("court_overlay",))
+        else:
+            c.coords(self._overlay_item, vx0, vy0)
+            c.itemconfigure(self._overlay_item, image=self._overlay_photo, state="normal")
+        c.tag_raise(self._overlay_item)
+        c.tag_raise("shot_marker")
+
+    def _overlay_image(self, mode: str) -> tuple[Image.Image, float] | None:
+        #Overlay image plus how many court image pixels one of its pixels covers
+        if mode == "zones":
+            info = self.center_canvas.get_draw_info()
+            chor = self._ensure_choropleth()
+            #Cached per drawn size, capped at mask resolution so deep zoom does not allocate huge layers
+            k = min(1.0, info[2] / chor.masks.width)
+            size = (max(1, round(chor.masks.width * k)), max(1, round(chor.masks.height * k)))
+            return chor.layer(size), chor.masks.width / size[0]
+
+        hm = self._ensure_heatmap()
+        if hm is None:
+            return None
+        return hm.layer(mode), hm.cell_px
+
+    def set_shot_player(self, p: dict, player: str):
+        #Shots held only by the undo history (not on the court) just get relabelled
+        if p not in self.player_shots:
+            p["player"] = player
+            return
+        self.player_shots.remove(p)
+        self.stats.reassign(p, player)
+        self.player_shots.add(p)
+
     def refresh_stats(self):
-        if hasattr(self, "databar") and hasattr(self.databar, "refresh_from_points"):
-            self.databar.refresh_from_points(self.data_points)
+        #Marks the stats dirty; every call made during one event-loop turn is served by a single flush when idle
+        if self._stats_job is None:
+            self._stats_job = self.after_idle(self.flush_stats)
+
+    def flush_stats(self):
+        if self._stats_job is not None:
+            self.after_cancel(self._stats_job)
+            self._stats_job = None
+        if hasattr(self, "databar") and hasattr(self.databar, "refresh_from_stats"):
+            self.databar.refresh_from_stats(self.stats)
 
     def record_shot(self, *, team: str, x: int, y: int, 
                     made: bool, airball: bool=False, 
-                    meta: dict|None=None,
+                    meta: Shot|dict|None=None,
                     status_text: str | None=None):
                 
-        point = {
-            "team": team, 
-            "x": int(x), "y": int(y),
-            "made": bool(made), "airball": bool(airball),
-            "quarter": self.quarter.get(),
-        }
+        point = Shot(
+            team=team,
+            x=int(x), y=int(y),
+            made=bool(made), airball=bool(airball),
+            quarter=self.quarter.get(),
+        )
         if meta: point.update(meta)
 
         pn = (meta or {}).get("player")
         pid = self._player_ids.setdefault((team, pn), str(uuid.uuid4()))
         point["player_id"] = pid
 
-        self.data_points.append(point)
+        point = self.data_points.append(point)
+        self.shot_index.insert(point)
+        self.player_shots.add(point)
+        self.stats.add(point)
+        self._overlay_update(point, 1)
         self.actions.append({"type": "shot", "data": point})
         self.redo_stack.clear()
         self.refresh_stats()
@@ -1254,18 +1430,25 @@ class CourtFrame(ttk.Frame):
         
         ix, iy = mapped
         
-        kind, label = resolve_zone(ix, iy)
-        kind_norm = str(kind).lower().replace(" ", "_")
-        zone_lower = (label or "").strip().lower()
+        registry = get_registry()
+        zone = registry.get(resolve_zone_id(ix, iy))
+        if zone is None:
+            self.set_status("Out of Bounds")
+            return
+        #Clicks on a line or a no-click sliver snap to the nearest playable zone within SNAP_RADIUS_FT
+        if zone.kind in ("line", "no_click") and not zone.is_free_throw:
+            snapped = snap_zone_id(ix, iy)
+            if snapped is not None:
+                zone = registry[snapped]
+        kind, label = zone.kind, zone.name
       
-        is_dunk_zone = (kind_norm in {"dunk_zone", "dunk"} or "dunk" in zone_lower)  
-        is_free_throw = (kind_norm in {"free_throw", "free_throw_line"}            
-                         or "free throw" in zone_lower)                             
+        is_dunk_zone = zone.is_dunk
+        is_free_throw = zone.is_free_throw
 
-        if kind_norm == "no_click" and not is_free_throw: 
+        if kind == "no_click" and not is_free_throw: 
             self.set_status(f"{label} - not a playable zone.")
             return 
-        if kind_norm in ("out_of_bounds", "unknown"):
+        if kind == "unknown":
             self.set_status(label)
             return 
         
@@ -1338,11 +1521,11 @@ class CourtFrame(ttk.Frame):
         f"(Q{self.quarter.get()[-1]}){tail}"
         )
 
-        meta = {
-            "player": player_name, "zone": label,
-            "zone_key": str(kind),
-            "r_ft": r_ft, "dx_ft": dx_ft, "dy_ft": dy_ft,
-        }
+        meta = Shot(
+            player=player_name, zone=label,
+            zone_id=zone.id, zone_key=str(kind),
+            r_ft=r_ft, dx_ft=dx_ft, dy_ft=dy_ft,
+        )
         if not is_free_throw and and1:
             meta["and1"] = True
         if shot_kind: 
@@ -1370,55 +1553,186 @@ class CourtFrame(ttk.Frame):
         except Exception:
             pass
              
-    def _draw_marker(self, ix: int, iy: int, *, made:bool, team: str):
-        pos = self.center_canvas.image_to_canvas(ix, iy)
-        if not pos: 
+    def _on_canvas_right_click(self, event):
+        mapped = self.center_canvas.canvas_to_image(event.x, event.y)
+        info = getattr(self.center_canvas, "_draw_info", None)
+        if mapped is None or info is None:
+            return
+
+        #Hit radius is the marker size on screen, converted to image pixels
+        _, _, iw, _, src_w, _, _ = info
+        radius = 6 * (src_w / iw) if iw else 6
+        shot = self.shot_index.nearest(mapped[0], mapped[1], radius)
+        if shot is None:
+            self.set_status("No shot here.")
+            return
+
+        team = shot.get("team", "home")
+        team_name = self.team_names[team].get() if team in self.team_names else team
+        outcome = "Made" if shot.get("made") else ("Airball" if shot.get("airball") else "Missed")
+        bits = [f"{team_name}: {shot.get('player') or 'Unassigned'}", outcome]
+        if shot.get("zone"):
+            bits.append(shot["zone"])
+        if isinstance(shot.get("r_ft"), (int, float)):
+            bits.append(f"{shot['r_ft']:.1f} ft")
+        self.set_status(f"Shot: {' - '.join(bits)} ({shot.get('quarter', '')})")
+
+        menu = tk.Menu(self, tearoff=0)
+        menu.add_command(label="Delete Shot", command=lambda: self.delete_shot(shot))
+        try:
+            menu.tk_popup(event.x_root, event.y_root)
+        finally:
+            menu.grab_release()
+
+    def _draw_marker(self, ix: int, iy: int, *, made:bool, team: str, refresh: bool = True):
+        if getattr(self.center_canvas, "_draw_info", None) is None:
+            return 
+
+        self._marker_seq += 1
+        m = {
+            "id": self._marker_seq, "item": None,
+            "ix": ix, "iy": iy, "made": made, "team": team,
+            "shape": "oval" if team == "home" else "rectangle",
+        }
+        self._shot_markers.append(m)
+
+        if self._raster_markers:
+            self._marker_layer.add(m)
+            if refresh:
+                self._show_marker_layer()
+        else:
+            self._create_marker_item(m)
+            if refresh:
+                self._sync_marker_renderer()
+        return m 
+
+    def _in_viewport(self, cx: float, cy: float) -> bool:
+        vp = self.center_canvas.viewport()
+        if vp is None:
+            return False
+        r = MARKER_RADIUS
+        return vp[0] - r <= cx <= vp[2] + r and vp[1] - r <= cy <= vp[3] + r
+
+    def _create_marker_item(self, m: dict):
+        pos = self.center_canvas.image_to_canvas(m["ix"], m["iy"])
+        if not pos or not self._in_viewport(*pos): 
             return 
        
         cx, cy = pos 
-        r = 4
-        fill = "#3F704D" if made else "#960018"
+        r = MARKER_RADIUS
+        fill = "#3F704D" if m["made"] else "#960018"
 
-        if team == "home": 
+        if m["team"] == "home": 
             cid = self.center_canvas.canvas.create_oval(
                 cx - r, cy - r, cx + r, cy + r, 
                 outline="", fill=fill, 
                 tags=("shot_marker", "home_marker"),    
             )
-            shape = "oval"
         else:       
             cid = self.center_canvas.canvas.create_rectangle(
             cx - r, cy - r, cx + r, cy + r, 
             outline="", fill=fill, 
             tags=("shot_marker", "away_marker")
        )
-            shape = "rectangle"
 
         self.center_canvas.canvas.tag_raise(cid)
-        m = {"id": cid, "ix": ix, "iy": iy, "made": made, "team": team, "shape": shape}
-        self._shot_markers.append(m)
-        return m 
+        m["item"] = cid
+
+    def _delete_marker(self, m: dict):
+        if m.get("item") is not None:
+            try:
+                self.center_canvas.canvas.delete(m["item"])
+            except Exception:
+                pass
+            m["item"] = None
+        self._shot_markers = [other for other in self._shot_markers if other is not m]
+        if self._raster_markers:
+            self._marker_layer.remove(m)
+            self._show_marker_layer()
+        self._sync_marker_renderer()
+
+    def _clear_markers(self):
+        try:
+            self.center_canvas.canvas.delete("shot_marker")
+        except Exception:
+            pass
+        self._marker_layer_item = None
+        self._marker_layer_photo = None
+        self._marker_layer.clear()
+        self._shot_markers = []
+        self._raster_markers = False
+
+    def _sync_marker_renderer(self) -> bool:
+        #Hysteresis so undoing around the threshold does not flip renderers back and forth
+        n = len(self._shot_markers)
+        limit = config.RASTER_MARKER_THRESHOLD
+        want = n >= (limit // 2 if self._raster_markers else limit)
+        if want == self._raster_markers:
+            return False
+
+        self._raster_markers = want
+        c = self.center_canvas.canvas
+        if want:
+            for m in self._shot_markers:
+                if m.get("item") is not None:
+                    c.delete(m["item"])
+                    m["item"] = None
+                self._marker_layer.add(m)
+            self._show_marker_layer()
+        else:
+            self._marker_layer.clear()
+            if self._marker_layer_item is not None:
+                c.itemconfigure(self._marker_layer_item, state="hidden")
+            for m in self._shot_markers:
+                self._create_marker_item(m)
+        c.tag_raise("shot_marker")
+        return True
+
+    def _show_marker_layer(self):
+        info = getattr(self.center_canvas, "_draw_info", None)
+        if info is None:
+            return
+        x, y, draw_w, draw_h, src_w, src_h, _ = info
+        vx0, vy0, vx1, vy1 = self.center_canvas.viewport()
+        layer = self._marker_layer
+        layer.resize(draw_w, draw_h, src_w, src_h, viewport=(vx0 - x, vy0 - y, vx1 - x, vy1 - y))
+        x, y = vx0, vy0
+
+        c = self.center_canvas.canvas
+        photo = self._marker_layer_photo
+        if photo is None or (photo.width(), photo.height()) != layer.image.size:
+            self._marker_layer_photo = ImageTk.PhotoImage(layer.image)
+        else:
+            photo.paste(layer.image)
+
+        if self._marker_layer_item is None:
+            self._marker_layer_item = c.create_image(
+                x, y, anchor="nw", image=self._marker_layer_photo, tags=("shot_marker", "marker_layer")
+            )
+        else:
+            c.coords(self._marker_layer_item, x, y)
+            c.itemconfigure(self._marker_layer_item, image=self._marker_layer_photo, state="normal")
+        c.tag_raise(self._marker_layer_item)
 
     def _redraw_all_markers(self):
         if getattr(self.center_canvas, "_draw_info", None) is None:
             self.after_idle(self._redraw_all_markers)
             return
         
-        for m in getattr(self, "_shot_markers", []):
-            try: 
-                self.center_canvas.canvas.delete(m["id"])
-            except Exception:
-                pass
-        self._shot_markers = []
-
+        self._clear_markers()
         self.center_canvas.show(MODE[self.mode]["image"])
 
-        for p in self.data_points or []:
-            ix, iy = p.get("x"), p.get("y")
-            made = bool(p.get("made"))
-            team = p.get("team")
-            if ix is not None and iy is not None and team in ("home", "away"):
-                self._draw_marker(ix, iy, made=made, team=team)
+        store = self.data_points
+        points = [
+            (x, y, made, team)
+            for x, y, made, team in zip(store.column("x"), store.column("y"), store.column("made"), store.column("team"))
+            if x is not None and y is not None and team in ("home", "away")
+        ]
+        self._raster_markers = len(points) >= config.RASTER_MARKER_THRESHOLD
+        for x, y, made, team in points:
+            self._draw_marker(x, y, made=bool(made), team=team, refresh=False)
+        if self._raster_markers:
+            self._show_marker_layer()
 
         self.center_canvas.canvas.tag_raise("shot_marker")
         self.after_idle(self._reposition_markers)
@@ -1434,6 +1748,7 @@ class TopBar(ttk.Frame):
     def __init__(
             self, parent, 
             on_toggle_mode=None, on_home_button=None,
+            on_cycle_overlay=None,
             on_undo_action=None, on_redo_action=None, 
             on_select_quarter=None,
             on_save_game=None, on_reset_game=None,  
@@ -1448,9 +1763,7 @@ class TopBar(ttk.Frame):
         self.grid_propagate(False)
         self.configure(height = BAR_HEIGHT)
 
-        icon_path = os.path.join(config.ASSETS_DIR, "icons", "dv_app_icon.png")
-        icon_img = Image.open(icon_path).resize((24,24), Image.LANCZOS)
-        self.icon_photo = ImageTk.PhotoImage(icon_img)
+        self.icon_photo = asset_registry.bind_photo(self, config.ICON_PNG, (24, 24))
 
         self.grid_columnconfigure(0, weight=0)
         self.grid_columnconfigure(1, weight=1)
@@ -1462,6 +1775,7 @@ class TopBar(ttk.Frame):
         ttk.Label(left, image=self.icon_photo).grid(row=0, column=0, padx=(0,8))
         ttk.Button(left, text="Home", command=on_home_button or (lambda:None)).grid(row=0, column=1, padx=3)
         ttk.Button(left, text="Theme", command=on_toggle_mode or (lambda:None)).grid(row=0, column=2, padx=3)
+        ttk.Button(left, text="Overlay", command=on_cycle_overlay or (lambda:None)).grid(row=0, column=3, padx=3)
 
         mid=ttk.Frame(self)
         mid.grid(row=0, column=1, sticky = "nsew", pady=6) 
@@ -1686,9 +2000,8 @@ class SideBar(ttk.Frame):
         if old in roles and new not in roles: 
             roles[new] = roles.pop(old)
 
-        for p in self.controller.data_points:
-            if p.get("team") == key and p.get("player") == old:
-                p["player"] = new
+        self.controller.player_shots.rename(key, old, new)
+        self.controller.stats.rename_player(key, old, new)
 
         self.controller.actions.append({
             "type": "rename_player",
@@ -2019,9 +2332,7 @@ class SideBar(ttk.Frame):
         key = self.controller.selected_team_key.get()
         team_label = self.controller.team_names[key].get()
 
-        affected_shots = [
-            p for p in self.controller.data_points                  
-            if p.get("team") == key and p.get("player") == name]  
+        affected_shots = self.controller.player_shots.shots(key, name)
 
         if affected_shots:                                                            
             if not confirm(
@@ -2043,7 +2354,7 @@ class SideBar(ttk.Frame):
 
         if affected_shots:
             for p in affected_shots: 
-                p["player"] = "Unassigned"
+                self.controller.set_shot_player(p, "Unassigned")
 
         try:
             self.controller.rosters[key].remove(name)
@@ -2133,7 +2444,7 @@ class DataBar(ttk.Frame):
         self._sync_heading("home")
         self._sync_heading("away")
 
-        self.refresh_from_points(self.controller.data_points)
+        self.refresh_from_stats(self.controller.stats)
 
     def _make_team_section(self, parent, team_key: str, row: int):
         box = ttk.LabelFrame(parent, text="", padding = 8)
@@ -2172,30 +2483,9 @@ class DataBar(ttk.Frame):
     
     def _sync_heading(self, team_key: str):
         team_name = self.controller.team_names.get(team_key, tk.StringVar(value=team_key.title())).get()
-        self._team_vars[team_key]["heading"].set(f"{team_name} Stats")
-
-    def refresh_from_points(self, points: list[dict]):
-        stats = {
-            "home": {"shots": 0, "made": 0, "missed": 0, "made_dists": [], "miss_dists": []},
-            "away": {"shots": 0, "made": 0, "missed": 0, "made_dists": [], "miss_dists": []},
-        }
-
-        for p in points or []:
-            team = p.get("team")
-            if team not in stats: 
-                continue
+        _set_if_changed(self._team_vars[team_key]["heading"], f"{team_name} Stats")
 
-            s = stats[team]
-            s["shots"] += 1
-            if p.get("made"):
-                s["made"] += 1
-                if "r_ft" in p: 
-                    s["made_dists"].append(p["r_ft"])
-            else: 
-                s["missed"] += 1
-                if "r_ft" in p: 
-                    s["miss_dists"].append(p["r_ft"])
-        
+    def refresh_from_stats(self, stats: StatsAccumulator):
         player_name = None
         team_key_sel = None
 
@@ -2208,99 +2498,45 @@ class DataBar(ttk.Frame):
             except Exception:
                 team_key_sel = None
 
-        def fmt_avg(lst):
-            if lst: 
-                return f"{(sum(lst) / len(lst)):.1f} ft" 
-            return "-"
-    
         if not player_name: 
-            pv = self._player_vars
-            pv["heading"].set("Selected Player:")
-            pv["shots"].set(0); pv["made"].set(0); pv["missed"].set(0)
-            pv["accuracy_fg"].set("-"); pv["avg_made_ft"].set("-"); pv["avg_missed_ft"].set("-")
-            pv["dom_zone"].set("-"); pv["weak_zone"].set("-")
+            values = dict(self._tally_values(None), heading="Selected Player:")
         else: 
-            pshots = [p for p in (points or [])
-                  if p.get("player") == player_name and p.get("team") == team_key_sel]
-
-            shots  = len(pshots)
-            made   = sum(1 for p in pshots if p.get("made"))
-            missed = shots - made
-            made_d   = [p.get("r_ft") for p in pshots if p.get("made") and isinstance(p.get("r_ft"), (int, float))]
-            missed_d = [p.get("r_ft") for p in pshots if not p.get("made") and isinstance(p.get("r_ft"), (int, float))]
-            fg = f"{(made / shots * 100):.1f}%" if shots else "-"
-
             team_label = self.controller.team_names.get(team_key_sel, tk.StringVar(value=team_key_sel.title())).get()
-            dom, weak = self._zone_strength(pshots)
-
-            pv = self._player_vars
-            pv["heading"].set(f"{player_name} ({team_label})")
-            pv["shots"].set(shots)
-            pv["made"].set(made)
-            pv["missed"].set(missed)
-            pv["accuracy_fg"].set(fg)
-            pv["avg_made_ft"].set(fmt_avg(made_d))
-            pv["avg_missed_ft"].set(fmt_avg(missed_d))
-            pv["dom_zone"].set(short_zone(dom))
-            pv["weak_zone"].set(short_zone(weak))
+            values = dict(self._tally_values(stats.player(team_key_sel, player_name)), heading=f"{player_name} ({team_label})")
+        for key, value in values.items():
+            _set_if_changed(self._player_vars[key], value)
 
         for team_key in ("home", "away"): 
-            s = stats[team_key]
-            shots = s["shots"]
-            made = s["made"]
-            missed = s["missed"]
-            pct = f"{(made / shots * 100):.1f}%" if shots else "-"
-                
-            team_shots = [p for p in (points or []) if p.get("team") == team_key]
-            dom, weak = self._zone_strength(team_shots)
-
-            vars = self._team_vars[team_key]
-            vars["shots"].set(shots)
-            vars["made"].set(made)
-            vars["missed"].set(missed)
-            vars["accuracy_fg"].set(pct)
-            vars["avg_made_ft"].set(fmt_avg(s["made_dists"]))
-            vars["avg_missed_ft"].set(fmt_avg(s["miss_dists"]))
-            vars["dom_zone"].set(short_zone(dom))
-            vars["weak_zone"].set(short_zone(weak))
-
-        def _is_three_by_zone(z: str) -> bool:
-            z = (z or "").lower().strip()
-            return(
-                z.endswith("- 3") or
-                "3pt" in z or "3-pt" in z or "3 pointer" in z or "3-pointer" in z or
-                "corner 3" in z or "wing 3" in z or "top 3" in z or "above break 3" in z
-            )
-    
-        def _points_for(p: dict) -> int:
-            if not p.get("made"):
-                return 0
-            st = (p.get("shot_type") or "").strip().lower()
-            if st == "free throw" or p.get("ft_reason"):  
-                return 1
-            if _is_three_by_zone(p.get("zone")):
-                return 3
-            try:
-                if float(p.get("r_ft", 0)) >= 22.0:
-                    return 3
-            except Exception:
-                pass
-            return 2
-
-        home_pts = sum(_points_for(p) for p in (points or []) if p.get("team") == "home")
-        away_pts = sum(_points_for(p) for p in (points or []) if p.get("team") == "away")
+            for key, value in self._tally_values(stats.team(team_key)).items():
+                _set_if_changed(self._team_vars[team_key][key], value)
 
         if hasattr(self.controller, "home_score"):
-            try:
-                self.controller.home_score.set(int(home_pts))
-            except Exception:
-                self.controller.home_score.set(0)
+            _set_if_changed(self.controller.home_score, int(stats.team("home").points))
 
         if hasattr(self.controller, "away_score"):
-            try:
-                self.controller.away_score.set(int(away_pts))
-            except Exception:
-                self.controller.away_score.set(0)
+            _set_if_changed(self.controller.away_score, int(stats.team("away").points))
+
+    def _tally_values(self, t: ShotTally | None) -> dict:
+        if t is None:
+            return {
+                "shots": 0, "made": 0, "missed": 0, "accuracy_fg": "-",
+                "avg_made_ft": "-", "avg_missed_ft": "-", "dom_zone": "-", "weak_zone": "-",
+            }
+
+        def fmt_avg(v):
+            return f"{v:.1f} ft" if v is not None else "-"
+
+        dom, weak = self._zone_strength(t)
+        return {
+            "shots": t.att,
+            "made": t.made,
+            "missed": t.missed,
+            "accuracy_fg": f"{t.fg * 100:.1f}%" if t.fg is not None else "-",
+            "avg_made_ft": fmt_avg(t.avg_made_ft),
+            "avg_missed_ft": fmt_avg(t.avg_missed_ft),
+            "dom_zone": dom,
+            "weak_zone": weak,
+        }
 
     def _make_player_section(self, parent, row: int):
         box = ttk.LabelFrame(parent, text="", padding=8)
@@ -2334,37 +2570,15 @@ class DataBar(ttk.Frame):
         return box 
 
     def _points_for(self, p:dict) -> int:
-        if not p.get("made"):
-            return 0
-        
-        st = (p.get("shot_type") or "").strip().lower()
-        if st == "free throw": 
-            return 1
-        
-        z = (p.get("zone") or "").strip().lower()
-        if "3pt" in z or "three" in z or "3" in z: 
-            return 3
-        
-        return 2
-
-    def _zone_strength(self, shots: list[dict]) -> tuple[str, str]:
-        per = {}
-        for p in shots:
-            z = p.get("zone")
-            if not z:
-                continue
-            d = per.setdefault(z, {"made": 0, "att": 0})
-            d["att"] += 1
-            if p.get("made"):
-                d["made"] += 1
-        if not per:
-            return "-", "-"
+        return shot_points(p)
 
-        items = [(z, v["made"], v["att"]) for z, v in per.items() if v["att"] > 0]
-        if not items:
+    def _zone_strength(self, tally: ShotTally) -> tuple[str, str]:
+        dom, weak = tally.zone_strength()
+        if dom is None:
             return "-", "-"
 
-        dom = max(items, key=lambda t: (t[1], t[1] / t[2], t[2], t[0]))[0]   
-        weak = min(items, key=lambda t: (t[1], t[1] / t[2], -t[2], t[0]))[0]
+        def _short(key):
+            z = tally.zones[key][2]
+            return z.short if z is not None else short_label(key)
 
-        return dom, weak
\ No newline at end of file
+        return _short(dom), _short(weak)
\ No newline at end of file
@@ -1,14 +1,16 @@
 from pathlib import Path
 import sys
+import threading
 import tkinter as tk 
 from tkinter import ttk, font as tkfont
-from PIL import Image, ImageTk
 
 from src.config import ICON_PNG, ICON_ICO
+from src import asset_registry, image_pyramid
 from src.user_interface.court_canvas import StartScreen, CourtScreen
 from src.user_interface.court_frames import TopBar, SideBar, StatusBar, CourtFrame
 from src.user_interface.player_dialogs import confirm
 from src.user_interface.modals import game_metadata_dialog
+from src.application_logic import zoning_configuration, zone_registry, snap_map, distance_raster
 
 class DunkVisionApp(tk.Tk):
     def __init__(self):
@@ -33,7 +35,7 @@ class DunkVisionApp(tk.Tk):
                     pass
             if png.is_file():
                 try: 
-                    self._icon_refs["app_png"] = tk.PhotoImage(file=str(png))
+                    self._icon_refs["app_png"] = asset_registry.bind_photo(self, png)
                     self.wm_iconphoto(True, self._icon_refs["app_png"])
                 except tk.TclError:
                     pass
@@ -75,6 +77,19 @@ class DunkVisionApp(tk.Tk):
         self.center=StartScreen(self.root, controller=self)
         self.center.grid(row=1, column=1, sticky="nsew")
 
+        #Court mask + calibration load while the start screen is showing
+        threading.Thread(target=self._warm_court_data, name="dv-warm", daemon=True).start()
+
+    def _warm_court_data(self):
+        try:
+            zoning_configuration.warm()
+            zone_registry.get_registry()
+            snap_map.get_snap_map()
+            distance_raster.get_distance_raster()
+            image_pyramid.build_screen_pyramids()
+        except Exception as e:
+            print(f"[DunkVision] Background warm-up failed: {e}")
+
                               
     def set_app_icon(self):
         base = Path(__file__).resolve().parent.parent
@@ -84,7 +99,8 @@ class DunkVisionApp(tk.Tk):
         if sys.platform.startswith("win") and ico.exists(): 
             self.iconbitmap(str(ico))
         elif png.exists():
-            self.iconphoto(True, ImageTk.PhotoImage(Image.open(png)))
+            self._app_icon = asset_registry.bind_photo(self, png)
+            self.iconphoto(True, self._app_icon)
         
 
 
@@ -0,0 +1,103 @@
+from __future__ import annotations
+from PIL import Image, ImageDraw
+from src.application_logic.shot_index import ShotGrid
+from src.shot_chart import MARKER_RADIUS, paint_marker
+
+class MarkerLayer:
+    """All shot markers painted into one transparent RGBA image the size of the drawn court.
+
+    Markers are the CourtFrame marker dicts (ix, iy, made, team). Adding paints one marker, removing repaints only
+    the few markers around it, and a resize repaints everything in one pass instead of moving canvas items. Overlaps
+    always stack in the order markers were added.
+    """
+    def __init__(self, cell_px: int = 16):
+        self.markers = ShotGrid(cell_px, xy_keys=("ix", "iy"))
+        self._order: dict[int, int] = {} #id(marker) -> draw sequence
+        self._seq = 0
+        self.image: Image.Image | None = None
+        self._geometry: tuple[int, int, int, int] | None = None #draw_w, draw_h, src_w, src_h
+        self.viewport: tuple[int, int, int, int] = (0, 0, 0, 0) #x0, y0, x1, y1 within the drawn court
+
+    def __len__(self) -> int:
+        return len(self.markers)
+
+    def _to_layer(self, ix: float, iy: float) -> tuple[float, float]:
+        draw_w, draw_h, src_w, src_h = self._geometry
+        return (
+            (ix + 0.5) / max(1, src_w) * draw_w - self.viewport[0],
+            (iy + 0.5) / max(1, src_h) * draw_h - self.viewport[1],
+        )
+
+    def _visible_markers(self):
+        #Only markers whose footprint reaches the viewport are painted when zoomed in
+        draw_w, draw_h, src_w, src_h = self._geometry
+        x0, y0, x1, y1 = self.viewport
+        if (x0, y0, x1, y1) == (0, 0, draw_w, draw_h):
+            return iter(self.markers)
+        r = MARKER_RADIUS + 1
+        kx, ky = src_w / draw_w, src_h / draw_h
+        return iter(self.markers.in_rect((x0 - r) * kx, (y0 - r) * ky, (x1 + r) * kx, (y1 + r) * ky))
+
+    def _in_draw_order(self, markers) -> list[dict]:
+        return sorted(markers, key=lambda m: self._order[id(m)])
+
+    def _paint(self, draw: ImageDraw.ImageDraw, m: dict, dx: int = 0, dy: int = 0) -> None:
+        cx, cy = self._to_layer(m["ix"], m["iy"])
+        paint_marker(draw, cx - dx, cy - dy, made=bool(m.get("made")), team=m.get("team"))
+
+    def resize(self, draw_w: int, draw_h: int, src_w: int, src_h: int, viewport: tuple[int, int, int, int] | None = None) -> bool:
+        geometry = (max(1, draw_w), max(1, draw_h), src_w, src_h)
+        viewport = viewport or (0, 0, geometry[0], geometry[1])
+        if geometry == self._geometry and viewport == self.viewport and self.image is not None:
+            return False
+        self._geometry = geometry
+        self.viewport = viewport
+        self.redraw()
+        return True
+
+    def redraw(self) -> None:
+        if self._geometry is None:
+            return
+        x0, y0, x1, y1 = self.viewport
+        self.image = Image.new("RGBA", (max(1, x1 - x0), max(1, y1 - y0)), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(self.image)
+        for m in self._in_draw_order(self._visible_markers()):
+            self._paint(draw, m)
+
+    def add(self, m: dict) -> None:
+        if not self.markers.insert(m):
+            return
+        self._seq += 1
+        self._order[id(m)] = self._seq
+        if self.image is not None:
+            self._paint(ImageDraw.Draw(self.image), m)
+
+    def remove(self, m: dict) -> None:
+        if not self.markers.remove(m):
+            return
+        del self._order[id(m)]
+        if self.image is None:
+            return
+        r = MARKER_RADIUS + 1
+        cx, cy = self._to_layer(m["ix"], m["iy"])
+        box = (int(cx - r), int(cy - r), int(cx + r) + 2, int(cy + r) + 2)
+
+        #Repaint the neighbours reaching into the box on a clean tile, in draw order, then swap the tile in -
+        #pixels outside the box keep whatever was stacked on top of them
+        draw_w, draw_h, src_w, src_h = self._geometry
+        reach_x = (2 * r + 2) * src_w / draw_w
+        reach_y = (2 * r + 2) * src_h / draw_h
+        #The tile has a margin so neighbours are never clipped mid-shape (PIL rasterizes clipped ellipses differently)
+        pad = 2 * r
+        tile = Image.new("RGBA", (box[2] - box[0] + 2 * pad, box[3] - box[1] + 2 * pad), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(tile)
+        near = self.markers.in_rect(m["ix"] - reach_x, m["iy"] - reach_y, m["ix"] + reach_x, m["iy"] + reach_y)
+        for other in self._in_draw_order(near):
+            self._paint(draw, other, box[0] - pad, box[1] - pad)
+        self.image.paste(tile.crop((pad, pad, pad + box[2] - box[0], pad + box[3] - box[1])), box[:2])
+
+    def clear(self) -> None:
+        self.markers.clear()
+        self._order.clear()
+        if self.image is not None:
+            self.image.paste((0, 0, 0, 0), (0, 0, *self.image.size))
@@ -8,6 +8,7 @@ from datetime import date
 import calendar as _calendar
 
 from src.config import ICON_ICO, ICON_PNG
+from src import asset_registry
 from src.user_interface.player_dialogs import resolve, confirm, info, error
 
 def _apply_window_icons(win: tk.Toplevel)-> None:
@@ -20,8 +21,9 @@ def _apply_window_icons(win: tk.Toplevel)-> None:
             pass
     if png.is_file():
         try:
-            win._icon_ref = tk.PhotoImage(file=str(png))
-            win.iconphoto(True, win._icon_ref)
+            win._icon_ref = asset_registry.bind_photo(win, png)
+            if win._icon_ref is not None:
+                win.iconphoto(True, win._icon_ref)
         except tk.TclError:
             pass    
 
@@ -107,3 +107,733 @@ def test_detect_game_file(tmp_path):
     assert "does not exist" in result["reason"].lower()
 
     
+
+
+def test_resolve_zone():
+    from src.application_logic.zoning import resolve_zone
+    from src.application_logic.zoning_configuration import MASK
+    from src.application_logic.mask_manager import ZONE_TABLE
+
+    assert resolve_zone(690, 139) == ("zone", "Dunk Zone - 2")
+    assert resolve_zone(690, 400) == ("zone", "Nail - 2")
+    assert resolve_zone(100, 100) == ("no_click", "Left No Click - 0")
+    assert resolve_zone(-1, 0) == ("out_of_bounds", "Out of Bounds")
+    assert resolve_zone(MASK.width, 0) == ("out_of_bounds", "Out of Bounds")
+
+    assert len(MASK.grid) == MASK.width * MASK.height
+    assert MASK.get_zone_at(690, 139) == ZONE_TABLE[MASK.zone_id_at(690, 139)]
+
+
+def test_resolve_zones_matches_resolve_zone():
+    from src.application_logic.zoning import resolve_zone, resolve_zones
+    xs = [690, 690, 100, -1, 5000, 340]
+    ys = [139, 400, 100, 0, 1, 60]
+    ids, kinds, labels = resolve_zones(xs, ys)
+    assert len(ids) == len(xs)
+    assert list(zip(kinds, labels)) == [resolve_zone(x, y) for x, y in zip(xs, ys)]
+
+
+def test_mask_cache_round_trip(tmp_path):
+    from src.application_logic.mask_manager import MaskManager
+    from src.application_logic.zoning_configuration import MASK_PATH
+
+    png = tmp_path / "court_mask.png"
+    png.write_bytes(MASK_PATH.read_bytes())
+    cache_dir = tmp_path / "cache"
+
+    first = MaskManager(str(png), cache_dir=cache_dir)
+    second = MaskManager(str(png), cache_dir=cache_dir)
+    assert not first.from_cache and second.from_cache
+    assert bytes(second.grid) == bytes(first.grid)
+
+    png.write_bytes(MASK_PATH.read_bytes() + b"\x00")
+    rebuilt = MaskManager(str(png), cache_dir=cache_dir)
+    assert not rebuilt.from_cache
+
+
+def test_color_lut_snaps_near_ledger_colors():
+    from src.application_logic.mask_manager import build_color_lut, lut_index, ZONE_IDS, UNKNOWN_ZONE_ID
+    lut = build_color_lut(24.0)
+    assert lut[lut_index(245, 10, 11)] == ZONE_IDS[(255, 0, 0)]
+    assert lut[lut_index(185, 165, 254)] == ZONE_IDS[(185, 165, 255)]
+    assert lut[lut_index(0, 0, 0)] == UNKNOWN_ZONE_ID
+    assert set(build_color_lut(0)) == {UNKNOWN_ZONE_ID}
+
+
+def test_zone_registry():
+    from src.application_logic.zone_registry import get_registry
+    reg = get_registry()
+    corner = reg.by_name["Left Corner - 3"]
+    assert (corner.points, corner.side, corner.short) == (3, "left", "L Corner - 3")
+    assert reg.by_name["Right Outside Wing -3"].points == 3
+    assert reg.by_name["Free Throw Line - 2"].is_free_throw
+    assert reg.by_name["Dunk Zone - 2"].is_dunk
+    assert corner.area_sqft > 0 and corner.centroid is not None
+
+    assert reg.zone_for({"zone_id": corner.id, "zone": corner.name}) is corner
+    assert reg.zone_for({"zone": "Key - 2"}).name == "Key - 2"
+    assert reg.zone_for({"zone_id": corner.id, "zone": "Key - 2"}).name == "Key - 2"
+
+
+def test_distance_raster_matches_scalar():
+    import math
+    from src.application_logic.distance_raster import get_distance_raster
+    from src.application_logic.zoning_configuration import get_calibration, shot_distance_from_hoop
+    raster, cal = get_distance_raster(), get_calibration()
+    xs, ys = [0, 690, 1040, 1365, -1], [0, 139, 400, 767, 5]
+    out = raster.distances_at(xs, ys)
+    for x, y, r in zip(xs[:-1], ys[:-1], out):
+        assert math.isclose(r, cal.distance_from_hoop(x, y)[0], rel_tol=1e-6)
+        assert shot_distance_from_hoop(x, y) == raster.offsets_at(x, y)
+    assert math.isnan(out[-1])
+    assert shot_distance_from_hoop(-1, 5) == cal.distance_from_hoop(-1, 5)
+
+
+def test_calibration_batch_matches_scalar():
+    import math
+    from src.application_logic.zoning_configuration import get_calibration, is_in_court_bbox
+    cal = get_calibration()
+    xs, ys = [0, 340, 690, 1040, 1365], [0, 60, 139, 765, 767]
+    r, dx, dy = cal.distances_many(xs, ys)
+    for i, (x, y) in enumerate(zip(xs, ys)):
+        r0, dx0, dy0 = cal.distance_from_hoop(x, y)
+        assert math.isclose(r[i], r0) and math.isclose(dx[i], dx0, abs_tol=1e-9) and math.isclose(dy[i], dy0)
+    assert list(cal.in_bbox_many(xs, ys)) == [int(is_in_court_bbox(x, y)) for x, y in zip(xs, ys)]
+    assert cal.filter_in_bbox(xs, ys) == ([340, 690, 1040], [60, 139, 765])
+
+
+def test_shot_grid_queries():
+    from src.application_logic.shot_index import ShotGrid
+    from src.application_logic.zoning_configuration import get_calibration
+    shots = [{"x": x, "y": y} for x, y in [(10, 10), (12, 11), (100, 100), (400, 60), (-5, 3)]]
+    grid = ShotGrid(cell_px=16)
+    grid.rebuild(shots)
+    assert len(grid) == 5
+    assert grid.nearest(11, 11, 3) is shots[1]
+    assert grid.nearest(50, 50, 5) is None
+    assert set(map(id, grid.within(10, 10, 3))) == {id(shots[0]), id(shots[1])}
+    assert len(grid.in_rect(0, 0, 150, 150)) == 3
+    assert grid.in_polygon([(90, 90), (110, 90), (100, 120)]) == [shots[2]]
+    assert shots[3] in grid.within_feet(390, 60, 1.0, get_calibration())
+
+    assert grid.remove(shots[2]) and not grid.remove(shots[2])
+    assert shots[2] not in grid.in_rect(0, 0, 150, 150)
+    grid.insert(shots[2])
+    assert grid.nearest(101, 101, 2) is shots[2]
+
+
+def test_snap_map_snaps_line_clicks_to_play_zones():
+    from src.application_logic.snap_map import SnapMap, PLAY_ZONE_IDS
+    from src.application_logic.zoning_configuration import get_mask
+    from src.application_logic.zone_registry import get_registry
+    mask, reg = get_mask(), get_registry()
+    snap = SnapMap(mask, max_steps=20)
+    grid = bytes(mask.grid)
+    line = reg.by_name["Three Point Line - 3"].id
+    i = grid.index(bytes([line]))
+    ix, iy = i % mask.width, i // mask.width
+    zone_id, step = snap.snap_at(ix, iy)
+    assert zone_id in PLAY_ZONE_IDS and 1 <= step <= 20
+    assert snap.snap_at(ix, iy, max_steps=0) is None
+
+    play = grid.index(bytes([reg.by_name["Key - 2"].id]))
+    assert snap.snap_at(play % mask.width, play // mask.width) == (reg.by_name["Key - 2"].id, 0)
+
+
+def test_resize_cache_evicts_least_recently_used():
+    from PIL import Image
+    from src.user_interface.court_canvas import ResizeCache
+    cache = ResizeCache(max_bytes=3 * 10 * 10 * 4)
+    for key in ("court_dark", "court_light", "start"):
+        cache.put((key, 10, 10, "contain"), Image.new("RGBA", (10, 10)), None)
+    assert cache.get(("court_dark", 10, 10, "contain")) is not None
+    cache.put(("court_dark", 20, 5, "contain"), Image.new("RGBA", (10, 10)), None)
+    assert cache.get(("court_light", 10, 10, "contain")) is None
+    assert len(cache) == 3 and cache.size_bytes == cache.max_bytes
+
+    cache.discard("court_dark")
+    assert len(cache) == 1 and cache.get(("start", 10, 10, "contain")) is not None
+    cache.put(("huge", 1, 1, "cover"), Image.new("RGBA", (100, 100)), None)
+    assert len(cache) == 1
+
+
+def test_asset_registry_shares_decoded_images():
+    from src import asset_registry, config
+    full = asset_registry.get_image(config.ICON_PNG)
+    assert full is not None and full.mode == "RGBA"
+    assert asset_registry.get_image(str(config.ICON_PNG)) is full
+    icon = asset_registry.get_image(config.ICON_PNG, (24, 24))
+    assert icon.size == (24, 24) and asset_registry.get_image(config.ICON_PNG, (24, 24)) is icon
+    assert asset_registry.get_image(config.ICONS_DIR / "missing.png") is None
+
+
+def test_image_pyramid_levels(tmp_path):
+    from PIL import Image
+    from src import image_pyramid
+    src = tmp_path / "court.png"
+    Image.new("RGBA", (400, 200), (10, 20, 30, 255)).save(src)
+    paths = image_pyramid.build_pyramid(src, tmp_path / "levels", widths=(100, 200, 800))
+    assert [p.name for p in paths] == ["court_100x50.rgba", "court_200x100.rgba"]
+
+    levels = image_pyramid.load_levels(src, tmp_path / "levels", widths=(100, 200, 800))
+    assert [im.size for im in levels] == [(100, 50), (200, 100)]
+    assert levels[0].getpixel((5, 5)) == (10, 20, 30, 255)
+
+    full = Image.open(src)
+    assert image_pyramid.pick_level(full, levels, 150, 150).size == (200, 100)
+    assert image_pyramid.pick_level(full, levels, 90, 30).size == (100, 50)
+    assert image_pyramid.pick_level(full, levels, 90, 30, mode="cover").size == (100, 50)
+    assert image_pyramid.pick_level(full, levels, 1000, 500).size == (400, 200)
+
+
+def test_marker_layer_incremental_add_remove():
+    from src.user_interface.marker_layer import MarkerLayer
+    a = {"ix": 100, "iy": 100, "made": True, "team": "home"}
+    b = {"ix": 104, "iy": 100, "made": False, "team": "away"}
+    far = {"ix": 300, "iy": 20, "made": True, "team": "away"}
+
+    layer = MarkerLayer()
+    layer.resize(200, 100, 400, 200)
+    for m in (a, b, far):
+        layer.add(m)
+    assert len(layer) == 3
+    layer.remove(b)
+
+    expected = MarkerLayer()
+    expected.resize(200, 100, 400, 200)
+    for m in (a, far):
+        expected.add(m)
+    assert layer.image.tobytes() == expected.image.tobytes()
+
+    layer.resize(400, 200, 400, 200)
+    assert layer.image.size == (400, 200) and layer.image.getpixel((100, 100))[3] == 255
+
+
+def test_marker_layer_keeps_draw_order_after_remove_and_redraw():
+    from src.user_interface.marker_layer import MarkerLayer
+    gone = {"ix": 84, "iy": 100, "made": True, "team": "home"}
+    under = {"ix": 100, "iy": 100, "made": False, "team": "away"}
+    over = {"ix": 94, "iy": 100, "made": True, "team": "home"} #Shares gone's grid cell, drawn after under
+
+    layer = MarkerLayer()
+    layer.resize(200, 100, 400, 200)
+    for m in (gone, under, over):
+        layer.add(m)
+    layer.remove(gone)
+
+    expected = MarkerLayer()
+    expected.resize(200, 100, 400, 200)
+    for m in (under, over):
+        expected.add(m)
+    assert layer.image.tobytes() == expected.image.tobytes()
+
+    layer.resize(400, 200, 400, 200)
+    expected.resize(400, 200, 400, 200)
+    assert layer.image.tobytes() == expected.image.tobytes()
+
+
+def test_marker_layer_viewport_culls_and_offsets():
+    from src.user_interface.marker_layer import MarkerLayer
+    inside = {"ix": 100, "iy": 100, "made": True, "team": "home"}
+    outside = {"ix": 380, "iy": 180, "made": True, "team": "home"}
+    layer = MarkerLayer()
+    layer.add(inside)
+    layer.add(outside)
+    layer.resize(800, 400, 400, 200, viewport=(100, 100, 300, 300))
+    assert layer.image.size == (200, 200)
+    assert layer.image.getpixel((101, 101))[3] == 255
+    x0, y0, x1, y1 = layer.image.getbbox()
+    assert 95 <= x0 and 95 <= y0 and x1 <= 107 and y1 <= 107
+
+
+def test_heatmap_patches_only_the_touched_bin():
+    from src.application_logic.heatmap import ShotHeatmap
+    hm = ShotHeatmap(100, 50, cell_px=10)
+    hm.add_many([5, 6, 55], [5, 7, 25], [True, False, True], [2, 0, 3])
+    assert hm.stats(0) == (2, 0.5, 1.0)
+    before = hm.layer("fg").copy()
+
+    i = hm.add(15, 5, True, 3)
+    assert i == 1 and hm.stats(1) == (1, 1.0, 3.0)
+    after = hm.layer("fg")
+    changed = [(x, y) for y in range(hm.ny) for x in range(hm.nx) if before.getpixel((x, y)) != after.getpixel((x, y))]
+    assert changed == [(1, 0)]
+
+    hm.remove(15, 5, True, 3)
+    assert after.tobytes() == before.tobytes()
+    assert hm.add(150, 5, True, 2) is None
+
+    fresh = ShotHeatmap(100, 50, cell_px=10)
+    for x, y, m, p in [(5, 5, True, 2), (6, 7, False, 0), (55, 25, True, 3)]:
+        fresh.add(x, y, m, p)
+    assert fresh.layer("ppa").tobytes() == hm.layer("ppa").tobytes()
+
+
+def test_zone_choropleth_patches_match_fresh_render():
+    from src.application_logic.zone_overlay import ZoneChoropleth, get_zone_masks
+    from src.application_logic.zone_registry import get_registry
+    reg, masks = get_registry(), get_zone_masks()
+    corner, key = reg.by_name["Left Corner - 3"].id, reg.by_name["Key - 2"].id
+    assert corner in masks.masks and reg.by_name["Three Point Line - 3"].id not in masks.masks
+
+    chor = ZoneChoropleth(masks)
+    chor.set_counts({corner: (1, 4)})
+    size = (683, 384)
+    layer = chor.layer(size)
+    chor.adjust(key, True)
+    chor.adjust(corner, True)
+    chor.adjust(corner, False, sign=-1)
+
+    fresh = ZoneChoropleth(masks)
+    assert fresh.set_counts({corner: (2, 4), key: (1, 1)}) and chor.counts == fresh.counts
+    assert layer.tobytes() == fresh.layer(size).tobytes()
+
+
+def test_headless_shot_chart_renderer():
+    import subprocess, sys
+    from src.shot_chart import ChartOptions, render_shot_chart, render_png, filter_shots
+    game = {"ui": {"mode": "light"}, "shots": [
+        {"team": "home", "x": 100, "y": 100, "made": True, "quarter": "Q1", "player": "A"},
+        {"team": "away", "x": 600, "y": 300, "made": False, "quarter": "Q2", "player": "B"},
+        {"team": "home", "x": None, "y": 5, "made": True},
+    ]}
+    assert len(filter_shots(game["shots"], ChartOptions())) == 2
+    assert [p["player"] for p in filter_shots(game["shots"], ChartOptions(quarters=("Q2",)))] == ["B"]
+    assert filter_shots(game["shots"], ChartOptions(made=True, teams=("away",))) == []
+
+    img = render_shot_chart(game)
+    assert img.size == (1366, 768) and img.getpixel((100, 100))[:3] == (0x3F, 0x70, 0x4D)
+    small = render_shot_chart(game, ChartOptions(width=683, theme="dark"))
+    assert small.size == (683, 384)
+    assert render_png(game, ChartOptions(width=200)).startswith(b"\x89PNG")
+
+    code = "import sys, src.shot_chart; sys.exit('tkinter' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+def test_batch_render_skips_up_to_date_charts(tmp_path):
+    import os
+    from src.batch_render import main, find_games
+    saves, out = tmp_path / "saves", tmp_path / "charts"
+    saves.mkdir()
+    game = {
+        "schema": 1, "saved_at": 0, "meta": {"schema_name": "dv-game"}, "history": {},
+        "ui": {"mode": "dark", "quarter": "Q2"},
+        "teams": {"names": {"home": "Team A", "away": "Team B"}},
+        "shots": [
+            {"team": "home", "x": 100, "y": 100, "made": True, "quarter": "Q1", "player": "Ann Lee"},
+            {"team": "away", "x": 600, "y": 300, "made": False, "quarter": "Q2", "player": "Bo"},
+        ],
+    }
+    src = saves / "final.dvg.json"
+    src.write_text(json.dumps(game), encoding="utf-8")
+    (saves / "notes.json").write_text("{}", encoding="utf-8")
+    assert find_games(saves) == [src]
+
+    assert main([str(saves), "--out", str(out), "--workers", "1", "--width", "200"]) == 0
+    names = sorted(p.name for p in (out / "final").glob("*.png"))
+    assert names == ["game.png", "player_away_bo.png", "player_home_ann-lee.png", "quarter_q1.png", "quarter_q2.png"]
+
+    stamp = (out / "final" / "game.png").stat().st_mtime_ns
+    assert main([str(saves), "--out", str(out), "--workers", "1", "--width", "200"]) == 0
+    assert (out / "final" / "game.png").stat().st_mtime_ns == stamp
+
+    from PIL import Image
+    assert main([str(saves), "--out", str(out), "--workers", "1", "--width", "300"]) == 0
+    assert Image.open(out / "final" / "game.png").width == 300
+    dark = Image.open(out / "final" / "game.png").convert("RGB").tobytes()
+    assert main([str(saves), "--out", str(out), "--workers", "1", "--width", "300", "--theme", "light"]) == 0
+    assert Image.open(out / "final" / "game.png").convert("RGB").tobytes() != dark
+
+    stamp = (out / "final" / "game.png").stat().st_mtime_ns
+    os.utime(src, ns=(stamp + 10**9, stamp + 10**9))
+    assert main([str(saves), "--out", str(out), "--workers", "1", "--width", "300", "--theme", "light"]) == 0
+    assert (out / "final" / "game.png").stat().st_mtime_ns > stamp
+
+
+def test_batch_render_keeps_same_named_saves_and_players_apart(tmp_path):
+    from src.batch_render import main, chart_jobs
+    from src.shot_chart import ChartOptions
+    saves, out = tmp_path / "saves", tmp_path / "charts"
+    for folder, made in (("a", True), ("b", False)):
+        (saves / folder).mkdir(parents=True)
+        game = {
+            "schema": 1, "saved_at": 0, "meta": {"schema_name": "dv-game"}, "history": {}, "ui": {"mode": "dark"},
+            "shots": [
+                {"team": "home", "x": 100, "y": 100, "made": made, "player": "Ann Lee"},
+                {"team": "home", "x": 300, "y": 200, "made": True, "player": "Ann-Lee"},
+            ],
+        }
+        (saves / folder / "game.dvg.json").write_text(json.dumps(game), encoding="utf-8")
+
+    names = [name for name, _ in chart_jobs(game, ChartOptions())]
+    assert names == ["game.png", "player_home_ann-lee.png", "player_home_ann-lee-2.png"]
+
+    assert main([str(saves), "--out", str(out), "--workers", "2", "--width", "200", "--recursive"]) == 0
+    for folder in ("a", "b"):
+        charts = out / folder / "game"
+        assert sorted(p.name for p in charts.glob("*.png")) == sorted(names)
+        assert set(json.loads((charts / ".render_stamps.json").read_text(encoding="utf-8"))) == set(names)
+    assert (out / "a" / "game" / "game.png").read_bytes() != (out / "b" / "game" / "game.png").read_bytes()
+
+
+def test_stats_accumulator_tracks_changes_incrementally():
+    from src.application_logic.shot_stats import StatsAccumulator, shot_points
+    shots = [
+        {"team": "home", "player": "A", "made": True, "zone": "Left Corner - 3", "r_ft": 22.5},
+        {"team": "home", "player": "A", "made": False, "zone": "Key - 2", "r_ft": 6.0},
+        {"team": "home", "player": "B", "made": True, "zone": "Key - 2", "r_ft": 4.0},
+        {"team": "away", "player": "A", "made": True, "zone": "Free Throw Line - 2", "shot_type": "Free Throw", "r_ft": 15.0},
+    ]
+    assert [shot_points(p) for p in shots] == [3, 0, 2, 1]
+
+    stats = StatsAccumulator()
+    for p in shots:
+        stats.add(p)
+    home = stats.team("home")
+    assert (home.att, home.made, home.points, home.avg_made_ft) == (3, 2, 5, 13.25)
+    assert home.zone_strength() == ("Left Corner - 3", "Key - 2")
+    assert stats.player("away", "A").points == 1 and stats.player("home", "C").att == 0
+
+    stats.remove(shots[0])
+    stats.reassign(shots[2], "Unassigned")
+    shots[1]["player"] = "Unassigned"
+    stats.rename_player("home", "A", "Unassigned")
+    fresh = StatsAccumulator(shots[1:])
+    for mine, ref in ((stats.total, fresh.total), (stats.team("home"), fresh.team("home")), (stats.player("home", "Unassigned"), fresh.player("home", "Unassigned"))):
+        assert (mine.att, mine.made, mine.points, mine.avg_made_ft, mine.avg_missed_ft) == (ref.att, ref.made, ref.points, ref.avg_made_ft, ref.avg_missed_ft)
+        assert {k: v[:2] for k, v in mine.zones.items()} == {k: v[:2] for k, v in ref.zones.items()}
+
+
+def test_shot_store_rows_read_back_like_dicts():
+    from src.application_logic.shot_store import ShotStore
+    from session_data.game_io import _plain
+    shots = [
+        {"team": "home", "x": 10, "y": 20, "made": True, "quarter": "Q1", "player": "A", "zone_id": 3, "r_ft": 12.5},
+        {"team": "away", "x": None, "y": 3, "made": False, "r_ft": 7, "custom": {"k": [1, 2]}},
+        {"team": "home", "x": 30, "y": 40, "made": False, "player": "A", "miss_context": "Airball"},
+    ]
+    store = ShotStore(shots)
+    assert len(store) == 3 and [dict(p) for p in store] == shots and store[1] == shots[1]
+    assert store.column("x") == [10, None, 30] and store.column("player") == ["A", None, "A"]
+    assert store.codes("player")[0] == store.codes("player")[2] != 0
+
+    row = store[0]
+    assert row is store[0] and not hasattr(row, "__dict__")
+    row["player"] = "B"
+    row["zone_id"] = "odd"
+    assert row.get("player") == "B" and row["zone_id"] == "odd" and "airball" not in row
+
+    popped = store.pop(0)
+    assert popped is row and len(store) == 2 and store[0] == shots[1] and popped.get("player") == "B"
+    assert store.append(popped) is popped and store[2] is popped and store.column("x") == [None, 30, 10]
+    assert _plain({"shots": list(store)})["shots"][2]["zone_id"] == "odd"
+
+    store.clear()
+    assert len(store) == 0 and popped.get("r_ft") == 12.5
+
+
+def test_shot_store_pops_without_renumbering_and_feeds_columnar_stats():
+    from src.application_logic.shot_store import ShotStore, _sample_shots
+    from src.application_logic.shot_stats import StatsAccumulator
+    shots = _sample_shots(200)
+    store = ShotStore(shots)
+    rows = [store[i] for i in range(len(store))]
+
+    last = store.pop()
+    assert last is rows[-1] and len(store) == 199 and store[198] is rows[198]
+    mid = store.pop(5)
+    assert mid is rows[5] and len(store) == 198 and dict(mid) == shots[5]
+    assert store[5] is rows[6] and store[-1] is rows[198] and list(store) == rows[:5] + rows[6:199]
+    assert store.to_dicts() == shots[:5] + shots[6:199]
+
+    assert store.append(mid) is mid and store[-1] is mid and len(store) == 199
+    assert mid == shots[5] and list(store)[-2:] == [rows[198], mid]
+
+    by_rows = StatsAccumulator(list(store))
+    by_cols = StatsAccumulator(store)
+    assert by_cols.players.keys() == by_rows.players.keys()
+    pairs = [(by_cols.total, by_rows.total)] + [(by_cols.players[k], by_rows.players[k]) for k in by_rows.players]
+    for mine, ref in pairs:
+        assert (mine.att, mine.made, mine.points, mine.made_n, mine.miss_n) == (ref.att, ref.made, ref.points, ref.made_n, ref.miss_n)
+        assert abs(mine.made_ft - ref.made_ft) < 1e-6 and abs(mine.miss_ft - ref.miss_ft) < 1e-6
+        assert {k: v[:2] for k, v in mine.zones.items()} == {k: v[:2] for k, v in ref.zones.items()}
+
+
+def test_shot_record_interns_and_round_trips_through_game_io(tmp_path):
+    from src.application_logic.shot_store import Shot, ShotStore, measure_memory, _sample_shots
+    from session_data.game_io import _plain, read_game
+    shots = _sample_shots(50)
+    records = [Shot(s) for s in shots]
+    assert not hasattr(records[0], "__dict__") and records == shots
+    same = [r for r in records if r["zone"] == records[0]["zone"]]
+    assert all(r.get("zone") is same[0].get("zone") for r in same)
+
+    records[0]["note"] = "kept"
+    store = ShotStore(records)
+    path = tmp_path / "g.dvg.json"
+    path.write_text(json.dumps({"schema": 1, "meta": {"schema_name": "dv-game"}, "shots": _plain(list(store))}), encoding="utf-8")
+    loaded = read_game(path)["shots"]
+    assert loaded == [r.to_dict() for r in records] and list(loaded[0])[:3] == ["team", "x", "y"]
+
+    sizes = measure_memory(1000)
+    assert sizes["ShotStore"] < sizes["Shot"] < sizes["dict"]
+
+
+def test_set_if_changed_skips_redundant_tk_writes():
+    import tkinter as tk
+    from src.user_interface.court_frames import _set_if_changed
+    var = tk.IntVar(master=tk.Tcl(), value=0)
+    writes = []
+    var.trace_add("write", lambda *_: writes.append(var.get()))
+    assert not _set_if_changed(var, 0)
+    assert _set_if_changed(var, 3) and not _set_if_changed(var, 3)
+    assert writes == [3]
+
+
+def test_player_shot_index_follows_rename_and_removal():
+    from src.application_logic.shot_index import PlayerShotIndex
+    from src.application_logic.shot_store import ShotStore
+    store = ShotStore([
+        {"team": "home", "player": "A", "x": 1, "y": 1},
+        {"team": "away", "player": "A", "x": 2, "y": 2},
+        {"team": "home", "player": "B", "x": 3, "y": 3},
+        {"team": "home", "player": "A", "x": 4, "y": 4},
+    ])
+    index = PlayerShotIndex(store)
+    assert [p["x"] for p in index.shots("home", "A")] == [1, 4] and index.count("away", "A") == 1
+
+    moved = index.rename("home", "A", "Ann")
+    assert [p["player"] for p in store] == ["Ann", "A", "B", "Ann"] and moved == index.shots("home", "Ann")
+    assert index.shots("home", "A") == []
+
+    last = store.pop()
+    assert index.remove(last) and not index.remove(last) and last not in index
+    assert [p["x"] for p in index.shots("home", "Ann")] == [1]
+    index.add(store.append(last))
+    assert [p["x"] for p in index.shots("home", "Ann")] == [1, 4] and len(index) == 4
+
+
+class _RecordingCanvas:
+    """Stands in for the Tk canvas (no display here) and records the marker items drawn on it."""
+    def __init__(self):
+        self.items = {}
+        self._next = 0
+
+    def _create(self, kind, *coords, **kw):
+        self._next += 1
+        self.items[self._next] = (kind, coords)
+        return self._next
+
+    def create_oval(self, *coords, **kw):
+        return self._create("oval", *coords)
+
+    def create_rectangle(self, *coords, **kw):
+        return self._create("rectangle", *coords)
+
+    def coords(self, item, *coords):
+        kind, old = self.items[item]
+        if not coords:
+            return list(old)
+        self.items[item] = (kind, coords)
+
+    def delete(self, item):
+        if item == "shot_marker":
+            self.items.clear()
+        else:
+            self.items.pop(item, None)
+
+    def tag_raise(self, *_):
+        pass
+
+    def itemconfigure(self, *_, **__):
+        pass
+
+
+def _marker_host(canvas_to_image_scale=1.0):
+    import types
+    from src.user_interface.court_frames import CourtFrame
+    from src.user_interface.marker_layer import MarkerLayer
+    canvas = _RecordingCanvas()
+    center = types.SimpleNamespace(
+        canvas=canvas, _draw_info=(0, 0, 1366, 768, 1366, 768, 1.0), scale=canvas_to_image_scale,
+        viewport=lambda: (0, 0, 1366, 768),
+    )
+    center.image_to_canvas = lambda ix, iy: (ix * center.scale, iy * center.scale)
+    host = types.SimpleNamespace(
+        center_canvas=center, _shot_markers=[], _marker_seq=0, _marker_layer=MarkerLayer(),
+        _raster_markers=False, _marker_layer_item=None, _marker_layer_photo=None,
+    )
+    for name in ("_draw_marker", "_create_marker_item", "_in_viewport", "_delete_marker", "_clear_markers",
+                 "_sync_marker_renderer", "_reposition_markers"):
+        setattr(host, name, types.MethodType(getattr(CourtFrame, name), host))
+    host._show_marker_layer = lambda: None #Needs a PhotoImage, i.e. a display
+    return host, canvas
+
+
+def test_clearing_markers_after_raster_mode_returns_to_canvas_items(monkeypatch):
+    from src import config
+    monkeypatch.setattr(config, "RASTER_MARKER_THRESHOLD", 4)
+    host, canvas = _marker_host()
+    for i in range(5):
+        host._draw_marker(10 * i, 10, made=True, team="home")
+    assert host._raster_markers and not canvas.items and len(host._marker_layer) == 5
+
+    host._clear_markers()
+    assert not host._raster_markers and len(host._marker_layer) == 0
+    m = host._draw_marker(50, 50, made=False, team="away")
+    assert m["item"] in canvas.items and canvas.items[m["item"]][0] == "rectangle"
+
+
+class _SizedCanvas(_RecordingCanvas):
+    """Recording canvas with a size, a court image item and handlers for the virtual events ScreenImage fires."""
+    def __init__(self, width, height):
+        super().__init__()
+        self.size = (width, height)
+        self.handlers = {}
+
+    def winfo_width(self):
+        return self.size[0]
+
+    def winfo_height(self):
+        return self.size[1]
+
+    def create_image(self, *coords, **kw):
+        return self._create("image", *coords)
+
+    def event_generate(self, sequence, **kw):
+        self.handlers.get(sequence, lambda: None)()
+
+
+def _screen_host(canvas, resized, jobs):
+    #ScreenImage's render path bound onto a plain namespace - a real ttk.Frame needs a display
+    import types
+    from src.user_interface.court_canvas import ScreenImage
+    screen = types.SimpleNamespace(
+        canvas=canvas, images={}, sources={}, resized=resized,
+        _photo=None, _current_key=None, _last_size=canvas.size, _image_id=None, _final_job=None,
+        _view_sig=None, _draw_info=None, render_timing={"preview_ms": 0.0, "final_ms": 0.0}, zoom=1.0, view_center=(0.5, 0.5),
+        after=lambda ms, fn: jobs.setdefault(f"job{len(jobs)}", fn), after_cancel=jobs.pop,
+    )
+    for name in ("load_image", "_on_canvas_configure", "_render_progressive", "_render_final", "_render", "_fit_image",
+                 "_render_zoomed", "_place", "viewport", "image_to_canvas"):
+        setattr(screen, name, types.MethodType(getattr(ScreenImage, name), screen))
+    return screen
+
+
+def test_one_resize_repositions_markers_once(monkeypatch):
+    import types
+    from PIL import Image
+    from src.user_interface import court_canvas
+    from src.user_interface.court_canvas import ResizeCache
+    from src.user_interface.court_frames import CourtFrame, MARKER_RADIUS
+    monkeypatch.setattr(court_canvas.ImageTk, "PhotoImage", lambda img: img) #No display for real PhotoImages
+    host, _ = _marker_host()
+    canvas = _SizedCanvas(1366, 768)
+    jobs = {}
+    screen = _screen_host(canvas, ResizeCache(1 << 24), jobs)
+    screen.images["court_dark"] = Image.new("RGB", (1366, 768))
+    screen._current_key = "court_dark"
+    host.center_canvas, host.overlay_mode = screen, None
+    repositions = []
+    canvas.handlers["<<ViewChanged>>"] = lambda: (repositions.append(screen._draw_info), host._reposition_markers())
+    status = []
+    host.set_status = status.append
+    host._show_render_timing = types.MethodType(CourtFrame._show_render_timing, host)
+    canvas.handlers["<<RenderTimed>>"] = host._show_render_timing
+
+    screen._render()
+    m = host._draw_marker(1000, 600, made=True, team="home")
+    repositions.clear()
+
+    canvas.size = (683, 384)
+    screen._on_canvas_configure(types.SimpleNamespace(width=683, height=384))
+    for job in list(jobs.values()):
+        job()
+    assert len(repositions) == 1 and repositions[0][2:4] == (683, 384)
+    t = screen.render_timing
+    assert t["preview_ms"] > 0 and t["final_ms"] > 0
+    assert status == [f"Court render: preview {t['preview_ms']:.0f} ms, final {t['final_ms']:.0f} ms"]
+
+    x0, y0, x1, y1 = canvas.items[m["item"]][1]
+    cx, cy = screen.image_to_canvas(1000, 600)
+    assert (x0 + MARKER_RADIUS, y0 + MARKER_RADIUS) == (cx, cy) and cx < 683 and cy < 384
+
+
+def test_second_screen_image_reuses_fitted_court(monkeypatch):
+    from PIL import Image
+    from src.user_interface import court_canvas
+    from src.user_interface.court_canvas import ResizeCache
+    monkeypatch.setattr(court_canvas.ImageTk, "PhotoImage", lambda img: img)
+    shared = ResizeCache(1 << 26)
+    first = _screen_host(_SizedCanvas(900, 500), shared, {})
+    first.load_image("court_dark", "court_dark_mode.png")
+    first._current_key = "court_dark"
+    first._render()
+    assert len(shared) == 1 and shared.misses == 1
+
+    second = _screen_host(_SizedCanvas(900, 500), shared, {})
+    second.load_image("court_dark", "court_dark_mode.png")
+    second._current_key = "court_dark"
+    second._render()
+    assert len(shared) == 1 and shared.hits == 1 and second._photo is first._photo
+
+    second.images["court_dark"] = Image.new("RGB", (10, 10))
+    shared.track("court_dark", second.images["court_dark"])
+    assert len(shared) == 0
+
+
+def test_deleting_a_shot_under_the_cursor_is_undoable(monkeypatch):
+    import types
+    from src.user_interface import court_frames
+    from src.user_interface.court_frames import CourtFrame
+    from src.application_logic.shot_index import ShotGrid, PlayerShotIndex
+    from src.application_logic.shot_stats import StatsAccumulator
+    from src.application_logic.shot_store import ShotStore
+    monkeypatch.setattr(court_frames, "confirm_action", lambda *a, **k: True)
+    host, canvas = _marker_host()
+    host.center_canvas.canvas.tag_raise = lambda *_: None
+    status = []
+    host.__dict__.update(
+        data_points=ShotStore(), shot_index=ShotGrid(), player_shots=PlayerShotIndex(), stats=StatsAccumulator(),
+        actions=[], redo_stack=[], _overlay_update=lambda p, sign: None, refresh_stats=lambda: None,
+        set_status=status.append,
+    )
+    for name in ("_remove_shot", "_restore_shot", "_marker_for", "delete_shot", "undo_action", "redo_action", "_action_label"):
+        setattr(host, name, types.MethodType(getattr(CourtFrame, name), host))
+    for x, made in ((100, True), (300, False)):
+        shot = host.data_points.append({"team": "home", "x": x, "y": 50, "made": made, "player": "A"})
+        host.shot_index.insert(shot)
+        host.player_shots.add(shot)
+        host.stats.add(shot)
+        host._draw_marker(x, 50, made=made, team="home")
+
+    target = host.shot_index.nearest(298, 52, 6)
+    host.delete_shot(target)
+    assert len(host.data_points) == 1 and host.shot_index.nearest(298, 52, 6) is None
+    assert len(canvas.items) == 1 and host.stats.player("home", "A").att == 1 and host.actions[-1]["type"] == "delete_shot"
+
+    host.undo_action()
+    assert host.data_points[-1] is target and host.shot_index.nearest(298, 52, 6) is target
+    assert len(canvas.items) == 2 and host.stats.player("home", "A").att == 2
+    host.redo_action()
+    assert len(host.data_points) == 1 and len(canvas.items) == 1 and status[-1] == "Redid: Delete Shot"
+
+
+def test_zone_choropleth_patch_keeps_boundary_pixels_at_odd_sizes():
+    from PIL import Image
+    from src.application_logic.zone_overlay import ZoneChoropleth, get_zone_masks
+    masks = get_zone_masks()
+    size = (1000, 563)
+    chor = ZoneChoropleth(masks)
+    chor.set_counts({z: (1, 3) for z in masks.zone_ids})
+    layer = chor.layer(size)
+    for zone_id in masks.zone_ids:
+        chor.adjust(zone_id, True)
+    fresh = ZoneChoropleth(masks)
+    fresh.set_counts(dict(chor.counts))
+    assert layer.tobytes() == fresh.layer(size).tobytes()
+
+    boxes = masks.at_size(size)
+    covered = sum(m.histogram()[255] for _, m in boxes.values())
+    grid = masks.grid.resize(size, Image.NEAREST)
+    assert covered == sum(grid.histogram()[z] for z in masks.zone_ids) #No pixel claimed by two zones